@@ -17,6 +17,7 @@ limitations under the License.
 from langtrace_python_sdk import langtrace
 from langtrace_python_sdk.extensions.langtrace_filesystem import LangTraceFileSystem
 from langtrace_python_sdk.utils.prompt_registry import get_prompt_from_registry
+from langtrace_python_sdk.utils.provider_registry import register_provider
 from langtrace_python_sdk.utils.with_root_span import (
     SendUserFeedback,
     inject_additional_attributes,
@@ -30,6 +31,7 @@ __all__ = [
     "with_additional_attributes",
     "inject_additional_attributes",
     "get_prompt_from_registry",
+    "register_provider",
     "SendUserFeedback",
     "LangTraceFileSystem",
 ]
@@ -1,2 +1,11 @@
 LANGTRACE_REMOTE_URL = "https://app.langtrace.ai"
 LANGTRACE_SESSION_ID_HEADER = "x-langtrace-session-id"
+
+# Deduplicated span content is replaced by a reference to an entry of a
+# content dictionary event
+LANGTRACE_CONTENT_REF_PREFIX = "langtrace.ref:"
+LANGTRACE_CONTENT_DICTIONARY_EVENT = "langtrace.content_dictionary"
+
+# In the template prompt capture mode, a message rendered from a registry
+# prompt is replaced by a reference to the template and version
+LANGTRACE_PROMPT_TEMPLATE_REF_PREFIX = "langtrace.template:"
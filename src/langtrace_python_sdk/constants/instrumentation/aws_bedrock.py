@@ -14,3 +14,6 @@ APIS = {
         "ENDPOINT": "/converse-stream",
     },
 }
+
+# Bedrock reports the token usage of every invocation in the response headers
+EMBEDDING_INPUT_TOKEN_COUNT_HEADER = "x-amzn-bedrock-input-token-count"
@@ -4,10 +4,27 @@ TIKTOKEN_MODEL_MAPPING = {
     "gpt-4-0125-preview": "cl100k_base",
     "gpt-4-1106-preview": "cl100k_base",
     "gpt-4-1106-vision-preview": "cl100k_base",
-    "gpt-4o": "0200k_base",
-    "gpt-4o-mini": "0200k_base",
+    "gpt-4o": "o200k_base",
+    "gpt-4o-mini": "o200k_base",
 }
 
+# Model families resolved by prefix, most specific first
+TIKTOKEN_MODEL_PREFIXES = (
+    ("gpt-4o", "o200k_base"),
+    ("chatgpt-4o", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4.5", "o200k_base"),
+    ("gpt-5", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-4", "cl100k_base"),
+    ("gpt-3.5", "cl100k_base"),
+    ("gpt-35", "cl100k_base"),
+    ("text-embedding-3", "cl100k_base"),
+    ("text-embedding-ada-002", "cl100k_base"),
+)
+
 SERVICE_PROVIDERS = {
     "ANTHROPIC": "Anthropic",
     "ARCH": "Arch",
@@ -47,3 +64,17 @@ SERVICE_PROVIDERS = {
 }
 
 LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY = "langtrace_additional_attributes"
+
+# Streaming latency attributes, durations are in milliseconds
+STREAM_SPAN_ATTRIBUTES = {
+    "TIME_TO_FIRST_TOKEN": "llm.stream.time_to_first_token_ms",
+    "DURATION": "llm.stream.duration_ms",
+    "CHUNKS": "llm.stream.chunks",
+    "STATUS": "llm.stream.status",
+    "TOKENS_PER_SECOND": "llm.stream.tokens_per_second",
+    "INTER_CHUNK_LATENCY_MEAN": "llm.stream.inter_chunk_latency_ms.mean",
+    "INTER_CHUNK_LATENCY_MAX": "llm.stream.inter_chunk_latency_ms.max",
+    "INTER_CHUNK_LATENCY_P50": "llm.stream.inter_chunk_latency_ms.p50",
+    "INTER_CHUNK_LATENCY_P90": "llm.stream.inter_chunk_latency_ms.p90",
+    "INTER_CHUNK_LATENCY_P99": "llm.stream.inter_chunk_latency_ms.p99",
+}
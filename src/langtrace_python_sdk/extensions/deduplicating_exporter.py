@@ -0,0 +1,159 @@
+import hashlib
+import json
+import threading
+import typing
+from collections import OrderedDict
+
+from langtrace.trace_attributes import SpanAttributes
+from opentelemetry.sdk.trace import Event
+from opentelemetry.sdk.trace.export import ReadableSpan, SpanExporter, SpanExportResult
+
+from langtrace_python_sdk.constants.exporter.langtrace_exporter import (
+    LANGTRACE_CONTENT_DICTIONARY_EVENT,
+    LANGTRACE_CONTENT_REF_PREFIX,
+)
+
+DEDUPLICATION_SCOPES = ("batch", "process")
+
+# Conversations are deduplicated per message, as the whole conversation grows
+# on every turn while the system prompt and earlier messages repeat
+SEGMENTED_ATTRIBUTES = frozenset(
+    (SpanAttributes.LLM_PROMPTS, SpanAttributes.LLM_COMPLETIONS)
+)
+
+
+class DeduplicatingSpanExporter(SpanExporter):
+    """
+    Wraps a span exporter and replaces string values of at least `min_chars`
+    characters, such as system prompts and tool schemas resent on every agent
+    turn, with a `langtrace.ref:<hash>` reference. The referenced contents are exported
+    once in a `langtrace.content_dictionary` event on the first span of the
+    batch.
+
+    With the `batch` scope every batch carries the contents it references.
+    With the `process` scope contents already exported successfully are not
+    sent again, so the collector must keep the dictionary across batches.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        scope: str = "batch",
+        min_chars: int = 2048,
+        max_entries: int = 4096,
+    ) -> None:
+        if scope not in DEDUPLICATION_SCOPES:
+            raise ValueError(
+                f"scope must be one of {', '.join(DEDUPLICATION_SCOPES)}, got {scope}"
+            )
+        self.exporter = exporter
+        self.scope = scope
+        self.min_chars = min_chars
+        self.max_entries = max_entries
+        self._exported = OrderedDict()
+        self._lock = threading.Lock()
+
+    def export(self, spans: typing.Sequence[ReadableSpan]) -> SpanExportResult:
+        contents = {}
+        deduplicated = [self._deduplicate_span(span, contents) for span in spans]
+
+        if self.scope == "process":
+            with self._lock:
+                for digest in list(contents):
+                    if digest in self._exported:
+                        self._exported.move_to_end(digest)
+                        del contents[digest]
+
+        if contents and deduplicated:
+            deduplicated[0] = _add_dictionary_event(deduplicated[0], contents)
+
+        result = self.exporter.export(deduplicated)
+        if result == SpanExportResult.SUCCESS and self.scope == "process":
+            with self._lock:
+                for digest in contents:
+                    self._exported[digest] = None
+                while len(self._exported) > self.max_entries:
+                    self._exported.popitem(last=False)
+        return result
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.exporter.force_flush(timeout_millis)
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+    def _deduplicate_span(self, span: ReadableSpan, contents) -> ReadableSpan:
+        attributes = self._deduplicate_attributes(span.attributes, contents)
+        events = []
+        events_changed = False
+        for event in span.events:
+            event_attributes = self._deduplicate_attributes(event.attributes, contents)
+            if event_attributes is not event.attributes:
+                event = Event(event.name, event_attributes, event.timestamp)
+                events_changed = True
+            events.append(event)
+
+        if attributes is span.attributes and not events_changed:
+            return span
+        return _copy_span(span, attributes=attributes, events=events)
+
+    def _deduplicate_attributes(self, attributes, contents):
+        if not attributes:
+            return attributes
+        replaced = None
+        for name, value in attributes.items():
+            if not isinstance(value, str) or len(value) < self.min_chars:
+                continue
+            if replaced is None:
+                replaced = dict(attributes)
+            replaced[name] = self._deduplicate_value(name, value, contents)
+        return attributes if replaced is None else replaced
+
+    def _deduplicate_value(self, name, value, contents):
+        if name in SEGMENTED_ATTRIBUTES and value.startswith("["):
+            try:
+                messages = json.loads(value)
+            except ValueError:
+                messages = None
+            if isinstance(messages, list):
+                segmented = False
+                for message in messages:
+                    if not isinstance(message, dict):
+                        continue
+                    content = message.get("content")
+                    if isinstance(content, str) and len(content) >= self.min_chars:
+                        message["content"] = _reference(content, contents)
+                        segmented = True
+                if segmented:
+                    return json.dumps(messages)
+
+        return _reference(value, contents)
+
+
+def _reference(value: str, contents) -> str:
+    digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16)
+    key = digest.hexdigest()
+    contents[key] = value
+    return LANGTRACE_CONTENT_REF_PREFIX + key
+
+
+def _add_dictionary_event(span: ReadableSpan, contents) -> ReadableSpan:
+    event = Event(LANGTRACE_CONTENT_DICTIONARY_EVENT, contents, span.start_time)
+    return _copy_span(span, events=[*span.events, event])
+
+
+def _copy_span(span: ReadableSpan, attributes=None, events=None) -> ReadableSpan:
+    return ReadableSpan(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes if attributes is None else attributes,
+        events=span.events if events is None else events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
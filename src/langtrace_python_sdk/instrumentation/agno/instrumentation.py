@@ -20,7 +20,7 @@ from importlib_metadata import version as v
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
-
+from langtrace_python_sdk.utils import unwrap_method
 from .patch import patch_agent, patch_memory, patch_team
 
 
@@ -101,4 +101,15 @@ class AgnoInstrumentation(BaseInstrumentor):
             pass
 
     def _uninstrument(self, **kwargs):
-        pass
\ No newline at end of file
+        unwrap_method("agno.agent.agent", "Agent.run")
+        unwrap_method("agno.agent.agent", "Agent.arun")
+        unwrap_method("agno.agent.agent", "Agent._run")
+        unwrap_method("agno.agent.agent", "Agent._arun")
+        unwrap_method("agno.memory.agent", "AgentMemory.update_memory")
+        unwrap_method("agno.memory.agent", "AgentMemory.aupdate_memory")
+        unwrap_method("agno.memory.agent", "AgentMemory.update_summary")
+        unwrap_method("agno.memory.agent", "AgentMemory.aupdate_summary")
+        unwrap_method("agno.team.team", "Team.run")
+        unwrap_method("agno.team.team", "Team.arun")
+        unwrap_method("agno.team.team", "Team._run")
+        unwrap_method("agno.team.team", "Team._arun")
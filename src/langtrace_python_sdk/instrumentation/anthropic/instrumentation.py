@@ -22,6 +22,8 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import TracerProvider
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
+
+from langtrace_python_sdk.utils import unwrap_method
 from typing import Any
 from langtrace_python_sdk.instrumentation.anthropic.patch import messages_create, messages_stream
 
@@ -57,4 +59,5 @@ class AnthropicInstrumentation(BaseInstrumentor):  # type: ignore[misc]
         pass
 
     def _uninstrument(self, **kwargs: dict[str, Any]) -> None:
-        pass
+        unwrap_method("anthropic.resources.messages", "Messages.create")
+        unwrap_method("anthropic.resources.messages", "Messages.stream")
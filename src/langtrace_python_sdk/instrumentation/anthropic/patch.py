@@ -19,6 +19,7 @@ from langtrace.trace_attributes import SpanAttributes, LLMSpanAttributes
 import json
 
 from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
     StreamWrapper,
     get_extra_attributes,
     get_langtrace_attributes,
@@ -30,6 +31,8 @@ from langtrace_python_sdk.utils.llm import (
     set_usage_attributes,
     set_span_attribute,
 )
+from langtrace_python_sdk.utils.stream_processors import AnthropicChunkProcessor
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
 from opentelemetry.trace import Span, Tracer, SpanKind
 from opentelemetry.trace.status import StatusCode
 from langtrace_python_sdk.constants.instrumentation.anthropic import APIS
@@ -132,7 +135,12 @@ def messages_create(version: str, tracer: Tracer) -> Callable[..., Any]:
             span.end()
             return result
         else:
-            return StreamWrapper(result, span, tool_calls=True)
+            return StreamWrapper(
+                result,
+                span,
+                tool_calls=True,
+                chunk_processor=AnthropicChunkProcessor(),
+            )
 
     # return the wrapped method
     return traced_method
@@ -194,6 +202,12 @@ def messages_stream(version: str, tracer: Tracer) -> Callable[..., Any]:
                             self.original_stream = original_stream
                             self.span = span
                             self.message_stop_processed = False
+                            self.stream_timer = StreamTimer(span)
+                            # Only feeds the chunk events, the completion is
+                            # read from the final message
+                            self.accumulator = CompletionAccumulator(
+                                count_tokens=False, span=span
+                            )
                         
                         def __iter__(self):
                             return self
@@ -201,7 +215,13 @@ def messages_stream(version: str, tracer: Tracer) -> Callable[..., Any]:
                         def __next__(self):
                             try:
                                 chunk = next(self.original_stream)
-                                
+                                self.stream_timer.record_chunk()
+                                if (
+                                    chunk.type == "content_block_delta"
+                                    and getattr(chunk.delta, "type", None) == "text_delta"
+                                ):
+                                    self.accumulator.append(chunk.delta.text)
+
                                 # Apply instrumentation only once on message_stop
                                 if chunk.type == "message_stop" and not self.message_stop_processed:
                                     self.message_stop_processed = True
@@ -219,6 +239,7 @@ def messages_stream(version: str, tracer: Tracer) -> Callable[..., Any]:
                                         for message in response_message.content if message.type == "text"
                                     ]
                                     
+                                    self.accumulator.flush_chunk_events()
                                     set_event_completion(self.span, responses)
                                     
                                     if hasattr(response_message, "usage") and response_message.usage is not None:
@@ -237,11 +258,14 @@ def messages_stream(version: str, tracer: Tracer) -> Callable[..., Any]:
                                             SpanAttributes.LLM_USAGE_TOTAL_TOKENS,
                                             response_message.usage.input_tokens + response_message.usage.output_tokens,
                                         )
+                                    self.stream_timer.finish(self.span)
                                 
                                 # Forward the chunk
                                 return chunk
                             except StopIteration:
                                 # End the span when we're done with the stream
+                                self.accumulator.flush_chunk_events()
+                                self.stream_timer.finish(self.span)
                                 self.span.end()
                                 raise
                             except Exception as err:
@@ -1,6 +1,8 @@
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from importlib_metadata import version as v
 from .patch import patch_generate_reply, patch_initiate_chat
 
@@ -33,4 +35,5 @@ class AutogenInstrumentation(BaseInstrumentor):
             pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("autogen.agentchat.conversable_agent", "ConversableAgent.initiate_chat")
+        unwrap_method("autogen.agentchat.conversable_agent", "ConversableAgent.generate_reply")
@@ -14,20 +14,20 @@ from langtrace.trace_attributes import SpanAttributes
 from opentelemetry.trace import Tracer, SpanKind
 
 from langtrace_python_sdk.utils import deduce_args_and_kwargs, set_span_attribute
-import json
+from langtrace_python_sdk.utils.serialize import to_json
 
 
 def patch_initiate_chat(name, version, tracer: Tracer):
     def traced_method(wrapped, instance, args, kwargs):
         all_params = deduce_args_and_kwargs(wrapped, *args, **kwargs)
-        all_params["recipient"] = json.dumps(parse_agent(all_params.get("recipient")))
+        all_params["recipient"] = to_json(parse_agent(all_params.get("recipient")))
         span_attributes = {
             **get_langtrace_attributes(
                 service_provider=SERVICE_PROVIDERS["AUTOGEN"],
                 version=version,
                 vendor_type="framework",
             ),
-            "sender": json.dumps(parse_agent(instance)),
+            "sender": to_json(parse_agent(instance)),
             **all_params,
         }
         attributes = FrameworkSpanAttributes(**span_attributes)
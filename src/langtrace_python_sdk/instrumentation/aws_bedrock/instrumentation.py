@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.aws_bedrock.patch import patch_aws_bedrock
 
 logging.basicConfig(level=logging.FATAL)
@@ -49,4 +50,5 @@ class AWSBedrockInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("boto3", "client")
+        unwrap_method("boto3.session", "Session.client")
@@ -15,6 +15,7 @@ limitations under the License.
 """
 
 import json
+import weakref
 
 from wrapt import ObjectProxy
 from .stream_body_wrapper import BufferedStreamBody
@@ -31,9 +32,15 @@ from opentelemetry.trace.status import Status, StatusCode
 from opentelemetry.trace.propagation import set_span_in_context
 from langtrace_python_sdk.constants.instrumentation.common import (
     SERVICE_PROVIDERS,
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.constants.instrumentation.aws_bedrock import (
+    APIS,
+    EMBEDDING_INPUT_TOKEN_COUNT_HEADER,
 )
-from langtrace_python_sdk.constants.instrumentation.aws_bedrock import APIS
 from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
+    end_abandoned_stream_span,
     get_extra_attributes,
     get_langtrace_attributes,
     get_llm_request_attributes,
@@ -43,6 +50,7 @@ from langtrace_python_sdk.utils.llm import (
     set_span_attributes,
     set_usage_attributes,
 )
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
 
 
 def converse_stream(original_method, version, tracer):
@@ -119,17 +127,26 @@ def patch_converse_stream(original_method, tracer, version):
             **get_llm_url(args[0] if args else None),
             **get_extra_attributes(),
         }
-        with tracer.start_as_current_span(
+        # The span outlives this call and is ended by the stream wrapper
+        span = tracer.start_span(
             name=get_span_name("aws_bedrock.converse"),
             kind=SpanKind.CLIENT,
             context=set_span_in_context(trace.get_current_span()),
-        ) as span:
-            set_span_attributes(span, span_attributes)
+        )
+        set_span_attributes(span, span_attributes)
+        try:
             response = original_method(*args, **kwargs)
-
-            if span.is_recording():
-                set_span_streaming_response(span, response)
-            return response
+        except Exception as err:
+            span.record_exception(err)
+            span.set_status(Status(StatusCode.ERROR, str(err)))
+            span.end()
+            raise err
+
+        if span.is_recording() and "stream" in response:
+            response["stream"] = ConverseStreamWrapper(response["stream"], span)
+        else:
+            span.end()
+        return response
 
     return traced_method
 
@@ -213,6 +230,7 @@ def patch_invoke_model_with_response_stream(original_method, tracer, version):
 
 
 def handle_streaming_call(span, kwargs, response):
+    stream_timer = StreamTimer(span)
 
     def stream_finished(response_body):
         request_body = json.loads(kwargs.get("body"))
@@ -234,23 +252,33 @@ def handle_streaming_call(span, kwargs, response):
         if vendor == "meta":
             set_llama_meta_attributes(span, request_body, response_body)
 
+        stream_timer.finish(span)
         span.end()
 
-    response["body"] = StreamingBedrockWrapper(response["body"], stream_finished)
+    response["body"] = StreamingBedrockWrapper(
+        response["body"], stream_finished, stream_timer=stream_timer
+    )
 
 
 def handle_call(span, kwargs, response):
     modelId = kwargs.get("modelId")
     (vendor, model_name) = modelId.split(".")
-    response["body"] = BufferedStreamBody(
-        response["body"]._raw_stream, response["body"]._content_length
-    )
     request_body = json.loads(kwargs.get("body"))
-    response_body = json.loads(response.get("body").read())
 
     set_span_attribute(span, SpanAttributes.LLM_RESPONSE_MODEL, modelId)
     set_span_attribute(span, SpanAttributes.LLM_REQUEST_MODEL, modelId)
 
+    if is_embedding_model(model_name):
+        # Embedding bodies are mostly floats, the token count is in the headers
+        # so the body is left untouched for the caller
+        set_embedding_attributes(span, request_body, response)
+        return
+
+    response["body"] = BufferedStreamBody(
+        response["body"]._raw_stream, response["body"]._content_length
+    )
+    response_body = response["body"].json()
+
     if vendor == "amazon":
         set_amazon_attributes(span, request_body, response_body)
 
@@ -264,6 +292,21 @@ def handle_call(span, kwargs, response):
         set_llama_meta_attributes(span, request_body, response_body)
 
 
+def is_embedding_model(model_name):
+    return "embed" in model_name
+
+
+def set_embedding_attributes(span, request_body, response):
+    inputs = request_body.get("texts") or [request_body.get("inputText")]
+    set_span_attribute(
+        span, SpanAttributes.LLM_REQUEST_EMBEDDING_INPUTS, json.dumps(inputs)
+    )
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    input_tokens = headers.get(EMBEDDING_INPUT_TOKEN_COUNT_HEADER)
+    if input_tokens is not None:
+        set_usage_attributes(span, {"input_tokens": input_tokens})
+
+
 def set_llama_meta_attributes(span, request_body, response_body):
     set_span_attribute(
         span, SpanAttributes.LLM_REQUEST_TOP_P, request_body.get("top_p")
@@ -442,30 +485,99 @@ def _set_response_attributes(span, kwargs, result):
         )
 
 
-def set_span_streaming_response(span, response):
-    streaming_response = ""
-    role = None
-    for event in response["stream"]:
-        if "messageStart" in event:
-            role = event["messageStart"]["role"]
-        elif "contentBlockDelta" in event:
+class ConverseStreamWrapper(ObjectProxy):
+    """
+    Passes converse_stream events through to the caller, recording the text
+    deltas, role and usage as they flow and ending the span once the stream is
+    exhausted, closed, left early or garbage collected.
+    """
+
+    def __init__(self, stream, span):
+        super().__init__(stream)
+        self._self_span = span
+        self._self_role = None
+        # Usage arrives in the metadata event, so tokens are not counted
+        self._self_accumulator = CompletionAccumulator(count_tokens=False, span=span)
+        self._self_stream_timer = StreamTimer(span)
+        self._self_finished = False
+        # Ends the span if the stream is dropped before it is exhausted or closed
+        self._self_finalizer = weakref.finalize(self, end_abandoned_stream_span, span)
+
+    def __iter__(self):
+        status = Status(StatusCode.OK)
+        abandoned = False
+        try:
+            for event in self.__wrapped__:
+                self._self_stream_timer.record_chunk()
+                self._process_event(event)
+                yield event
+        except GeneratorExit:
+            # The consumer stopped iterating before the end of the stream
+            abandoned = True
+            raise
+        except Exception as err:
+            self._self_span.record_exception(err)
+            status = Status(StatusCode.ERROR, str(err))
+            raise
+        finally:
+            self._finish(status, abandoned)
+
+    def close(self):
+        try:
+            close = getattr(self.__wrapped__, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._finish(Status(StatusCode.OK), abandoned=True)
+
+    @silently_fail
+    def _process_event(self, event):
+        if "contentBlockDelta" in event:
             delta = event["contentBlockDelta"]["delta"]
             if "text" in delta:
-                streaming_response += delta["text"]
+                self._self_accumulator.append(delta["text"])
+        elif "messageStart" in event:
+            self._self_role = event["messageStart"]["role"]
+        elif "messageStop" in event:
+            set_span_attribute(
+                self._self_span,
+                SpanAttributes.LLM_RESPONSE_FINISH_REASON,
+                event["messageStop"].get("stopReason"),
+            )
         elif "metadata" in event and "usage" in event["metadata"]:
             usage = event["metadata"]["usage"]
             set_usage_attributes(
-                span,
+                self._self_span,
                 {
                     "input_tokens": usage.get("inputTokens"),
                     "output_tokens": usage.get("outputTokens"),
                 },
             )
 
-    if streaming_response:
-        set_event_completion(
-            span, [{"role": role or "assistant", "content": streaming_response}]
-        )
+    def _finish(self, status, abandoned=False):
+        if self._self_finished:
+            return
+        self._self_finished = True
+        self._self_finalizer.detach()
+        self._self_accumulator.flush_chunk_events()
+        if self._self_accumulator.content:
+            set_event_completion(
+                self._self_span,
+                [
+                    {
+                        "role": self._self_role or "assistant",
+                        "content": self._self_accumulator.text,
+                    }
+                ],
+            )
+        self._self_stream_timer.finish(self._self_span)
+        if abandoned:
+            set_span_attribute(
+                self._self_span, STREAM_SPAN_ATTRIBUTES["STATUS"], "abandoned"
+            )
+        else:
+            self._self_span.set_status(status)
+        self._self_span.end()
 
 
 class StreamingBedrockWrapper(ObjectProxy):
@@ -473,14 +585,18 @@ class StreamingBedrockWrapper(ObjectProxy):
         self,
         response,
         stream_done_callback=None,
+        stream_timer=None,
     ):
         super().__init__(response)
 
         self._stream_done_callback = stream_done_callback
+        self._stream_timer = stream_timer
         self._accumulating_body = {"generation": ""}
 
     def __iter__(self):
         for event in self.__wrapped__:
+            if self._stream_timer is not None:
+                self._stream_timer.record_chunk()
             self._process_event(event)
             yield event
 
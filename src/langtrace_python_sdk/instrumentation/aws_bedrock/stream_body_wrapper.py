@@ -1,3 +1,5 @@
+import json
+
 from botocore.response import StreamingBody
 from botocore.exceptions import (
     ReadTimeoutError,
@@ -8,34 +10,72 @@ from urllib3.exceptions import ReadTimeoutError as URLLib3ReadTimeoutError
 
 
 class BufferedStreamBody(StreamingBody):
+    """
+    Reads the raw stream once and serves every later read from the buffer, so
+    both the instrumentation and the caller can consume the response body.
+    `read` returns bytes as StreamingBody does, which copies the requested part
+    unless the whole body is read at once; only `readinto` and `getbuffer`
+    never copy it.
+    """
+
+    _NOT_PARSED = object()
+
     def __init__(self, raw_stream, content_length):
         super().__init__(raw_stream, content_length)
         self._buffer = None
+        self._view = None
         self._buffer_cursor = 0
+        self._parsed = self._NOT_PARSED
+
+    def _fill(self):
+        if self._buffer is not None:
+            return
+        try:
+            self._buffer = self._raw_stream.read()
+        except URLLib3ReadTimeoutError as e:
+            # TODO: the url will be None as urllib3 isn't setting it yet
+            raise ReadTimeoutError(endpoint_url=e.url, error=e)
+        except URLLib3ProtocolError as e:
+            raise ResponseStreamingError(error=e)
+
+        self._view = memoryview(self._buffer)
+        self._amount_read += len(self._buffer)
+        # The whole body has been read, so the content length can be verified
+        self._verify_content_length()
 
     def read(self, amt=None):
         """Read at most amt bytes from the stream.
 
-        If the amt argument is omitted, read all data.
+        If the amt argument is omitted, read all data. Partial reads return a
+        copy of the requested bytes.
         """
-        if self._buffer is None:
-            try:
-                self._buffer = self._raw_stream.read()
-            except URLLib3ReadTimeoutError as e:
-                # TODO: the url will be None as urllib3 isn't setting it yet
-                raise ReadTimeoutError(endpoint_url=e.url, error=e)
-            except URLLib3ProtocolError as e:
-                raise ResponseStreamingError(error=e)
-
-            self._amount_read += len(self._buffer)
-            if amt is None or (not self._buffer and amt > 0):
-                # If the server sends empty contents or
-                # we ask to read all of the contents, then we know
-                # we need to verify the content length.
-                self._verify_content_length()
-
+        self._fill()
+        start = self._buffer_cursor
         if amt is None:
-            return self._buffer[self._buffer_cursor :]
-        else:
-            self._buffer_cursor += amt
-            return self._buffer[self._buffer_cursor - amt : self._buffer_cursor]
+            self._buffer_cursor = len(self._buffer)
+            # A full read from the start hands out the buffer itself
+            return self._buffer if start == 0 else self._view[start:].tobytes()
+
+        self._buffer_cursor = min(start + amt, len(self._buffer))
+        return self._view[start : self._buffer_cursor].tobytes()
+
+    def readinto(self, b):
+        """Copy the next bytes of the body into the writable buffer b."""
+        self._fill()
+        start = self._buffer_cursor
+        size = min(len(b), len(self._buffer) - start)
+        memoryview(b).cast("B")[:size] = self._view[start : start + size]
+        self._buffer_cursor = start + size
+        return size
+
+    def getbuffer(self):
+        """Return a read-only view of the whole body without copying it."""
+        self._fill()
+        return self._view.toreadonly()
+
+    def json(self):
+        """Return the decoded JSON body, parsed on the first call only."""
+        if self._parsed is self._NOT_PARSED:
+            self._fill()
+            self._parsed = json.loads(self._buffer)
+        return self._parsed
@@ -19,6 +19,8 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from opentelemetry.semconv.schemas import Schemas
 from wrapt import wrap_function_wrapper
+
+from langtrace_python_sdk.utils import unwrap_method
 from importlib_metadata import version as v
 from .patch import chat_completions_create, async_chat_completions_create
 
@@ -51,4 +53,5 @@ class CerebrasInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("cerebras.cloud.sdk", "resources.chat.completions.CompletionsResource.create")
+        unwrap_method("cerebras.cloud.sdk", "resources.chat.completions.AsyncCompletionsResource.create")
@@ -10,6 +10,8 @@ from langtrace_python_sdk.utils.llm import (
     set_span_attributes,
     StreamWrapper,
 )
+from langtrace_python_sdk.utils.stream_processors import OpenAIChunkProcessor
+from langtrace_python_sdk.utils.provider_registry import provider_registry
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
 from langtrace.trace_attributes import SpanAttributes
@@ -23,7 +25,10 @@ def chat_completions_create(version: str, tracer):
             llm_prompts.append(message)
 
         span_attributes = {
-            **get_langtrace_attributes(version, SERVICE_PROVIDERS["CEREBRAS"]),
+            **get_langtrace_attributes(
+                version,
+                provider_registry.resolve(instance, SERVICE_PROVIDERS["CEREBRAS"]),
+            ),
             **get_llm_request_attributes(kwargs, prompts=llm_prompts),
             **get_llm_url(instance),
             **get_extra_attributes(),
@@ -41,7 +46,9 @@ def chat_completions_create(version: str, tracer):
                 _set_input_attributes(span, kwargs, span_attributes)
                 result = wrapped(*args, **kwargs)
                 if is_streaming(kwargs):
-                    return StreamWrapper(result, span)
+                    return StreamWrapper(
+                        result, span, chunk_processor=OpenAIChunkProcessor()
+                    )
 
                 if span.is_recording():
                     _set_response_attributes(span, result)
@@ -62,7 +69,10 @@ def async_chat_completions_create(version: str, tracer):
             llm_prompts.append(message)
 
         span_attributes = {
-            **get_langtrace_attributes(version, SERVICE_PROVIDERS["CEREBRAS"]),
+            **get_langtrace_attributes(
+                version,
+                provider_registry.resolve(instance, SERVICE_PROVIDERS["CEREBRAS"]),
+            ),
             **get_llm_request_attributes(kwargs, prompts=llm_prompts),
             **get_llm_url(instance),
             **get_extra_attributes(),
@@ -80,7 +90,9 @@ def async_chat_completions_create(version: str, tracer):
                 _set_input_attributes(span, kwargs, span_attributes)
                 result = await wrapped(*args, **kwargs)
                 if is_streaming(kwargs):
-                    return StreamWrapper(result, span)
+                    return StreamWrapper(
+                        result, span, chunk_processor=OpenAIChunkProcessor()
+                    )
 
                 if span.is_recording():
                     _set_response_attributes(span, result)
@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.constants.instrumentation.chroma import APIS
 from langtrace_python_sdk.instrumentation.chroma.patch import collection_patch
 
@@ -52,4 +53,7 @@ class ChromaInstrumentation(BaseInstrumentor):
         pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        for operation, _ in APIS.items():
+            unwrap_method(
+                "chromadb.api.models.Collection", f"Collection.{operation.lower()}"
+            )
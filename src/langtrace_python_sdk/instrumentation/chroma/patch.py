@@ -17,7 +17,10 @@ limitations under the License.
 from langtrace.trace_attributes import DatabaseSpanAttributes
 from langtrace_python_sdk.utils import set_span_attribute
 from langtrace_python_sdk.utils.llm import get_span_name
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+from langtrace_python_sdk.utils.score_stats import set_score_stats_attributes
 from langtrace_python_sdk.utils.silently_fail import silently_fail
+from langtrace_python_sdk.utils.vector_summary import serialize_request
 from opentelemetry import baggage, trace
 from opentelemetry.trace import SpanKind
 from opentelemetry.trace.status import Status, StatusCode
@@ -27,7 +30,6 @@ from langtrace_python_sdk.constants.instrumentation.common import (
     LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY,
     SERVICE_PROVIDERS,
 )
-import json
 from importlib_metadata import version as v
 
 from langtrace_python_sdk.constants import LANGTRACE_SDK_NAME
@@ -51,7 +53,7 @@ def collection_patch(method, version, tracer):
             "langtrace.version": v(LANGTRACE_SDK_NAME),
             "db.system": "chromadb",
             "db.operation": api["OPERATION"],
-            "db.query": json.dumps(kwargs),
+            "db.query": serialize_request(kwargs),
             **(extra_attributes if extra_attributes is not None else {}),
         }
 
@@ -92,7 +94,7 @@ def collection_patch(method, version, tracer):
 
                 if operation == "query":
                     events = _set_chroma_query_response(span, result)
-                    for event in events:
+                    for event in events or []:
                         span.add_event(name="db.chroma.query.result", attributes=event)
 
                 span.set_status(StatusCode.OK)
@@ -257,17 +259,20 @@ def _set_chroma_delete_attributes(span, kwargs):
 def _set_chroma_query_response(span, result):
 
     attributes = []
+    # Only the results of the first query embedding are recorded
     ids = result.get("ids")[0]
-    distances = result.get("distances")[0]
-    metadatas = result.get("metadatas")[0]
-    documents = result.get("documents")[0]
-
-    for idx, _ in enumerate(ids):
-        attribute = {
-            "id": ids[idx],
-            "distance": distances[idx],
-            "metadata": metadatas[idx],
-            "document": documents[idx],
-        }
+    distances = (result.get("distances") or [None])[0]
+    metadatas = (result.get("metadatas") or [None])[0]
+    documents = (result.get("documents") or [None])[0]
+    set_score_stats_attributes(span, "db.chroma.query.distances", distances or ())
+
+    for idx in range(min(len(ids), result_capture_policy.max_matches)):
+        attribute = result_capture_policy.match_attributes(
+            {"id": ids[idx], "distance": distances[idx] if distances else None},
+            {
+                "metadata": metadatas[idx] if metadatas else None,
+                "document": documents[idx] if documents else None,
+            },
+        )
         attributes.append(attribute)
     return attributes
@@ -19,6 +19,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import TracerProvider, get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.cleanlab.patch import generic_patch
 
 logging.basicConfig(level=logging.FATAL)
@@ -59,4 +60,7 @@ class CleanLabInstrumentation(BaseInstrumentor):  # type: ignore
         )
 
     def _uninstrument(self, **kwargs: Any) -> None:
-        pass
+        unwrap_method("cleanlab_tlm.tlm", "TLM.prompt")
+        unwrap_method("cleanlab_tlm.tlm", "TLM.get_trustworthiness_score")
+        unwrap_method("cleanlab_tlm.tlm", "TLM.try_prompt")
+        unwrap_method("cleanlab_tlm.tlm", "TLM.try_get_trustworthiness_score")
@@ -21,6 +21,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.cohere.patch import (
     chat_create,
     chat_create_v2,
@@ -95,4 +96,11 @@ class CohereInstrumentation(BaseInstrumentor):
         pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("cohere.client", "Client.chat")
+        unwrap_method("cohere.client", "Client.chat_stream")
+        unwrap_method("cohere.client", "Client.embed")
+        unwrap_method("cohere.client", "Client.rerank")
+        unwrap_method("cohere.client_v2", "ClientV2.chat")
+        unwrap_method("cohere.client_v2", "ClientV2.chat_stream")
+        unwrap_method("cohere.client_v2", "ClientV2.embed")
+        unwrap_method("cohere.client_v2", "ClientV2.rerank")
@@ -26,6 +26,7 @@ from langtrace_python_sdk.utils.llm import (
     set_usage_attributes,
     StreamWrapper
 )
+from langtrace_python_sdk.utils.stream_processors import CohereV2ChunkProcessor
 from langtrace.trace_attributes import Event, LLMSpanAttributes
 from langtrace_python_sdk.utils import set_span_attribute
 from langtrace_python_sdk.utils.misc import datetime_encoder
@@ -392,6 +393,7 @@ def chat_create_v2(original_method, version, tracer, stream=False):
                     result,
                     span,
                     tool_calls=kwargs.get("tools") is not None,
+                    chunk_processor=CohereV2ChunkProcessor(),
                 )
             else:
                 if hasattr(result, "id") and result.id is not None:
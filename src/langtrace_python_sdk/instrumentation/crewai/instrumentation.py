@@ -17,6 +17,8 @@ limitations under the License.
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from typing import Collection
 from importlib_metadata import version as v
 from .patch import patch_crew, patch_memory
@@ -84,4 +86,12 @@ class CrewAIInstrumentation(BaseInstrumentor):
             pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("crewai.crew", "Crew.kickoff")
+        unwrap_method("crewai.crew", "Crew.kickoff_for_each")
+        unwrap_method("crewai.crew", "Crew.kickoff_async")
+        unwrap_method("crewai.crew", "Crew.kickoff_for_each_async")
+        unwrap_method("crewai.agent", "Agent.execute_task")
+        unwrap_method("crewai.task", "Task.execute_sync")
+        unwrap_method("crewai.memory.storage.rag_storage", "RAGStorage.save")
+        unwrap_method("crewai.memory.storage.rag_storage", "RAGStorage.search")
+        unwrap_method("crewai.memory.storage.rag_storage", "RAGStorage.reset")
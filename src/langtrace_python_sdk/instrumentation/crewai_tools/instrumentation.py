@@ -20,7 +20,7 @@ from importlib_metadata import version as v
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
-
+from langtrace_python_sdk.utils import unwrap_method
 from .patch import patch_run
 
 
@@ -46,4 +46,4 @@ class CrewaiToolsInstrumentation(BaseInstrumentor):
             pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("crewai_tools.tools.serper_dev_tool.serper_dev_tool", "SerperDevTool._run")
@@ -17,6 +17,8 @@ limitations under the License.
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from typing import Collection
 from importlib_metadata import version as v
 from .patch import patch_bootstrapfewshot_optimizer, patch_signature, patch_evaluate
@@ -77,4 +79,11 @@ class DspyInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("dspy.teleprompt.bootstrap", "BootstrapFewShot.compile")
+        unwrap_method("dspy.predict.predict", "Predict.forward")
+        unwrap_method("dspy.predict.chain_of_thought", "ChainOfThought.forward")
+        unwrap_method("dspy.predict.chain_of_thought_with_hint", "ChainOfThoughtWithHint.forward")
+        unwrap_method("dspy.predict.react", "ReAct.forward")
+        unwrap_method("dspy.predict.program_of_thought", "ProgramOfThought.forward")
+        unwrap_method("dspy.predict.multi_chain_comparison", "MultiChainComparison.forward")
+        unwrap_method("dspy.evaluate.evaluate", "Evaluate.__call__")
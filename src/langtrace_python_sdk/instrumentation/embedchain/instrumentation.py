@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.embedchain.patch import generic_patch
 
 logging.basicConfig(level=logging.FATAL)
@@ -62,4 +63,6 @@ class EmbedchainInstrumentation(BaseInstrumentor):
         pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("embedchain.embedchain", "EmbedChain.add")
+        unwrap_method("embedchain.embedchain", "EmbedChain.query")
+        unwrap_method("embedchain.embedchain", "EmbedChain.search")
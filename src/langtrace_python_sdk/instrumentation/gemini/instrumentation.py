@@ -2,6 +2,7 @@ from typing import Collection
 from importlib_metadata import version as v
 from langtrace_python_sdk.constants.instrumentation.gemini import APIS
 from wrapt import wrap_function_wrapper as _W
+from langtrace_python_sdk.utils import unwrap_method
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from .patch import patch_gemini, apatch_gemini
@@ -33,4 +34,8 @@ class GeminiInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for _, api_config in APIS.items():
+            unwrap_method(
+                api_config.get("module"),
+                f"{api_config.get('method')}.{api_config.get('operation')}",
+            )
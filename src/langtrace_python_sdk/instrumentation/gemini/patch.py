@@ -1,3 +1,5 @@
+import json
+
 from langtrace.trace_attributes import LLMSpanAttributes, SpanAttributes
 from opentelemetry import trace
 from opentelemetry.trace import Span, SpanKind, Tracer
@@ -5,7 +7,9 @@ from opentelemetry.trace.propagation import set_span_in_context
 from opentelemetry.trace.status import Status, StatusCode
 
 from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
+from langtrace_python_sdk.utils.binary_payloads import describe_bytes
 from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
     get_extra_attributes,
     get_langtrace_attributes,
     get_llm_request_attributes,
@@ -16,6 +20,8 @@ from langtrace_python_sdk.utils.llm import (
     set_span_attributes,
     set_usage_attributes,
 )
+from langtrace_python_sdk.utils.silently_fail import silently_fail
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
 
 
 def patch_gemini(name, version, tracer: Tracer):
@@ -124,11 +130,25 @@ def serialize_prompts(args, kwargs, instance):
                 content = f"{content}{arg}\n"
             elif isinstance(arg, list):
                 for subarg in arg:
-                    content = f"{content}{subarg}\n"
+                    content = f"{content}{serialize_part(subarg)}\n"
         prompts.append({"role": "user", "content": content})
     return prompts
 
 
+def serialize_part(part):
+    """
+    Text of a prompt part, with inline image or audio data replaced by its
+    size, mime type and digest."""
+    inline_data = getattr(part, "inline_data", None)
+    if inline_data is not None and getattr(inline_data, "data", None):
+        return json.dumps(describe_bytes(inline_data.data, inline_data.mime_type))
+    if isinstance(part, dict) and isinstance(part.get("data"), (bytes, bytearray)):
+        return json.dumps(describe_bytes(part["data"], part.get("mime_type")))
+    if isinstance(part, (bytes, bytearray)):
+        return json.dumps(describe_bytes(part))
+    return f"{part}"
+
+
 def set_response_attributes(
     span: Span,
     result,
@@ -147,38 +167,48 @@ def set_response_attributes(
 
 
 def build_streaming_response(span, response):
-    complete_response = ""
+    accumulator = CompletionAccumulator(span=span)
+    stream_timer = StreamTimer(span)
     for item in response:
-        item_to_yield = item
-        complete_response += str(item.text)
-        yield item_to_yield
-        if hasattr(item, "usage_metadata") and item.usage_metadata is not None:
-            usage = item.usage_metadata
-            input_tokens = usage.prompt_token_count
-            output_tokens = usage.candidates_token_count
-            set_usage_attributes(
-                span, {"input_tokens": input_tokens, "output_tokens": output_tokens}
-            )
-
-    set_response_attributes(span, response)
+        stream_timer.record_chunk()
+        accumulate_streaming_item(accumulator, item)
+        yield item
+
+    set_streaming_response_attributes(span, accumulator)
+    stream_timer.finish(span, accumulator.completion_tokens)
     span.set_status(Status(StatusCode.OK))
     span.end()
 
 
 async def abuild_streaming_response(span, response):
-    complete_response = ""
+    accumulator = CompletionAccumulator(span=span)
+    stream_timer = StreamTimer(span)
     async for item in response:
-        item_to_yield = item
-        complete_response += str(item.text)
-        yield item_to_yield
-        if hasattr(item, "usage_metadata") and item.usage_metadata is not None:
-            usage = item.usage_metadata
-            input_tokens = usage.prompt_token_count
-            output_tokens = usage.candidates_token_count
-            set_usage_attributes(
-                span, {"input_tokens": input_tokens, "output_tokens": output_tokens}
-            )
-
-    set_response_attributes(span, response)
+        stream_timer.record_chunk()
+        accumulate_streaming_item(accumulator, item)
+        yield item
+
+    set_streaming_response_attributes(span, accumulator)
+    stream_timer.finish(span, accumulator.completion_tokens)
     span.set_status(Status(StatusCode.OK))
     span.end()
+
+
+@silently_fail
+def accumulate_streaming_item(accumulator: CompletionAccumulator, item):
+    accumulator.append(item.text)
+    usage = getattr(item, "usage_metadata", None)
+    if usage is not None:
+        accumulator.set_usage(usage.prompt_token_count, usage.candidates_token_count)
+
+
+def set_streaming_response_attributes(span: Span, accumulator: CompletionAccumulator):
+    accumulator.flush_chunk_events()
+    set_event_completion(span, [{"role": "assistant", "content": accumulator.text}])
+    set_usage_attributes(
+        span,
+        {
+            "input_tokens": accumulator.prompt_tokens,
+            "output_tokens": accumulator.completion_tokens,
+        },
+    )
@@ -1,9 +1,14 @@
 from typing import Collection
 from importlib_metadata import version as v
 from wrapt import wrap_function_wrapper as _W
+from langtrace_python_sdk.utils import unwrap_method
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
-from .patch import patch_google_genai, patch_google_genai_streaming
+from .patch import (
+    patch_google_genai,
+    patch_google_genai_streaming,
+    patch_google_genai_streaming_async,
+)
 
 
 class GoogleGenaiInstrumentation(BaseInstrumentor):
@@ -25,6 +30,17 @@ class GoogleGenaiInstrumentation(BaseInstrumentor):
             name="models.Models.generate_content_stream",
             wrapper=patch_google_genai_streaming(tracer, version),
         )
+        from google.genai import models
+
+        # Async streaming is not available in the earliest google-genai releases
+        if hasattr(models.AsyncModels, "generate_content_stream"):
+            _W(
+                module="google.genai",
+                name="models.AsyncModels.generate_content_stream",
+                wrapper=patch_google_genai_streaming_async(tracer, version),
+            )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("google.genai", "models.Models.generate_content")
+        unwrap_method("google.genai", "models.Models.generate_content_stream")
+        unwrap_method("google.genai", "models.AsyncModels.generate_content_stream")
@@ -1,5 +1,8 @@
 import base64
+import weakref
 from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
+    end_abandoned_stream_span,
     get_langtrace_attributes,
     get_llm_request_attributes,
     set_span_attributes,
@@ -8,12 +11,14 @@ from langtrace_python_sdk.utils.llm import (
     set_event_completion,
 )
 from langtrace_python_sdk.utils import handle_span_error
+from langtrace_python_sdk.utils.silently_fail import silently_fail
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
 
 from opentelemetry.trace import Tracer, SpanKind
 from opentelemetry.sdk.trace import Span
 from langtrace.trace_attributes import SpanAttributes
 
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
 def capture_input_data(contents):
     input_data = []
@@ -93,57 +98,137 @@ def patch_google_genai(tracer: Tracer, version: str):
 
 def patch_google_genai_streaming(tracer: Tracer, version: str):
     def traced_method(wrapped, instance, args, kwargs):
-        prompt = [
-            {
-                "role": "user",
-                "content": kwargs["contents"],
-            }
-        ]
-        span_attributes = {
-            **get_langtrace_attributes(
-                service_provider="google_genai", version=version
-            ),
-            **get_llm_request_attributes(kwargs=kwargs, prompts=prompt),
-        }
-        with tracer.start_as_current_span(
-            name="google.genai.generate_content_stream",
-            kind=SpanKind.CLIENT,
-        ) as span:
-            set_span_attributes(span, span_attributes)
+        span = _start_streaming_span(tracer, version, kwargs)
+        try:
             response = wrapped(*args, **kwargs)
-            set_streaming_response_attributes(span, response)
-            return response
+        except Exception as error:
+            handle_span_error(span, error)
+            raise
+        return build_streaming_response(span, response)
 
     return traced_method
 
 
-def set_streaming_response_attributes(span: Span, response):
-    accum_completion = ""
-    for chunk in response:
-        set_span_attribute(
-            span,
-            SpanAttributes.LLM_RESPONSE_MODEL,
-            chunk.model_version,
-        )
-        candidates = chunk.candidates
-        for candidate in candidates:
+def patch_google_genai_streaming_async(tracer: Tracer, version: str):
+    async def traced_method(wrapped, instance, args, kwargs):
+        span = _start_streaming_span(tracer, version, kwargs)
+        try:
+            response = await wrapped(*args, **kwargs)
+        except Exception as error:
+            handle_span_error(span, error)
+            raise
+        return abuild_streaming_response(span, response)
+
+    return traced_method
+
+
+def _start_streaming_span(tracer: Tracer, version: str, kwargs):
+    prompt = [
+        {
+            "role": "user",
+            "content": kwargs["contents"],
+        }
+    ]
+    span_attributes = {
+        **get_langtrace_attributes(service_provider="google_genai", version=version),
+        **get_llm_request_attributes(kwargs=kwargs, prompts=prompt),
+    }
+    # The span is ended by the streaming generator once the caller is done with it
+    span = tracer.start_span(
+        name="google.genai.generate_content_stream",
+        kind=SpanKind.CLIENT,
+    )
+    set_span_attributes(span, span_attributes)
+    return span
+
+
+def build_streaming_response(span: Span, response) -> Iterator:
+    started = []
+    stream = _streaming_response(span, response, started)
+    # A generator that is never iterated never runs its finally block
+    weakref.finalize(stream, _end_unstarted_stream_span, span, started)
+    return stream
+
+
+def abuild_streaming_response(span: Span, response) -> AsyncIterator:
+    started = []
+    stream = _astreaming_response(span, response, started)
+    weakref.finalize(stream, _end_unstarted_stream_span, span, started)
+    return stream
+
+
+def _end_unstarted_stream_span(span: Span, started):
+    if not started:
+        end_abandoned_stream_span(span)
+
+
+def _streaming_response(span: Span, response, started) -> Iterator:
+    started.append(True)
+    completion = CompletionAccumulator(count_tokens=False, span=span)
+    stream_timer = StreamTimer(span)
+    try:
+        for chunk in response:
+            stream_timer.record_chunk()
+            set_streaming_chunk_attributes(span, chunk, completion)
+            yield chunk
+    except Exception as error:
+        handle_span_error(span, error)
+        raise
+    finally:
+        _end_streaming_span(span, completion, stream_timer)
+
+
+async def _astreaming_response(span: Span, response, started) -> AsyncIterator:
+    started.append(True)
+    completion = CompletionAccumulator(count_tokens=False, span=span)
+    stream_timer = StreamTimer(span)
+    try:
+        async for chunk in response:
+            stream_timer.record_chunk()
+            set_streaming_chunk_attributes(span, chunk, completion)
+            yield chunk
+    except Exception as error:
+        handle_span_error(span, error)
+        raise
+    finally:
+        _end_streaming_span(span, completion, stream_timer)
+
+
+@silently_fail
+def set_streaming_chunk_attributes(
+    span: Span, chunk, completion: CompletionAccumulator
+):
+    set_span_attribute(span, SpanAttributes.LLM_RESPONSE_MODEL, chunk.model_version)
+    for candidate in chunk.candidates or []:
+        if candidate.finish_reason:
             set_span_attribute(
                 span,
                 SpanAttributes.LLM_RESPONSE_FINISH_REASON,
                 candidate.finish_reason,
             )
+        if candidate.content and candidate.content.parts:
+            for part in candidate.content.parts:
+                completion.append(part.text)
 
-            accum_completion += candidate.content.parts[0].text
+    if chunk.usage_metadata:
+        set_usage_attributes(
+            span,
+            {
+                "input_tokens": chunk.usage_metadata.prompt_token_count,
+                "output_tokens": chunk.usage_metadata.candidates_token_count,
+            },
+        )
 
-        if chunk.usage_metadata:
-            set_usage_attributes(
-                span,
-                {
-                    "input_tokens": chunk.usage_metadata.prompt_token_count,
-                    "output_tokens": chunk.usage_metadata.candidates_token_count,
-                },
-            )
-    set_event_completion(span, [{"role": "assistant", "content": accum_completion}])
+
+def _end_streaming_span(
+    span: Span, completion: CompletionAccumulator, stream_timer: StreamTimer
+):
+    if not span.is_recording():
+        return
+    completion.flush_chunk_events()
+    set_event_completion(span, [{"role": "assistant", "content": completion.text}])
+    stream_timer.finish(span)
+    span.end()
 
 
 def set_response_attributes(span: Span, response):
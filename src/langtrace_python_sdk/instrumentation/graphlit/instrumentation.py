@@ -1,6 +1,8 @@
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from typing import Collection
 from importlib_metadata import version as v
 from .patch import patch_graphlit_operation
@@ -54,4 +56,10 @@ class GraphlitInstrumentation(BaseInstrumentor):
             pass
 
     def _uninstrument(self, **kwargs):
-        pass
\ No newline at end of file
+        unwrap_method("graphlit.graphlit", "Client.ingest_uri")
+        unwrap_method("graphlit.graphlit", "Client.create_feed")
+        unwrap_method("graphlit.graphlit", "Client.create_specification")
+        unwrap_method("graphlit.graphlit", "Client.create_conversation")
+        unwrap_method("graphlit.graphlit", "Client.format_conversation")
+        unwrap_method("graphlit.graphlit", "Client.complete_conversation")
+        unwrap_method("graphlit.graphlit", "Client.prompt_conversation")
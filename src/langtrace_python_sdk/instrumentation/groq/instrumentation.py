@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.groq.patch import (
     async_chat_completions_create,
     chat_completions_create,
@@ -55,4 +56,5 @@ class GroqInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("groq.resources.chat.completions", "Completions.create")
+        unwrap_method("groq.resources.chat.completions", "AsyncCompletions.create")
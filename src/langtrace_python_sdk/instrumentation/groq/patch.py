@@ -24,6 +24,7 @@ from opentelemetry.trace import SpanKind
 from opentelemetry.trace.status import Status, StatusCode
 
 from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
     get_base_url,
     get_extra_attributes,
     get_llm_request_attributes,
@@ -33,12 +34,13 @@ from langtrace_python_sdk.utils.llm import (
     set_event_completion,
     set_usage_attributes,
 )
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
 from langtrace_python_sdk.constants.instrumentation.common import (
     LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY,
     SERVICE_PROVIDERS,
 )
 from langtrace_python_sdk.constants.instrumentation.groq import APIS
-from langtrace_python_sdk.utils.llm import calculate_prompt_tokens, estimate_tokens
+from langtrace_python_sdk.utils.llm import estimate_chat_prompt_tokens
 from importlib_metadata import version as v
 
 from langtrace_python_sdk.constants import LANGTRACE_SDK_NAME
@@ -164,24 +166,15 @@ def chat_completions_create(original_method, version, tracer):
                 span.end()
                 return result
             else:
-                # iterate over kwargs.get("messages", {}) and calculate the prompt tokens
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps(message), kwargs.get("model")
-                    )
-
-                # iterate over kwargs.get("functions") and calculate the prompt tokens
-                if kwargs.get("functions") is not None:
-                    for function in kwargs.get("functions"):
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
+                # prompt tokens are only estimated once the stream has finished
+                messages = list(kwargs.get("messages") or [])
+                functions = kwargs.get("functions")
                 return handle_streaming_response(
                     result,
                     span,
-                    prompt_tokens,
+                    lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
                 )
@@ -193,74 +186,22 @@ def chat_completions_create(original_method, version, tracer):
             raise
 
     def handle_streaming_response(
-        result, span, prompt_tokens, function_call=False, tool_calls=False
+        result, span, prompt_tokens_estimator, function_call=False, tool_calls=False
     ):
         """Process and yield streaming response chunks."""
-        result_content = []
+        accumulator = CompletionAccumulator(span=span)
         span.add_event(Event.STREAM_START.value)
-        completion_tokens = 0
+        stream_timer = StreamTimer(span)
         try:
             for chunk in result:
-                if hasattr(chunk, "model") and chunk.model is not None:
-                    span.set_attribute("llm.model", chunk.model)
-                if hasattr(chunk, "choices") and chunk.choices is not None:
-                    if not function_call and not tool_calls:
-                        for choice in chunk.choices:
-                            if choice.delta and choice.delta.content is not None:
-                                token_counts = estimate_tokens(choice.delta.content)
-                                completion_tokens += token_counts
-                                content = [choice.delta.content]
-                    elif function_call:
-                        for choice in chunk.choices:
-                            if (
-                                choice.delta
-                                and choice.delta.function_call is not None
-                                and choice.delta.function_call.arguments is not None
-                            ):
-                                token_counts = estimate_tokens(
-                                    choice.delta.function_call.arguments
-                                )
-                                completion_tokens += token_counts
-                                content = [choice.delta.function_call.arguments]
-                    elif tool_calls:
-                        for choice in chunk.choices:
-                            tool_call = ""
-                            if choice.delta and choice.delta.tool_calls is not None:
-                                toolcalls = choice.delta.tool_calls
-                                content = []
-                                for tool_call in toolcalls:
-                                    if (
-                                        tool_call
-                                        and tool_call.function is not None
-                                        and tool_call.function.arguments is not None
-                                    ):
-                                        token_counts = estimate_tokens(
-                                            tool_call.function.arguments
-                                        )
-                                        completion_tokens += token_counts
-                                        content = content + [
-                                            tool_call.function.arguments
-                                        ]
-                                    else:
-                                        content = content + []
-                else:
-                    content = []
-
-                result_content.append(content[0] if len(content) > 0 else "")
+                stream_timer.record_chunk()
+                accumulate_chunk(accumulator, span, chunk, function_call, tool_calls)
                 yield chunk
         finally:
             # Finalize span after processing all chunks
-            span.add_event(Event.STREAM_END.value)
-            set_usage_attributes(
-                span,
-                {"input_tokens": prompt_tokens, "output_tokens": completion_tokens},
+            finish_streaming_span(
+                span, accumulator, prompt_tokens_estimator, stream_timer
             )
-            set_event_completion(
-                span, [{"role": "assistant", "content": "".join(result_content)}]
-            )
-
-            span.set_status(Status(StatusCode.OK))
-            span.end()
 
     # return the wrapped method
     return traced_method
@@ -378,24 +319,15 @@ def async_chat_completions_create(original_method, version, tracer):
                 span.end()
                 return result
             else:
-                # iterate over kwargs.get("messages", {}) and calculate the prompt tokens
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps(message), kwargs.get("model")
-                    )
-
-                # iterate over kwargs.get("functions") and calculate the prompt tokens
-                if kwargs.get("functions") is not None:
-                    for function in kwargs.get("functions"):
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
+                # prompt tokens are only estimated once the stream has finished
+                messages = list(kwargs.get("messages") or [])
+                functions = kwargs.get("functions")
                 return ahandle_streaming_response(
                     result,
                     span,
-                    prompt_tokens,
+                    lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
                 )
@@ -407,95 +339,90 @@ def async_chat_completions_create(original_method, version, tracer):
             raise
 
     async def ahandle_streaming_response(
-        result, span, prompt_tokens, function_call=False, tool_calls=False
+        result, span, prompt_tokens_estimator, function_call=False, tool_calls=False
     ):
         """Process and yield streaming response chunks."""
-        result_content = []
+        accumulator = CompletionAccumulator(span=span)
         span.add_event(Event.STREAM_START.value)
-        completion_tokens = 0
+        stream_timer = StreamTimer(span)
         try:
             async for chunk in result:
-                if hasattr(chunk, "model") and chunk.model is not None:
-                    set_span_attribute(
-                        span, SpanAttributes.LLM_RESPONSE_MODEL, chunk.model
-                    )
-                    span.set_attribute("llm.model", chunk.model)
-                if hasattr(chunk, "choices") and chunk.choices is not None:
-                    if not function_call and not tool_calls:
-                        for choice in chunk.choices:
-                            if choice.delta and choice.delta.content is not None:
-                                token_counts = estimate_tokens(choice.delta.content)
-                                completion_tokens += token_counts
-                                content = [choice.delta.content]
-                    elif function_call:
-                        for choice in chunk.choices:
-                            if (
-                                choice.delta
-                                and choice.delta.function_call
-                                and choice.delta.function_call.arguments is not None
-                            ):
-                                token_counts = estimate_tokens(
-                                    choice.delta.function_call.arguments
-                                )
-                                completion_tokens += token_counts
-                                content = [choice.delta.function_call.arguments]
-                    elif tool_calls:
-                        for choice in chunk.choices:
-                            tool_call = ""
-                            if choice.delta and choice.delta.tool_calls is not None:
-                                toolcalls = choice.delta.tool_calls
-                                content = []
-                                for tool_call in toolcalls:
-                                    if (
-                                        tool_call
-                                        and tool_call.function is not None
-                                        and tool_call.function.arguments is not None
-                                    ):
-                                        token_counts = estimate_tokens(
-                                            tool_call.function.arguments
-                                        )
-                                        completion_tokens += token_counts
-                                        content += [tool_call.function.arguments]
-                else:
-                    content = []
-                span.add_event(
-                    Event.RESPONSE.value,
-                    {
-                        SpanAttributes.LLM_COMPLETIONS: (
-                            "".join(content)
-                            if len(content) > 0 and content[0] is not None
-                            else ""
-                        )
-                    },
-                )
-                result_content.append(content[0] if len(content) > 0 else "")
+                stream_timer.record_chunk()
+                accumulate_chunk(accumulator, span, chunk, function_call, tool_calls)
                 yield chunk
         finally:
             # Finalize span after processing all chunks
-            span.add_event(Event.STREAM_END.value)
-
-            set_usage_attributes(
-                span,
-                {"input_tokens": prompt_tokens, "output_tokens": completion_tokens},
-            )
-
-            set_event_completion(
-                span,
-                [
-                    {
-                        "role": "assistant",
-                        "content": "".join(result_content),
-                    }
-                ],
+            finish_streaming_span(
+                span, accumulator, prompt_tokens_estimator, stream_timer
             )
 
-            span.set_status(StatusCode.OK)
-            span.end()
-
     # return the wrapped method
     return traced_method
 
 
+def accumulate_chunk(
+    accumulator, span, chunk, function_call=False, tool_calls=False
+):
+    """
+    Add the completion delta and usage of a chat completion chunk to `accumulator`,
+    returning the content found in the chunk."""
+    if accumulator.model is None and getattr(chunk, "model", None) is not None:
+        accumulator.set_model(chunk.model)
+        set_span_attribute(span, SpanAttributes.LLM_RESPONSE_MODEL, chunk.model)
+        span.set_attribute("llm.model", chunk.model)
+
+    content = []
+    for choice in getattr(chunk, "choices", None) or []:
+        delta = choice.delta
+        if not delta:
+            continue
+        if not function_call and not tool_calls:
+            if delta.content is not None:
+                content = [delta.content]
+        elif function_call:
+            if delta.function_call and delta.function_call.arguments is not None:
+                content = [delta.function_call.arguments]
+        elif delta.tool_calls is not None:
+            content = [
+                tool_call.function.arguments
+                for tool_call in delta.tool_calls
+                if tool_call
+                and tool_call.function is not None
+                and tool_call.function.arguments is not None
+            ]
+    for text in content:
+        accumulator.append(text)
+
+    # Groq reports usage on the last chunk under `x_groq`
+    x_groq = getattr(chunk, "x_groq", None)
+    usage = getattr(x_groq, "usage", None) or getattr(chunk, "usage", None)
+    if usage is not None:
+        accumulator.set_usage(
+            getattr(usage, "prompt_tokens", None),
+            getattr(usage, "completion_tokens", None),
+        )
+    return content
+
+
+def finish_streaming_span(span, accumulator, prompt_tokens_estimator, stream_timer):
+    accumulator.flush_chunk_events()
+    span.add_event(Event.STREAM_END.value)
+    prompt_tokens = accumulator.prompt_tokens
+    if prompt_tokens is None:
+        prompt_tokens = prompt_tokens_estimator()
+    set_usage_attributes(
+        span,
+        {
+            "input_tokens": prompt_tokens,
+            "output_tokens": accumulator.completion_tokens,
+        },
+    )
+    stream_timer.finish(span, accumulator.completion_tokens)
+    set_event_completion(span, [{"role": "assistant", "content": accumulator.text}])
+    span.set_status(Status(StatusCode.OK))
+    span.end()
+
+
 def extract_content(choice):
     # Check if choice.message exists and has a content attribute
     if (
@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.langchain.patch import generic_patch
 
 logging.basicConfig(level=logging.FATAL)
@@ -101,4 +102,5 @@ class LangchainInstrumentation(BaseInstrumentor):
         #     )
 
     def _uninstrument(self, **kwargs):
-        pass
+        unwrap_method("langchain.agents.agent", "RunnableAgent.plan")
+        unwrap_method("langchain.agents.agent", "RunnableAgent.aplan")
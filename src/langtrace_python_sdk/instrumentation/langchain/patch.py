@@ -30,6 +30,7 @@ from langtrace_python_sdk.constants.instrumentation.common import (
 )
 from importlib_metadata import version as v
 from langtrace_python_sdk.utils.misc import serialize_args, serialize_kwargs
+from langtrace_python_sdk.utils.serialize import to_json_string
 
 
 def generic_patch(
@@ -74,7 +75,11 @@ def generic_patch(
                 # Attempt to call the original method
                 result = wrapped(*args, **kwargs)
                 if trace_output:
-                    span.set_attribute("langchain.outputs", to_json_string(result))
+                    # Nested objects are expanded through their attributes
+                    span.set_attribute(
+                        "langchain.outputs",
+                        to_json_string(result, expand_nested_objects=True),
+                    )
 
                 span.set_status(StatusCode.OK)
                 return result
@@ -89,32 +94,3 @@ def generic_patch(
                 raise
 
     return traced_method
-
-
-def clean_empty(d):
-    """Recursively remove empty lists, empty dicts, or None elements from a dictionary."""
-    if not isinstance(d, (dict, list)):
-        return d
-    if isinstance(d, list):
-        return [v for v in (clean_empty(v) for v in d) if v != [] and v is not None]
-    return {
-        k: v
-        for k, v in ((k, clean_empty(v)) for k, v in d.items())
-        if v is not None and v != {}
-    }
-
-
-def custom_serializer(obj):
-    """Fallback function to convert unserializable objects."""
-    if hasattr(obj, "__dict__"):
-        # Attempt to serialize custom objects by their __dict__ attribute.
-        return clean_empty(obj.__dict__)
-    else:
-        # For other types, just convert to string
-        return str(obj)
-
-
-def to_json_string(any_object):
-    """Converts any object to a JSON-parseable string, omitting empty or None values."""
-    cleaned_object = clean_empty(any_object)
-    return json.dumps(cleaned_object, default=custom_serializer, indent=2)
@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_module_classes
 from langtrace_python_sdk.instrumentation.langchain_community.patch import generic_patch
 
 
@@ -133,10 +134,12 @@ class LangchainCommunityInstrumentation(BaseInstrumentor):
             ("langchain_community.vectorstores.vectara", "vector_store", False, False),
         ]
 
+        self._patched_modules = [module_name for module_name, *_ in modules_to_patch]
         for module_name, task, trace_output, trace_input in modules_to_patch:
             patch_module_classes(
                 module_name, tracer, version, task, trace_output, trace_input
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for module_name in getattr(self, "_patched_modules", []):
+            unwrap_module_classes(module_name)
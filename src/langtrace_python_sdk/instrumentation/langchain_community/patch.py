@@ -14,10 +14,9 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
-
 from langtrace.trace_attributes import FrameworkSpanAttributes
 from langtrace_python_sdk.utils.llm import get_span_name
+from langtrace_python_sdk.utils.serialize import to_json_string
 from opentelemetry import baggage, trace
 from opentelemetry.trace.propagation import set_span_in_context
 
@@ -105,63 +104,3 @@ def generic_patch(
                 raise
 
     return traced_method
-
-
-def clean_empty(d):
-    """Recursively remove empty lists, empty dicts, or None elements from a dictionary."""
-    if not isinstance(d, (dict, list, tuple)):
-        return d
-    if isinstance(d, tuple):
-        return tuple(
-            val
-            for val in (clean_empty(val) for val in d)
-            if val != () and val is not None
-        )
-    if isinstance(d, list):
-        return [
-            val
-            for val in (clean_empty(val) for val in d)
-            if val != [] and val is not None
-        ]
-    result = {}
-    for k, val in d.items():
-        if isinstance(val, dict):
-            val = clean_empty(val)
-            if val != {} and val is not None:
-                result[k] = val
-        elif isinstance(val, list):
-            val = [clean_empty(value) for value in val]
-            if val != [] and val is not None:
-                result[k] = val
-        elif isinstance(val, str) and val is not None:
-            if val.strip() != "":
-                result[k] = val.strip()
-        elif isinstance(val, object):
-            # some langchain objects have a text attribute
-            val = getattr(val, "text", None)
-            if val is not None and val.strip() != "":
-                result[k] = val.strip()
-    return result
-
-
-def custom_serializer(obj):
-    """Fallback function to convert unserializable objects."""
-    if hasattr(obj, "__dict__"):
-        # Attempt to serialize custom objects by their __dict__ attribute.
-        return clean_empty(obj.__dict__)
-    else:
-        # For other types, just convert to string
-        return str(obj)
-
-
-def to_json_string(any_object):
-    """Converts any object to a JSON-parseable string, omitting empty or None values."""
-    try:
-        cleaned_object = clean_empty(any_object)
-        return json.dumps(cleaned_object, default=custom_serializer, indent=2)
-    except NotImplementedError:
-        # Handle specific types that raise this error
-        return str(any_object)  # or another appropriate fallback
-    except TypeError:
-        # Handle cases where obj is not serializable
-        return str(any_object)
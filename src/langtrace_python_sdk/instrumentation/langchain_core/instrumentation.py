@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_module_classes
 from langtrace_python_sdk.instrumentation.langchain_core.patch import (
     generic_patch,
     runnable_patch,
@@ -195,6 +196,7 @@ class LangchainCoreInstrumentation(BaseInstrumentor):
             ),
         ]
 
+        self._patched_modules = [module_name for module_name, *_ in modules_to_patch]
         for (
             module_name,
             task,
@@ -215,4 +217,5 @@ class LangchainCoreInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for module_name in getattr(self, "_patched_modules", []):
+            unwrap_module_classes(module_name)
@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.langgraph.patch import patch_graph_methods
 
 
@@ -66,4 +67,11 @@ class LanggraphInstrumentation(BaseInstrumentor):
                 )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for method_name in [
+            "add_node",
+            "add_edge",
+            "set_entry_point",
+            "set_finish_point",
+            "add_conditional_edges",
+        ]:
+            unwrap_method("langgraph.graph.state", f"StateGraph.{method_name}")
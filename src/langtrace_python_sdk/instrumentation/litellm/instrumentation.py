@@ -19,6 +19,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer, TracerProvider
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.litellm.patch import (
     async_chat_completions_create,
     async_embeddings_create,
@@ -84,4 +85,10 @@ class LiteLLMInstrumentation(BaseInstrumentor): # type: ignore
         )
 
     def _uninstrument(self, **kwargs: Any) -> None:
-        pass
+        unwrap_method("litellm", "completion")
+        unwrap_method("litellm", "text_completion")
+        unwrap_method("litellm.main", "acompletion")
+        unwrap_method("litellm.main", "image_generation")
+        unwrap_method("litellm.main", "aimage_generation")
+        unwrap_method("litellm.main", "embedding")
+        unwrap_method("litellm.main", "aembedding")
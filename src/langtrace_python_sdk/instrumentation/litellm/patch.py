@@ -5,6 +5,8 @@ from langtrace.trace_attributes import (
     SpanAttributes,
 )
 from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.binary_payloads import describe_base64
+from langtrace_python_sdk.utils.provider_registry import provider_registry
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Tracer, Span
@@ -15,18 +17,19 @@ from langtrace_python_sdk.constants.instrumentation.common import (
 )
 from langtrace_python_sdk.constants.instrumentation.litellm import APIS
 from langtrace_python_sdk.utils.llm import (
-    calculate_prompt_tokens,
-    get_base_url,
+    estimate_chat_prompt_tokens,
     get_extra_attributes,
     get_langtrace_attributes,
     get_llm_request_attributes,
     get_span_name,
     get_tool_calls,
     is_streaming,
+    is_usage_requested,
     set_event_completion,
     StreamWrapper,
     set_span_attributes,
 )
+from langtrace_python_sdk.utils.stream_processors import OpenAIChunkProcessor
 from langtrace_python_sdk.types import NOT_GIVEN
 
 from langtrace_python_sdk.instrumentation.openai.types import (
@@ -88,6 +91,11 @@ def images_generate(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": getattr(data, "url", ""),
                                 "revised_prompt": getattr(data, "revised_prompt", ""),
+                                "base64": (
+                                    describe_base64(data.b64_json)
+                                    if getattr(data, "b64_json", None)
+                                    else None
+                                ),
                             },
                         }
                     ]
@@ -149,6 +157,11 @@ def async_images_generate(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": getattr(data, "url", ""),
                                 "revised_prompt": getattr(data, "revised_prompt", ""),
+                                "base64": (
+                                    describe_base64(data.b64_json)
+                                    if getattr(data, "b64_json", None)
+                                    else None
+                                ),
                             },
                         }
                     ]
@@ -210,7 +223,11 @@ def images_edit(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": each_data.url,
                                 "revised_prompt": each_data.revised_prompt,
-                                "base64": each_data.b64_json,
+                                "base64": (
+                                    describe_base64(each_data.b64_json)
+                                    if each_data.b64_json
+                                    else None
+                                ),
                             },
                         }
                     )
@@ -241,15 +258,9 @@ def chat_completions_create(version: str, tracer: Tracer) -> Callable:
         args: List[Any],
         kwargs: ChatCompletionsCreateKwargs,
     ) -> Any:
-        service_provider = SERVICE_PROVIDERS["LITELLM"]
-        if "perplexity" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "groq" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["GROQ"]
-        elif "x.ai" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["XAI"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["LITELLM"]
+        )
         llm_prompts = []
         for item in kwargs.get("messages", []):
             tools = get_tool_calls(item)
@@ -290,24 +301,18 @@ def chat_completions_create(version: str, tracer: Tracer) -> Callable:
         try:
             result = wrapped(*args, **kwargs)
             if is_streaming(kwargs):
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps(str(message)), kwargs.get("model")
-                    )
+                messages = list(kwargs.get("messages") or [])
                 functions = kwargs.get("functions")
-                if functions is not None and functions != NOT_GIVEN:
-                    for function in functions:
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
                 return StreamWrapper(
                     result,
                     span,
-                    prompt_tokens,
+                    prompt_tokens_estimator=lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
+                    usage_requested=is_usage_requested(kwargs),
+                    chunk_processor=OpenAIChunkProcessor(),
                 )
             else:
                 _set_response_attributes(span, result)
@@ -333,13 +338,9 @@ def async_chat_completions_create(version: str, tracer: Tracer) -> Callable:
         args: List[Any],
         kwargs: ChatCompletionsCreateKwargs,
     ) -> Awaitable[Any]:
-        service_provider = SERVICE_PROVIDERS["LITELLM"]
-        if "perplexity" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "x.ai" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["XAI"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["LITELLM"]
+        )
         llm_prompts = []
         for item in kwargs.get("messages", []):
             tools = get_tool_calls(item)
@@ -380,25 +381,18 @@ def async_chat_completions_create(version: str, tracer: Tracer) -> Callable:
         try:
             result = await wrapped(*args, **kwargs)
             if is_streaming(kwargs):
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps((str(message))), kwargs.get("model")
-                    )
-
+                messages = list(kwargs.get("messages") or [])
                 functions = kwargs.get("functions")
-                if functions is not None and functions != NOT_GIVEN:
-                    for function in functions:
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
                 return StreamWrapper(
                     result,
                     span,
-                    prompt_tokens,
+                    prompt_tokens_estimator=lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
+                    usage_requested=is_usage_requested(kwargs),
+                    chunk_processor=OpenAIChunkProcessor(),
                 )  # type: ignore
             else:
                 _set_response_attributes(span, result)
@@ -23,6 +23,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_module_classes
 from langtrace_python_sdk.instrumentation.llamaindex.patch import generic_patch
 
 logging.basicConfig(level=logging.FATAL)
@@ -51,6 +52,7 @@ class LlamaindexInstrumentation(BaseInstrumentor):
             ("llama_index.core.chat_engine", "achat", "chat"),
         ]
 
+        self._patched_modules = [module_name for module_name, *_ in modules_to_patch]
         for module_name, method, task in modules_to_patch:
             module = importlib.import_module(module_name)
             for name, obj in inspect.getmembers(
@@ -77,4 +79,5 @@ class LlamaindexInstrumentation(BaseInstrumentor):
         pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        for module_name in getattr(self, "_patched_modules", []):
+            unwrap_module_classes(module_name)
@@ -5,6 +5,7 @@ from typing import Collection
 from importlib_metadata import version as v
 from wrapt import wrap_function_wrapper as _W
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.constants.instrumentation.milvus import APIS
 from .patch import generic_patch
 
@@ -26,4 +27,5 @@ class MilvusInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for api in APIS.values():
+            unwrap_method(api["MODULE"], api["METHOD"])
@@ -1,5 +1,8 @@
 from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+from langtrace_python_sdk.utils.score_stats import set_score_stats_attributes
 from langtrace_python_sdk.utils.silently_fail import silently_fail
+from langtrace_python_sdk.utils.vector_summary import get_vector_attributes
 from opentelemetry.trace import Tracer
 from opentelemetry.trace import SpanKind
 from langtrace_python_sdk.utils import handle_span_error, set_span_attribute
@@ -10,6 +13,9 @@ from langtrace_python_sdk.utils.llm import (
 )
 import json
 
+# Default primary key field names of Milvus collections
+QUERY_KEY_FIELDS = ("id", "pk")
+
 
 def generic_patch(api, version: str, tracer: Tracer):
     def traced_method(wrapped, instance, args, kwargs):
@@ -84,6 +90,7 @@ def set_search_attributes(span_attributes, kwargs):
     partition_names = kwargs.get("partition_names")
     anns_field = kwargs.get("anns_field")
     span_attributes["db.num_queries"] = len(data) if data else None
+    span_attributes.update(get_vector_attributes("db.query.vectors", data))
     span_attributes["db.filter"] = filter
     span_attributes["db.limit"] = limit
     span_attributes["db.output_fields"] = json.dumps(output_fields)
@@ -111,22 +118,31 @@ def set_query_attributes(span_attributes, kwargs):
 @silently_fail
 def set_query_response_attributes(span, result):
     set_span_attribute(span, name="db.num_matches", value=len(result))
-    for match in result:
+    for match in result_capture_policy.top(result):
+        # The primary key is kept as the id of the match, even in scores mode
+        keys = {name: match[name] for name in QUERY_KEY_FIELDS if name in match}
+        fields = {name: value for name, value in match.items() if name not in keys}
         span.add_event(
             "db.query.match",
-            attributes=match,
+            attributes=result_capture_policy.match_attributes(
+                keys, result_capture_policy.select_fields(fields)
+            ),
         )
 
 
 @silently_fail
 def set_search_response_attributes(span, result):
+    if result:
+        # Only the distribution of the first query is recorded
+        set_score_stats_attributes(
+            span, "db.search.distances", [match["distance"] for match in result[0]]
+        )
     for res in result:
-        for match in res:
+        for match in result_capture_policy.top(res):
             span.add_event(
                 "db.search.match",
-                attributes={
-                    "id": match["id"],
-                    "distance": str(match["distance"]),
-                    "entity": json.dumps(match["entity"]),
-                },
+                attributes=result_capture_policy.match_attributes(
+                    {"id": match["id"], "distance": str(match["distance"])},
+                    {"entity": match["entity"]},
+                ),
             )
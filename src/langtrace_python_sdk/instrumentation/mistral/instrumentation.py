@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.mistral.patch import (
     chat_complete,
     embeddings_create,
@@ -70,4 +71,8 @@ class MistralInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
\ No newline at end of file
+        unwrap_method("mistralai.chat", "Chat.complete")
+        unwrap_method("mistralai.chat", "Chat.stream")
+        unwrap_method("mistralai.chat", "Chat.complete_async")
+        unwrap_method("mistralai.embeddings", "Embeddings.create")
+        unwrap_method("mistralai.embeddings", "Embeddings.create_async")
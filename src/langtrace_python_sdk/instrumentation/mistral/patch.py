@@ -41,6 +41,7 @@ from langtrace_python_sdk.utils.llm import (
     set_span_attributes,
     set_usage_attributes,
 )
+from langtrace_python_sdk.utils.stream_processors import MistralChunkProcessor
 
 from langtrace_python_sdk.instrumentation.openai.patch import extract_content
 
@@ -80,6 +81,7 @@ def chat_complete(original_method, version, tracer, is_async=False, is_streaming
                     span,
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
+                    chunk_processor=MistralChunkProcessor(),
                 )
             else:
                 _set_response_attributes(span, kwargs, result)
@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.constants.instrumentation.neo4j import APIS
 from langtrace_python_sdk.instrumentation.neo4j.patch import driver_patch
 
@@ -48,4 +49,4 @@ class Neo4jInstrumentation(BaseInstrumentor):
         )
 
     def _uninstrument(self, **kwargs):
-        pass
\ No newline at end of file
+        unwrap_method("neo4j._sync.driver", "Driver.execute_query")
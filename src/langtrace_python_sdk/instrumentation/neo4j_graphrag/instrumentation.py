@@ -18,6 +18,8 @@ from typing import Collection
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry import trace
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from importlib.metadata import version as v
 from .patch import patch_graphrag_search, patch_kg_pipeline_run, \
 patch_kg_pipeline_run, patch_retriever_search
@@ -59,4 +61,6 @@ class Neo4jGraphRAGInstrumentation(BaseInstrumentor):
             print(f"Failed to instrument Neo4j GraphRAG: {e}")
 
     def _uninstrument(self, **kwargs):
-        pass
\ No newline at end of file
+        unwrap_method("neo4j_graphrag.experimental.pipeline.kg_builder", "SimpleKGPipeline.run_async")
+        unwrap_method("neo4j_graphrag.generation.graphrag", "GraphRAG.search")
+        unwrap_method("neo4j_graphrag.retrievers.vector", "VectorRetriever.get_search_results")
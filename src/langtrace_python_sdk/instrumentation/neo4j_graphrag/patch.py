@@ -27,6 +27,7 @@ from langtrace_python_sdk.constants.instrumentation.common import (
     LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY, SERVICE_PROVIDERS)
 from langtrace_python_sdk.utils.llm import set_span_attributes
 from langtrace_python_sdk.utils.misc import serialize_args, serialize_kwargs
+from langtrace_python_sdk.utils.serialize import to_json
 
 
 def patch_kg_pipeline_run(operation_name: str, version: str, tracer: Tracer):
@@ -78,10 +79,10 @@ def patch_kg_pipeline_run(operation_name: str, version: str, tracer: Tracer):
                     try:
                         if hasattr(result, "to_dict"):
                             result_dict = result.to_dict()
-                            span.set_attribute("neo4j.pipeline.result", json.dumps(result_dict))
+                            span.set_attribute("neo4j.pipeline.result", to_json(result_dict))
                         elif hasattr(result, "model_dump"):
                             result_dict = result.model_dump()
-                            span.set_attribute("neo4j.pipeline.result", json.dumps(result_dict))
+                            span.set_attribute("neo4j.pipeline.result", to_json(result_dict))
                     except Exception as e:
                         span.set_attribute("neo4j.pipeline.result_error", str(e))
                 
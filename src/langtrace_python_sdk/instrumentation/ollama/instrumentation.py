@@ -17,6 +17,8 @@ limitations under the License.
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper as _W
+
+from langtrace_python_sdk.utils import unwrap_method
 from typing import Collection
 from importlib_metadata import version as v
 from langtrace_python_sdk.constants.instrumentation.ollama import APIS
@@ -55,4 +57,8 @@ class OllamaInstrumentor(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for details in APIS.values():
+            operation = details["METHOD"]
+            unwrap_method("ollama._client", f"Client.{operation}")
+            unwrap_method("ollama._client", f"AsyncClient.{operation}")
+            unwrap_method("ollama", operation)
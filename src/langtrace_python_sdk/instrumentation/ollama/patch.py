@@ -9,6 +9,7 @@ from langtrace_python_sdk.utils.llm import (
     get_span_name,
     set_event_completion,
 )
+from langtrace_python_sdk.utils.stream_processors import OllamaChunkProcessor
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
 from langtrace.trace_attributes import LLMSpanAttributes, Event
@@ -45,7 +46,9 @@ def generic_patch(operation_name, version, tracer: Tracer):
         try:
             result = wrapped(*args, **kwargs)
             if kwargs.get("stream"):
-                return StreamWrapper(result, span)
+                return StreamWrapper(
+                    result, span, chunk_processor=OllamaChunkProcessor()
+                )
             else:
                 _set_response_attributes(span, result)
             return result
@@ -84,7 +87,9 @@ def ageneric_patch(operation_name, version, tracer):
         try:
             result = await wrapped(*args, **kwargs)
             if kwargs.get("stream"):
-                return StreamWrapper(result, span)
+                return StreamWrapper(
+                    result, span, chunk_processor=OllamaChunkProcessor()
+                )
             else:
                 _set_response_attributes(span, result)
             span.end()
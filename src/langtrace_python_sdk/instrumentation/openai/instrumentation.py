@@ -19,6 +19,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer, TracerProvider
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.instrumentation.openai.patch import (
     async_chat_completions_create,
     async_embeddings_create,
@@ -99,4 +100,12 @@ class OpenAIInstrumentation(BaseInstrumentor):  # type: ignore
         )
 
     def _uninstrument(self, **kwargs: Any) -> None:
-        pass
+        unwrap_method("openai.resources.chat.completions", "Completions.create")
+        unwrap_method("openai.resources.chat.completions", "AsyncCompletions.create")
+        unwrap_method("openai.resources.responses", "AsyncResponses.create")
+        unwrap_method("openai.resources.responses", "Responses.create")
+        unwrap_method("openai.resources.images", "Images.generate")
+        unwrap_method("openai.resources.images", "AsyncImages.generate")
+        unwrap_method("openai.resources.images", "Images.edit")
+        unwrap_method("openai.resources.embeddings", "Embeddings.create")
+        unwrap_method("openai.resources.embeddings", "AsyncEmbeddings.create")
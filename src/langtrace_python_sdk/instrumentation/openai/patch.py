@@ -19,10 +19,10 @@ from langtrace_python_sdk.instrumentation.openai.types import (
 )
 from langtrace_python_sdk.types import NOT_GIVEN
 from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.binary_payloads import describe_base64
 from langtrace_python_sdk.utils.llm import (
     StreamWrapper,
-    calculate_prompt_tokens,
-    get_base_url,
+    estimate_chat_prompt_tokens,
     get_extra_attributes,
     get_langtrace_attributes,
     get_llm_request_attributes,
@@ -30,10 +30,16 @@ from langtrace_python_sdk.utils.llm import (
     get_span_name,
     get_tool_calls,
     is_streaming,
+    is_usage_requested,
     set_event_completion,
     set_span_attributes,
     set_usage_attributes,
 )
+from langtrace_python_sdk.utils.stream_processors import (
+    OpenAIChunkProcessor,
+    OpenAIResponsesChunkProcessor,
+)
+from langtrace_python_sdk.utils.provider_registry import provider_registry
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 
 
@@ -111,7 +117,11 @@ def openai_responses_create(version: str, tracer: Tracer) -> Callable:
 
                 response = wrapped(*args, **kwargs)
                 if is_streaming(kwargs) and span.is_recording():
-                    return StreamWrapper(response, span)
+                    return StreamWrapper(
+                        response,
+                        span,
+                        chunk_processor=OpenAIResponsesChunkProcessor(),
+                    )
                 else:
                     _set_openai_agentic_response_attributes(span, response)
                     
@@ -174,6 +184,11 @@ def images_generate(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": getattr(data, "url", ""),
                                 "revised_prompt": getattr(data, "revised_prompt", ""),
+                                "base64": (
+                                    describe_base64(data.b64_json)
+                                    if getattr(data, "b64_json", None)
+                                    else None
+                                ),
                             },
                         }
                     ]
@@ -235,6 +250,11 @@ def async_images_generate(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": getattr(data, "url", ""),
                                 "revised_prompt": getattr(data, "revised_prompt", ""),
+                                "base64": (
+                                    describe_base64(data.b64_json)
+                                    if getattr(data, "b64_json", None)
+                                    else None
+                                ),
                             },
                         }
                     ]
@@ -296,7 +316,11 @@ def images_edit(version: str, tracer: Tracer) -> Callable:
                             "content": {
                                 "url": each_data.url,
                                 "revised_prompt": each_data.revised_prompt,
-                                "base64": each_data.b64_json,
+                                "base64": (
+                                    describe_base64(each_data.b64_json)
+                                    if each_data.b64_json
+                                    else None
+                                ),
                             },
                         }
                     )
@@ -327,19 +351,9 @@ def chat_completions_create(version: str, tracer: Tracer) -> Callable:
         args: List[Any],
         kwargs: ChatCompletionsCreateKwargs,
     ) -> Any:
-        service_provider = SERVICE_PROVIDERS["OPENAI"]
-        if "perplexity" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "groq" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["GROQ"]
-        elif "x.ai" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["XAI"]
-        elif "deepseek" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["DEEPSEEK"]
-        elif ":12000" in get_base_url(instance) or ":10000" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["ARCH"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["OPENAI"]
+        )
         llm_prompts = []
         for item in kwargs.get("messages", []):
             tools = get_tool_calls(item)
@@ -380,24 +394,18 @@ def chat_completions_create(version: str, tracer: Tracer) -> Callable:
         try:
             result = wrapped(*args, **kwargs)
             if is_streaming(kwargs):
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps(str(message)), kwargs.get("model")
-                    )
+                messages = list(kwargs.get("messages") or [])
                 functions = kwargs.get("functions")
-                if functions is not None and functions != NOT_GIVEN:
-                    for function in functions:
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
                 return StreamWrapper(
                     result,
                     span,
-                    prompt_tokens,
+                    prompt_tokens_estimator=lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
+                    usage_requested=is_usage_requested(kwargs),
+                    chunk_processor=OpenAIChunkProcessor(),
                 )
             else:
                 _set_response_attributes(span, result)
@@ -423,19 +431,9 @@ def async_chat_completions_create(version: str, tracer: Tracer) -> Callable:
         args: List[Any],
         kwargs: ChatCompletionsCreateKwargs,
     ) -> Awaitable[Any]:
-        service_provider = SERVICE_PROVIDERS["OPENAI"]
-        if "perplexity" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "groq" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["GROQ"]
-        elif "x.ai" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["XAI"]
-        elif "deepseek" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["DEEPSEEK"]
-        elif ":12000" in get_base_url(instance) or ":10000" in get_base_url(instance):
-            service_provider = SERVICE_PROVIDERS["ARCH"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["OPENAI"]
+        )
         llm_prompts = []
         for item in kwargs.get("messages", []):
             tools = get_tool_calls(item)
@@ -476,25 +474,18 @@ def async_chat_completions_create(version: str, tracer: Tracer) -> Callable:
         try:
             result = await wrapped(*args, **kwargs)
             if is_streaming(kwargs):
-                prompt_tokens = 0
-                for message in kwargs.get("messages", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps((str(message))), kwargs.get("model")
-                    )
-
+                messages = list(kwargs.get("messages") or [])
                 functions = kwargs.get("functions")
-                if functions is not None and functions != NOT_GIVEN:
-                    for function in functions:
-                        prompt_tokens += calculate_prompt_tokens(
-                            json.dumps(function), kwargs.get("model")
-                        )
-
                 return StreamWrapper(
                     result,
                     span,
-                    prompt_tokens,
+                    prompt_tokens_estimator=lambda: estimate_chat_prompt_tokens(
+                        messages, functions, kwargs.get("model")
+                    ),
                     function_call=kwargs.get("functions") is not None,
                     tool_calls=kwargs.get("tools") is not None,
+                    usage_requested=is_usage_requested(kwargs),
+                    chunk_processor=OpenAIChunkProcessor(),
                 )  # type: ignore
             else:
                 _set_response_attributes(span, result)
@@ -522,21 +513,9 @@ def embeddings_create(version: str, tracer: Tracer) -> Callable:
         args: List[Any],
         kwargs: EmbeddingsCreateKwargs,
     ) -> Any:
-        service_provider = SERVICE_PROVIDERS["OPENAI"]
-        base_url = get_base_url(instance)
-
-        if "perplexity" in base_url:
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in base_url:
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "groq" in base_url:
-            service_provider = SERVICE_PROVIDERS["GROQ"]
-        elif "x.ai" in base_url:
-            service_provider = SERVICE_PROVIDERS["XAI"]
-        elif "deepseek" in base_url:
-            service_provider = SERVICE_PROVIDERS["DEEPSEEK"]
-        elif ":12000" in base_url or ":10000" in base_url:
-            service_provider = SERVICE_PROVIDERS["ARCH"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["OPENAI"]
+        )
 
         span_attributes = {
             **get_langtrace_attributes(version, service_provider, vendor_type="llm"),
@@ -611,20 +590,9 @@ def async_embeddings_create(version: str, tracer: Tracer) -> Callable:
         kwargs: EmbeddingsCreateKwargs,
     ) -> Awaitable[Any]:
 
-        service_provider = SERVICE_PROVIDERS["OPENAI"]
-        base_url = get_base_url(instance)
-        if "perplexity" in base_url:
-            service_provider = SERVICE_PROVIDERS["PPLX"]
-        elif "azure" in base_url:
-            service_provider = SERVICE_PROVIDERS["AZURE"]
-        elif "groq" in base_url:
-            service_provider = SERVICE_PROVIDERS["GROQ"]
-        elif "x.ai" in base_url:
-            service_provider = SERVICE_PROVIDERS["XAI"]
-        elif "deepseek" in base_url:
-            service_provider = SERVICE_PROVIDERS["DEEPSEEK"]
-        elif ":12000" in base_url or ":10000" in base_url:
-            service_provider = SERVICE_PROVIDERS["ARCH"]
+        service_provider = provider_registry.resolve(
+            instance, SERVICE_PROVIDERS["OPENAI"]
+        )
 
         span_attributes = {
             **get_langtrace_attributes(version, service_provider, vendor_type="llm"),
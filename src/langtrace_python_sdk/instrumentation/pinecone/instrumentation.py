@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.constants.instrumentation.pinecone import APIS
 from langtrace_python_sdk.instrumentation.pinecone.patch import generic_patch
 
@@ -49,4 +50,5 @@ class PineconeInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for details in APIS.values():
+            unwrap_method("pinecone.data.index", f"Index.{details['OPERATION']}")
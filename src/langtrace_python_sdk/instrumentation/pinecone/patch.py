@@ -28,7 +28,13 @@ from langtrace_python_sdk.constants.instrumentation.common import (
 )
 from langtrace_python_sdk.constants.instrumentation.pinecone import APIS
 from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+from langtrace_python_sdk.utils.score_stats import set_score_stats_attributes
 from langtrace_python_sdk.utils.silently_fail import silently_fail
+from langtrace_python_sdk.utils.vector_summary import (
+    serialize_request,
+    set_vector_attributes,
+)
 from importlib_metadata import version as v
 
 from langtrace_python_sdk.constants import LANGTRACE_SDK_NAME
@@ -51,7 +57,7 @@ def generic_patch(operation_name, version, tracer):
             "langtrace.version": v(LANGTRACE_SDK_NAME),
             "db.system": "pinecone",
             "db.operation": api["OPERATION"],
-            "db.query": json.dumps(kwargs.get("query")),
+            "db.query": serialize_request(kwargs.get("query")),
             **(extra_attributes if extra_attributes is not None else {}),
         }
 
@@ -94,6 +100,7 @@ def generic_patch(operation_name, version, tracer):
         set_span_attribute(span, "db.query.top_k", kwargs.get("top_k"))
         set_span_attribute(span, "db.query.namespace", kwargs.get("namespace"))
         set_span_attribute(span, "db.query.id", kwargs.get("id"))
+        set_vector_attributes(span, "db.query.vector", kwargs.get("vector"))
         filter = (
             json.dumps(kwargs.get("filter"))
             if isinstance(kwargs.get("filter"), dict)
@@ -112,15 +119,20 @@ def generic_patch(operation_name, version, tracer):
         matches = response.get("matches")
 
         usage = response.get("usage")
-        for match in matches:
+        set_span_attribute(span, "db.query.matches", len(matches))
+        set_score_stats_attributes(
+            span, "db.query.scores", [match.get("score") for match in matches]
+        )
+        for match in result_capture_policy.top(matches):
             span.add_event(
                 name="db.query.match",
-                attributes={
-                    "db.query.match.id": match.get("id"),
-                    "db.query.match.score": match.get("score"),
-                    "db.query.match.metadata": match.get("metadata"),
-                    # "db.query.match.values": match.get("values"),
-                },
+                attributes=result_capture_policy.match_attributes(
+                    {
+                        "db.query.match.id": match.get("id"),
+                        "db.query.match.score": match.get("score"),
+                    },
+                    {"db.query.match.metadata": match.get("metadata")},
+                ),
             )
 
         if "read_units" in usage:
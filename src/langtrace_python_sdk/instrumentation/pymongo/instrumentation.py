@@ -20,6 +20,7 @@ from opentelemetry.trace import get_tracer
 from typing import Collection
 from importlib_metadata import version as v
 from wrapt import wrap_function_wrapper as _W
+from langtrace_python_sdk.utils import unwrap_method
 from .patch import generic_patch
 from langtrace_python_sdk.constants.instrumentation.pymongo import APIS
 
@@ -44,4 +45,5 @@ class PyMongoInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for api in APIS.values():
+            unwrap_method(api["MODULE"], api["METHOD"])
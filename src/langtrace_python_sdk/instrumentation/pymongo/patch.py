@@ -5,11 +5,16 @@ from langtrace_python_sdk.utils.llm import (
     set_span_attribute,
 )
 from langtrace_python_sdk.utils import deduce_args_and_kwargs, handle_span_error
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+from langtrace_python_sdk.utils.vector_summary import set_vector_attributes
 from opentelemetry.trace import SpanKind
 from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
 from langtrace.trace_attributes import DatabaseSpanAttributes
+from opentelemetry.trace.status import StatusCode
+from wrapt import ObjectProxy
 
 import json
+import weakref
 
 
 def generic_patch(name, version, tracer):
@@ -28,30 +33,155 @@ def generic_patch(name, version, tracer):
         attributes = DatabaseSpanAttributes(**span_attributes)
 
         with tracer.start_as_current_span(
-            get_span_name(name), kind=SpanKind.CLIENT
+            get_span_name(name), kind=SpanKind.CLIENT, end_on_exit=False
         ) as span:
+            excluded_fields = set()
             if span.is_recording():
-                set_input_attributes(
-                    span, deduce_args_and_kwargs(wrapped, *args, **kwargs)
-                )
+                arguments = deduce_args_and_kwargs(wrapped, *args, **kwargs)
+                set_input_attributes(span, arguments)
                 set_span_attributes(span, attributes)
+                excluded_fields = get_vector_paths(arguments)
 
             try:
                 result = wrapped(*args, **kwargs)
-                for doc in result:
-                    if span.is_recording():
-                        span.add_event(
-                            name="db.query.match",
-                            attributes={**doc},
-                        )
-                return result
             except Exception as err:
                 handle_span_error(span, err)
                 raise
 
+            if not span.is_recording():
+                span.end()
+                return result
+            # Matches are recorded as the application iterates the cursor
+            return TracedCommandCursor(result, span, excluded_fields)
+
     return traced_method
 
 
+class TracedCommandCursor(ObjectProxy):
+    """
+    Records the first matches of an aggregate cursor as `db.query.match` events
+    while the caller iterates it, and ends the span once the cursor is exhausted,
+    closed or garbage collected.
+    """
+
+    def __init__(self, cursor, span, excluded_fields=()):
+        super().__init__(cursor)
+        self._self_span = span
+        self._self_excluded_fields = excluded_fields
+        self._self_matches = 0
+        self._self_finished = False
+        # Ends the span if the cursor is dropped before it is exhausted or closed
+        self._self_finalizer = weakref.finalize(self, _end_abandoned_cursor_span, span)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            doc = self.__wrapped__.next()
+        except StopIteration:
+            self._finish()
+            raise
+        except Exception as err:
+            self._finish(err)
+            raise
+        self._record_match(doc)
+        return doc
+
+    next = __next__
+
+    def try_next(self):
+        try:
+            doc = self.__wrapped__.try_next()
+        except Exception as err:
+            self._finish(err)
+            raise
+        if doc is not None:
+            self._record_match(doc)
+        elif not self.__wrapped__.alive:
+            self._finish()
+        return doc
+
+    def to_list(self, *args, **kwargs):
+        docs = self.__wrapped__.to_list(*args, **kwargs)
+        for doc in docs[: result_capture_policy.max_matches - self._self_matches]:
+            self._record_match(doc)
+        if not self.__wrapped__.alive:
+            self._finish()
+        return docs
+
+    def close(self):
+        self.__wrapped__.close()
+        self._finish()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _record_match(self, doc):
+        if self._self_matches >= result_capture_policy.max_matches:
+            return
+        self._self_matches += 1
+        fields = result_capture_policy.select_fields(
+            select_match_fields(doc, self._self_excluded_fields), keep=MATCH_KEY_FIELDS
+        )
+        key_attributes = {
+            key: fields.pop(key) for key in MATCH_KEY_FIELDS if key in fields
+        }
+        self._self_span.add_event(
+            name="db.query.match",
+            attributes=result_capture_policy.match_attributes(key_attributes, fields),
+        )
+
+    def _finish(self, error=None):
+        if self._self_finished:
+            return
+        self._self_finished = True
+        self._self_finalizer.detach()
+        if error is not None:
+            handle_span_error(self._self_span, error)
+            return
+        set_span_attribute(self._self_span, "db.query.matches", self._self_matches)
+        self._self_span.set_status(StatusCode.OK)
+        self._self_span.end()
+
+
+def _end_abandoned_cursor_span(span):
+    if span.is_recording():
+        span.set_attribute("db.query.cursor.status", "abandoned")
+        span.end()
+
+
+# Recorded even when only scores are captured
+MATCH_KEY_FIELDS = ("_id", "score")
+
+
+def select_match_fields(doc, excluded_fields=()):
+    """
+    Keep the scalar fields of a matched document, skipping embeddings and nested
+    values so a large vector never ends up on an event."""
+    attributes = {}
+    for key, value in doc.items():
+        if key in excluded_fields:
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            attributes[key] = value
+        elif key == "_id":
+            attributes[key] = str(value)
+    return attributes
+
+
+def get_vector_paths(args):
+    paths = set()
+    for stage in args.get("pipeline", None) or []:
+        vector_search = stage.get("$vectorSearch")
+        if isinstance(vector_search, dict) and vector_search.get("path"):
+            paths.add(vector_search["path"])
+    return paths
+
+
 def set_input_attributes(span, args):
     pipeline = args.get("pipeline", None)
     for stage in pipeline:
@@ -61,5 +191,6 @@ def set_input_attributes(span, args):
                 set_span_attribute(span, "db.path", v.get("path", None))
                 set_span_attribute(span, "db.top_k", v.get("numCandidates"))
                 set_span_attribute(span, "db.limit", v.get("limit"))
+                set_vector_attributes(span, "db.query.vector", v.get("queryVector"))
             else:
                 set_span_attribute(span, k, json.dumps(v))
@@ -14,11 +14,15 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import json
 from langtrace.trace_attributes import DatabaseSpanAttributes
 from langtrace_python_sdk.utils.llm import get_span_name
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.score_stats import set_score_stats_attributes
+from langtrace_python_sdk.utils.vector_summary import (
+    serialize_request,
+    set_vector_attributes,
+)
 from opentelemetry import baggage, trace
 from opentelemetry.trace import SpanKind
 from opentelemetry.trace.status import Status, StatusCode
@@ -52,7 +56,7 @@ def collection_patch(method, version, tracer):
             "langtrace.version": v(LANGTRACE_SDK_NAME),
             "db.system": "qdrant",
             "db.operation": api["OPERATION"],
-            "db.query": json.dumps(kwargs.get("query")),
+            "db.query": serialize_request(kwargs.get("query")),
             **(extra_attributes if extra_attributes is not None else {}),
         }
 
@@ -89,6 +93,8 @@ def collection_patch(method, version, tracer):
             try:
                 # Attempt to call the original method
                 result = wrapped(*args, **kwargs)
+                if operation in ["query", "discover", "recommend", "search"]:
+                    _set_search_response_attributes(span, result)
                 span.set_status(StatusCode.OK)
                 return result
             except Exception as err:
@@ -131,6 +137,16 @@ def _set_upload_attributes(span, args, kwargs, field):
 def _set_search_attributes(span, args, kwargs):
     limit = kwargs.get("limit") or 10
     set_span_attribute(span, "db.query.top_k", limit)
+    set_vector_attributes(span, "db.query.vector", kwargs.get("query_vector"))
+
+
+@silently_fail
+def _set_search_response_attributes(span, result):
+    # query_points wraps the scored points in a QueryResponse
+    points = getattr(result, "points", result)
+    set_score_stats_attributes(
+        span, "db.query.scores", [getattr(point, "score", None) for point in points]
+    )
 
 
 @silently_fail
@@ -5,7 +5,7 @@ from wrapt import wrap_function_wrapper as _W
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from .patch import patch_vertexai
-from langtrace_python_sdk.utils import is_package_installed
+from langtrace_python_sdk.utils import is_package_installed, unwrap_method
 
 
 class VertexAIInstrumentation(BaseInstrumentor):
@@ -38,4 +38,8 @@ class VertexAIInstrumentation(BaseInstrumentor):
             )
 
     def _uninstrument(self, **kwargs):
-        pass
+        for _, api_config in APIS.items():
+            unwrap_method(
+                api_config.get("module"),
+                f"{api_config.get('method')}.{api_config.get('operation')}",
+            )
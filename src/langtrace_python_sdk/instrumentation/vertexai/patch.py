@@ -3,7 +3,7 @@ from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVID
 
 
 from langtrace_python_sdk.utils.llm import (
-    calculate_prompt_tokens,
+    estimate_chat_prompt_tokens,
     get_extra_attributes,
     get_langtrace_attributes,
     get_llm_request_attributes,
@@ -14,6 +14,7 @@ from langtrace_python_sdk.utils.llm import (
     set_usage_attributes,
     StreamWrapper,
 )
+from langtrace_python_sdk.utils.stream_processors import VertexAIChunkProcessor
 from langtrace.trace_attributes import LLMSpanAttributes, SpanAttributes
 from langtrace_python_sdk.utils.silently_fail import silently_fail
 from opentelemetry.trace import Tracer, SpanKind, Span
@@ -50,13 +51,15 @@ def patch_vertexai(name, version, tracer: Tracer):
             set_span_attributes(span, attributes)
             result = wrapped(*args, **kwargs)
             if is_streaming_response(result):
-                prompt_tokens = 0
-                for message in kwargs.get("message", {}):
-                    prompt_tokens += calculate_prompt_tokens(
-                        json.dumps(message), kwargs.get("model")
-                    )
+                message = kwargs.get("message")
+                messages = [message] if isinstance(message, str) else message
                 return StreamWrapper(
-                    stream=result, span=span, prompt_tokens=prompt_tokens
+                    stream=result,
+                    span=span,
+                    prompt_tokens_estimator=lambda: estimate_chat_prompt_tokens(
+                        messages, None, kwargs.get("model")
+                    ),
+                    chunk_processor=VertexAIChunkProcessor(),
                 )
             else:
                 set_response_attributes(span, result)
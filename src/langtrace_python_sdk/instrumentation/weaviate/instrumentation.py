@@ -22,6 +22,7 @@ from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.trace import get_tracer
 from wrapt import wrap_function_wrapper
 
+from langtrace_python_sdk.utils import unwrap_method
 from langtrace_python_sdk.constants.instrumentation.weaviate import APIS
 from langtrace_python_sdk.instrumentation.weaviate.patch import (
     generic_collection_patch,
@@ -64,4 +65,5 @@ class WeaviateInstrumentation(BaseInstrumentor):
         pass
 
     def _uninstrument(self, **kwargs):
-        pass
+        for api_config in APIS.values():
+            unwrap_method(api_config["MODULE"], api_config["METHOD"])
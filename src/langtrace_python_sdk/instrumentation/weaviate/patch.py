@@ -30,6 +30,9 @@ from langtrace_python_sdk.constants.instrumentation.common import (
 from langtrace_python_sdk.constants.instrumentation.weaviate import APIS
 from langtrace_python_sdk.utils.llm import get_span_name
 from langtrace_python_sdk.utils.misc import extract_input_params, to_iso_format
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+from langtrace_python_sdk.utils.score_stats import set_score_stats_attributes
+from langtrace_python_sdk.utils.vector_summary import serialize_request
 
 # Predefined metadata response attributes
 METADATA_ATTRIBUTES = [
@@ -88,7 +91,7 @@ def aggregate_responses(result):
     all_responses = []
 
     if hasattr(result, "objects") and result.objects is not None:
-        for each_obj in result.objects:
+        for each_obj in result_capture_policy.top(result.objects):
             # Loop for multiple object responses
             response_attributes = get_response_object_attributes(each_obj)
             all_responses.append(response_attributes)
@@ -99,28 +102,46 @@ def aggregate_responses(result):
     return json.dumps(all_responses, default=str)
 
 
+def get_match_scores(result):
+    """
+    Hybrid and BM25 queries rank by score, vector queries by distance."""
+    scores = []
+    for each_obj in getattr(result, "objects", None) or []:
+        metadata = getattr(each_obj, "metadata", None)
+        score = getattr(metadata, "score", None)
+        if score is None:
+            score = getattr(metadata, "distance", None)
+        scores.append(score)
+    return scores
+
+
 def get_response_object_attributes(response_object):
     def convert_value(value):
         if isinstance(value, datetime):
             return value.isoformat()
         return value
 
-    response_attributes = {
-        **{k: convert_value(v) for k, v in response_object.properties.items()},
-        "uuid": str(response_object.uuid) if hasattr(response_object, "uuid") else None,
-        "collection": getattr(response_object, "collection", None),
-        # "vector": getattr(response_object, "vector", None),
-        "references": getattr(response_object, "references", None),
-        "metadata": (
-            extract_metadata(response_object.metadata)
-            if hasattr(response_object, "metadata")
-            else None
-        ),
-    }
-    response_attributes = {
-        k: v for k, v in response_attributes.items() if v is not None
-    }
-    return response_attributes
+    properties = result_capture_policy.select_fields(response_object.properties)
+    return result_capture_policy.match_attributes(
+        {
+            "uuid": (
+                str(response_object.uuid) if hasattr(response_object, "uuid") else None
+            ),
+            "metadata": (
+                extract_metadata(response_object.metadata)
+                if hasattr(response_object, "metadata")
+                else None
+            ),
+        },
+        {
+            **{k: convert_value(v) for k, v in properties.items()},
+            "collection": getattr(response_object, "collection", None),
+            # "vector": getattr(response_object, "vector", None),
+            "references": getattr(response_object, "references", None),
+        },
+        # The matches are encoded once, together, by aggregate_responses
+        encode_values=False,
+    )
 
 
 def create_traced_method(method_name, version, tracer, get_collection_name=None):
@@ -144,7 +165,7 @@ def create_traced_method(method_name, version, tracer, get_collection_name=None)
             "db.system": "weaviate",
             "db.operation": api["OPERATION"],
             "db.collection.name": collection_name,
-            "db.query": json.dumps(extract_inputs(args, kwargs)),
+            "db.query": serialize_request(extract_inputs(args, kwargs)),
             **(extra_attributes if extra_attributes is not None else {}),
         }
 
@@ -162,6 +183,9 @@ def create_traced_method(method_name, version, tracer, get_collection_name=None)
                 # Attempt to call the original method
                 result = wrapped(*args, **kwargs)
                 if api["OPERATION"] in ["query", "generate"]:
+                    set_score_stats_attributes(
+                        span, "db.query.scores", get_match_scores(result)
+                    )
                     span.add_event(
                         name="db.response",
                         attributes={"db.response": aggregate_responses(result)},
@@ -17,6 +17,7 @@ limitations under the License.
 import logging
 import os
 import sys
+import threading
 import warnings
 from typing import Any, Dict, Optional
 
@@ -45,6 +46,10 @@ from langtrace_python_sdk.constants.exporter.langtrace_exporter import (
     LANGTRACE_REMOTE_URL,
     LANGTRACE_SESSION_ID_HEADER,
 )
+from langtrace_python_sdk.extensions.deduplicating_exporter import (
+    DEDUPLICATION_SCOPES,
+    DeduplicatingSpanExporter,
+)
 from langtrace_python_sdk.extensions.langtrace_exporter import LangTraceExporter
 from langtrace_python_sdk.instrumentation import (
     AgnoInstrumentation,
@@ -90,7 +95,13 @@ from langtrace_python_sdk.utils import (
     is_package_installed,
     validate_instrumentations,
 )
+from langtrace_python_sdk.utils.capture_limits import capture_limits
+from langtrace_python_sdk.utils.config_watcher import RuntimeConfigWatcher
 from langtrace_python_sdk.utils.langtrace_sampler import LangtraceSampler
+from langtrace_python_sdk.utils.runtime_config import (
+    load_runtime_config,
+    update_runtime_config,
+)
 
 
 class LangtraceConfig:
@@ -112,6 +123,28 @@ class LangtraceConfig:
         self.session_id = kwargs.get("session_id") or os.environ.get(
             "LANGTRACE_SESSION_ID"
         )
+        self.deduplicate_content = get_deduplication_scope(
+            kwargs.get("deduplicate_content")
+            or os.environ.get("LANGTRACE_DEDUPLICATE_CONTENT")
+        )
+
+
+def get_deduplication_scope(value: Optional[str]) -> Optional[str]:
+    """
+    The deduplication scope named by `value`, or None when deduplication is
+    off. Unknown values turn it off with a warning instead of failing init."""
+    if not value or value.lower() == "off":
+        return None
+    scope = value.lower()
+    if scope not in DEDUPLICATION_SCOPES:
+        print(
+            Fore.YELLOW
+            + f"Ignoring unknown content deduplication scope {value!r}, expected "
+            + f"one of off, {', '.join(DEDUPLICATION_SCOPES)}"
+            + Fore.RESET
+        )
+        return None
+    return scope
 
 
 def get_host(config: LangtraceConfig) -> str:
@@ -175,15 +208,19 @@ def append_api_path(host: str):
 
 def get_exporter(config: LangtraceConfig, host: str):
     if config.custom_remote_exporter:
-        return config.custom_remote_exporter
-
-    headers = get_headers(config)
-    exporter_protocol = os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL", "http")
-    if "http" in exporter_protocol.lower():
-        host = append_api_path(host)
-        return HTTPExporter(endpoint=host, headers=headers)
+        exporter = config.custom_remote_exporter
     else:
-        return GRPCExporter(endpoint=host, headers=headers)
+        headers = get_headers(config)
+        exporter_protocol = os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL", "http")
+        if "http" in exporter_protocol.lower():
+            host = append_api_path(host)
+            exporter = HTTPExporter(endpoint=host, headers=headers)
+        else:
+            exporter = GRPCExporter(endpoint=host, headers=headers)
+
+    if config.deduplicate_content:
+        exporter = DeduplicatingSpanExporter(exporter, scope=config.deduplicate_content)
+    return exporter
 
 
 def add_span_processor(provider: TracerProvider, config: LangtraceConfig, exporter):
@@ -256,6 +293,49 @@ def init_sentry(config: LangtraceConfig, host: str):
         sentry_sdk.set_context("sdk_init_options", sdk_options)
 
 
+def get_all_instrumentations() -> Dict[str, Any]:
+    # Instrumentors are singletons, so repeated calls hand back the same objects
+    return {
+        "openai": OpenAIInstrumentation(),
+        "groq": GroqInstrumentation(),
+        "pinecone": PineconeInstrumentation(),
+        "llama-index": LlamaindexInstrumentation(),
+        "chromadb": ChromaInstrumentation(),
+        "embedchain": EmbedchainInstrumentation(),
+        "qdrant-client": QdrantInstrumentation(),
+        "langchain": LangchainInstrumentation(),
+        "langchain-core": LangchainCoreInstrumentation(),
+        "langchain-community": LangchainCommunityInstrumentation(),
+        "langgraph": LanggraphInstrumentation(),
+        "litellm": LiteLLMInstrumentation(),
+        "anthropic": AnthropicInstrumentation(),
+        "cohere": CohereInstrumentation(),
+        "weaviate-client": WeaviateInstrumentation(),
+        "sqlalchemy": SQLAlchemyInstrumentor(),
+        "ollama": OllamaInstrumentor(),
+        "dspy": DspyInstrumentation(),
+        "crewai": CrewAIInstrumentation(),
+        "vertexai": VertexAIInstrumentation(),
+        "google-cloud-aiplatform": VertexAIInstrumentation(),
+        "google-generativeai": GeminiInstrumentation(),
+        "google-genai": GoogleGenaiInstrumentation(),
+        "graphlit-client": GraphlitInstrumentation(),
+        "phidata": PhiDataInstrumentation(),
+        "agno": AgnoInstrumentation(),
+        "mistralai": MistralInstrumentation(),
+        "neo4j": Neo4jInstrumentation(),
+        "neo4j-graphrag": Neo4jGraphRAGInstrumentation(),
+        "boto3": AWSBedrockInstrumentation(),
+        "autogen": AutogenInstrumentation(),
+        "pymongo": PyMongoInstrumentation(),
+        "cerebras-cloud-sdk": CerebrasInstrumentation(),
+        "pymilvus": MilvusInstrumentation(),
+        "crewai-tools": CrewaiToolsInstrumentation(),
+        "cleanlab-tlm": CleanLabInstrumentation(),
+        "openai-agents": OpenAIAgentsInstrumentation(),
+    }
+
+
 def init(
     api_key: Optional[str] = None,
     batch: bool = True,
@@ -268,6 +348,7 @@ def init(
     disable_logging: bool = False,
     headers: Dict[str, str] = {},
     session_id: Optional[str] = None,
+    deduplicate_content: Optional[str] = None,
 ):
 
     check_if_sdk_is_outdated()
@@ -283,8 +364,11 @@ def init(
         disable_logging=disable_logging,
         headers=headers,
         session_id=session_id,
+        deduplicate_content=deduplicate_content,
     )
 
+    load_runtime_config(session_id=config.session_id)
+
     if config.disable_logging:
         logging.disable(level=logging.INFO)
         sys.stdout = open(os.devnull, "w")
@@ -311,45 +395,7 @@ def init(
 
     os.environ["LANGTRACE_API_HOST"] = host.replace("/api/trace", "")
     trace.set_tracer_provider(provider)
-    all_instrumentations = {
-        "openai": OpenAIInstrumentation(),
-        "groq": GroqInstrumentation(),
-        "pinecone": PineconeInstrumentation(),
-        "llama-index": LlamaindexInstrumentation(),
-        "chromadb": ChromaInstrumentation(),
-        "embedchain": EmbedchainInstrumentation(),
-        "qdrant-client": QdrantInstrumentation(),
-        "langchain": LangchainInstrumentation(),
-        "langchain-core": LangchainCoreInstrumentation(),
-        "langchain-community": LangchainCommunityInstrumentation(),
-        "langgraph": LanggraphInstrumentation(),
-        "litellm": LiteLLMInstrumentation(),
-        "anthropic": AnthropicInstrumentation(),
-        "cohere": CohereInstrumentation(),
-        "weaviate-client": WeaviateInstrumentation(),
-        "sqlalchemy": SQLAlchemyInstrumentor(),
-        "ollama": OllamaInstrumentor(),
-        "dspy": DspyInstrumentation(),
-        "crewai": CrewAIInstrumentation(),
-        "vertexai": VertexAIInstrumentation(),
-        "google-cloud-aiplatform": VertexAIInstrumentation(),
-        "google-generativeai": GeminiInstrumentation(),
-        "google-genai": GoogleGenaiInstrumentation(),
-        "graphlit-client": GraphlitInstrumentation(),
-        "phidata": PhiDataInstrumentation(),
-        "agno": AgnoInstrumentation(),
-        "mistralai": MistralInstrumentation(),
-        "neo4j": Neo4jInstrumentation(),
-        "neo4j-graphrag": Neo4jGraphRAGInstrumentation(),
-        "boto3": AWSBedrockInstrumentation(),
-        "autogen": AutogenInstrumentation(),
-        "pymongo": PyMongoInstrumentation(),
-        "cerebras-cloud-sdk": CerebrasInstrumentation(),
-        "pymilvus": MilvusInstrumentation(),
-        "crewai-tools": CrewaiToolsInstrumentation(),
-        "cleanlab-tlm": CleanLabInstrumentation(),
-        "openai-agents": OpenAIAgentsInstrumentation(),
-    }
+    all_instrumentations = get_all_instrumentations()
 
     init_instrumentations(config.disable_instrumentations, all_instrumentations)
     add_span_processor(provider, config, exporter)
@@ -357,6 +403,7 @@ def init(
     if config.disable_logging:
         sys.stdout = sys.__stdout__
     init_sentry(config, host)
+    watch_runtime_config()
 
 
 def before_send(event: Event, hint: Hint):
@@ -375,43 +422,129 @@ def before_send(event: Event, hint: Hint):
     return None
 
 
+def get_enabled_instrumentations(
+    disable_instrumentations: Optional[DisableInstrumentations],
+    all_instrumentations: dict,
+) -> dict:
+    if not disable_instrumentations:
+        return all_instrumentations
+
+    validate_instrumentations(disable_instrumentations)
+
+    for key in disable_instrumentations:
+        vendors = [k.value for k in disable_instrumentations[key]]
+
+    key = next(iter(disable_instrumentations))
+    filtered_dict = {}
+    if key == "all_except":
+        filtered_dict = {k: v for k, v in all_instrumentations.items() if k in vendors}
+    elif key == "only":
+        filtered_dict = {
+            k: v for k, v in all_instrumentations.items() if k not in vendors
+        }
+    return filtered_dict
+
+
 def init_instrumentations(
     disable_instrumentations: Optional[DisableInstrumentations],
     all_instrumentations: dict,
 ):
-    if disable_instrumentations is None:
+    filtered_dict = get_enabled_instrumentations(
+        disable_instrumentations, all_instrumentations
+    )
+
+    for name, v in filtered_dict.items():
+        if is_package_installed(name):
+            try:
+                v.instrument()
+                warnings.filterwarnings("ignore", category=DeprecationWarning)
+                warnings.filterwarnings("ignore", category=UserWarning)
+            except Exception as e:
+                print(f"Skipping {name} due to error while instrumenting: {e}")
+
+
+def reconfigure(
+    disable_instrumentations: Optional[DisableInstrumentations] = None,
+    disable_tracing_for_functions: Optional[InstrumentationMethods] = None,
+    sampling_ratio: Optional[float] = None,
+    trace_prompt_completion_data: Optional[bool] = None,
+    max_attribute_bytes: Optional[int] = None,
+    max_span_bytes: Optional[int] = None,
+    completion_chunk_events: Optional[str] = None,
+    prompt_capture: Optional[str] = None,
+):
+    """
+    Change tracing behaviour of a running process without restarting it.
+    Arguments left as None are unchanged. Pass `disable_instrumentations={}`
+    to re-enable every vendor. Vendors that get disabled are uninstrumented,
+    restoring the original library methods. The session id is sent as an
+    exporter header set up by `init`, so it can only be changed there.
+    """
+    if disable_instrumentations is not None:
+        all_instrumentations = get_all_instrumentations()
+        enabled = get_enabled_instrumentations(
+            disable_instrumentations, all_instrumentations
+        )
+        enabled_ids = {id(v) for v in enabled.values()}
+
         for name, v in all_instrumentations.items():
-            if is_package_installed(name):
-                try:
-                    v.instrument()
-                    warnings.filterwarnings("ignore", category=DeprecationWarning)
-                    warnings.filterwarnings("ignore", category=UserWarning)
-                except Exception as e:
-                    print(f"Skipping {name} due to error while instrumenting: {e}")
+            if id(v) in enabled_ids or not v.is_instrumented_by_opentelemetry:
+                continue
+            try:
+                v.uninstrument()
+            except Exception as e:
+                print(f"Skipping {name} due to error while uninstrumenting: {e}")
+
+        for name, v in enabled.items():
+            if v.is_instrumented_by_opentelemetry or not is_package_installed(name):
+                continue
+            try:
+                v.instrument()
+            except Exception as e:
+                print(f"Skipping {name} due to error while instrumenting: {e}")
+
+    if disable_tracing_for_functions is not None or sampling_ratio is not None:
+        sampler = getattr(trace.get_tracer_provider(), "sampler", None)
+        if isinstance(sampler, LangtraceSampler):
+            sampler.update(
+                disabled_methods=disable_tracing_for_functions,
+                sampling_ratio=sampling_ratio,
+            )
+
+    update_runtime_config(
+        trace_prompt_completion_data=trace_prompt_completion_data,
+        completion_chunk_events=completion_chunk_events,
+        prompt_capture=prompt_capture,
+    )
+
+    capture_limits.update(
+        max_attribute_bytes=max_attribute_bytes, max_span_bytes=max_span_bytes
+    )
 
-    else:
 
-        validate_instrumentations(disable_instrumentations)
-
-        for key in disable_instrumentations:
-            vendors = [k.value for k in disable_instrumentations[key]]
-
-        key = next(iter(disable_instrumentations))
-        filtered_dict = {}
-        if key == "all_except":
-            filtered_dict = {
-                k: v for k, v in all_instrumentations.items() if k in vendors
-            }
-        elif key == "only":
-            filtered_dict = {
-                k: v for k, v in all_instrumentations.items() if k not in vendors
-            }
-
-        for name, v in filtered_dict.items():
-            if is_package_installed(name):
-                try:
-                    v.instrument()
-                    warnings.filterwarnings("ignore", category=DeprecationWarning)
-                    warnings.filterwarnings("ignore", category=UserWarning)
-                except Exception as e:
-                    print(f"Skipping {name} due to error while instrumenting: {e}")
+# The watcher of the runtime config file, replaced on every `init`
+_runtime_config_watcher: Optional[RuntimeConfigWatcher] = None
+_runtime_config_watcher_lock = threading.Lock()
+
+
+def watch_runtime_config(
+    path: Optional[str] = None, interval: float = 5.0
+) -> Optional[RuntimeConfigWatcher]:
+    """
+    Apply `reconfigure` whenever the JSON file at `path` (or
+    LANGTRACE_RUNTIME_CONFIG_FILE) changes. Keys mirror `reconfigure` arguments.
+    A watcher started by an earlier call is stopped first.
+    """
+    global _runtime_config_watcher
+    path = path or os.environ.get("LANGTRACE_RUNTIME_CONFIG_FILE")
+    with _runtime_config_watcher_lock:
+        if _runtime_config_watcher is not None:
+            _runtime_config_watcher.stop()
+            _runtime_config_watcher = None
+        if not path:
+            return None
+
+        _runtime_config_watcher = RuntimeConfigWatcher(
+            path, lambda runtime_config: reconfigure(**runtime_config), interval
+        ).start()
+        return _runtime_config_watcher
@@ -1,5 +1,7 @@
 from langtrace_python_sdk.types import NOT_GIVEN, InstrumentationType
 from .sdk_version_checker import SDKVersionChecker
+from .capture_limits import capture_limits
+from .runtime_config import get_runtime_config
 from opentelemetry.trace import Span
 from opentelemetry.semconv.attributes import (
     error_attributes as ErrorAttributes,
@@ -7,8 +9,9 @@ from opentelemetry.semconv.attributes import (
 from opentelemetry.trace.status import Status, StatusCode
 
 from langtrace.trace_attributes import SpanAttributes
+from wrapt import FunctionWrapper
 import inspect
-import os
+import sys
 
 
 def set_span_attribute(span: Span, name, value):
@@ -17,23 +20,33 @@ def set_span_attribute(span: Span, name, value):
             if name == SpanAttributes.LLM_PROMPTS:
                 set_event_prompt(span, value)
             else:
+                value, truncation = capture_limits.cap(span, name, value)
                 span.set_attribute(name, value)
+                if truncation:
+                    span.set_attributes(truncation)
     return
 
 
 def set_event_prompt(span: Span, prompt):
-    enabled = os.environ.get("TRACE_PROMPT_COMPLETION_DATA", "true")
-    if enabled.lower() == "false":
+    if not get_runtime_config().trace_prompt_completion_data:
         return
 
-    span.add_event(
-        name=SpanAttributes.LLM_CONTENT_PROMPT,
-        attributes={
-            SpanAttributes.LLM_PROMPTS: prompt,
-        },
+    add_content_event(
+        span, SpanAttributes.LLM_CONTENT_PROMPT, SpanAttributes.LLM_PROMPTS, prompt
     )
 
 
+def add_content_event(span: Span, event_name, attribute_name, value):
+    """
+    Add an event carrying a single prompt or completion attribute, cut down to
+    the configured capture limits."""
+    value, truncation = capture_limits.cap(span, attribute_name, value)
+    attributes = {attribute_name: value}
+    if truncation:
+        attributes.update(truncation)
+    span.add_event(name=event_name, attributes=attributes)
+
+
 def deduce_args_and_kwargs(func, *args, **kwargs):
     sig = inspect.signature(func)
     bound_args = sig.bind(*args, **kwargs)
@@ -102,3 +115,48 @@ def handle_span_error(span: Span, error):
     if span.is_recording():
         span.set_attribute(ErrorAttributes.ERROR_TYPE, type(error).__qualname__)
     span.end()
+
+
+def _is_langtrace_wrapper(value):
+    return isinstance(value, FunctionWrapper) and getattr(
+        getattr(value, "_self_wrapper", None), "__module__", ""
+    ).startswith("langtrace_python_sdk")
+
+
+def unwrap_method(module_name, name):
+    """
+    Undo `wrap_function_wrapper(module_name, name, ...)` by restoring the
+    original attribute. Modules that were never imported are skipped.
+    """
+    parent = sys.modules.get(module_name)
+    if parent is None:
+        return
+
+    *path, attribute = name.split(".")
+    for part in path:
+        parent = getattr(parent, part, None)
+        if parent is None:
+            return
+
+    wrapper = vars(parent).get(attribute)
+    if _is_langtrace_wrapper(wrapper):
+        setattr(parent, attribute, wrapper.__wrapped__)
+
+
+def unwrap_module_classes(module_name):
+    """
+    Restore every method wrapped by Langtrace on the classes defined in
+    `module_name` (or its submodules).
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return
+
+    for _, obj in inspect.getmembers(
+        module,
+        lambda member: inspect.isclass(member)
+        and member.__module__.startswith(module_name),
+    ):
+        for attribute, value in list(vars(obj).items()):
+            if _is_langtrace_wrapper(value):
+                setattr(obj, attribute, value.__wrapped__)
@@ -0,0 +1,172 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import re
+from typing import Any, Dict, Optional
+
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+
+# Keys whose long string values hold base64 encoded binary data
+BASE64_KEYS = frozenset(("b64_json", "base64", "data", "image_base64", "bytes"))
+MIN_BASE64_LENGTH = 256
+MAX_DEPTH = 8
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/_=-]+")
+THUMBNAIL_SIZE = (64, 64)
+
+_MAGIC_NUMBERS = (
+    (b"\x89PNG", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"%PDF", "application/pdf"),
+    (b"ID3", "audio/mpeg"),
+    (b"OggS", "audio/ogg"),
+    (b"fLaC", "audio/flac"),
+)
+
+
+def sniff_mime_type(head: bytes) -> Optional[str]:
+    for magic, mime_type in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return mime_type
+    if head[:4] == b"RIFF":
+        return {b"WEBP": "image/webp", b"WAVE": "audio/wav"}.get(head[8:12])
+    return None
+
+
+def describe_bytes(data: bytes, mime_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describe a binary payload by its size, mime type and digest instead of its
+    content."""
+    mime_type = mime_type or sniff_mime_type(bytes(data[:12]))
+    description = {
+        "type": "binary",
+        "mime_type": mime_type,
+        "size": len(data),
+        "digest": hashlib.blake2b(data, digest_size=16).hexdigest(),
+    }
+    if mime_type and mime_type.startswith("image/") and get_runtime_config().keep_image_thumbnails:
+        thumbnail = make_thumbnail(data)
+        if thumbnail is not None:
+            description["thumbnail"] = thumbnail
+    return description
+
+
+def describe_base64(data: str, mime_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Describe base64 encoded data. Only the first bytes are decoded, unless a
+    thumbnail is kept."""
+    if mime_type is None:
+        try:
+            mime_type = sniff_mime_type(base64.b64decode(data[:16]))
+        except (binascii.Error, ValueError):
+            pass
+    if mime_type and mime_type.startswith("image/") and get_runtime_config().keep_image_thumbnails:
+        try:
+            return describe_bytes(base64.b64decode(data), mime_type)
+        except (binascii.Error, ValueError):
+            pass
+
+    size = len(data) * 3 // 4 - (len(data) - len(data.rstrip("=")))
+    return {
+        "type": "binary",
+        "mime_type": mime_type,
+        "size": size,
+        "digest": hashlib.blake2b(data.encode(), digest_size=16).hexdigest(),
+    }
+
+
+def describe_data_url(url: str) -> Dict[str, Any]:
+    header, _, data = url.partition(",")
+    mime_type = header[len("data:") :].split(";", 1)[0] or None
+    return describe_base64(data, mime_type)
+
+
+def make_thumbnail(data: bytes) -> Optional[str]:
+    """
+    Return a small JPEG data URL of an image, or None when Pillow isn't
+    installed or the image can't be read."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            output = io.BytesIO()
+            image.convert("RGB").save(output, format="JPEG", quality=70)
+    except Exception:
+        return None
+    return "data:image/jpeg;base64," + base64.b64encode(output.getvalue()).decode()
+
+
+def is_data_url(value: str) -> bool:
+    return value.startswith("data:") and ";base64," in value[:128]
+
+
+def is_base64(value: str) -> bool:
+    return _BASE64_PATTERN.fullmatch(value, 0, MIN_BASE64_LENGTH) is not None
+
+
+def strip_binary_payloads(value, depth=0):
+    """
+    Return `value` with inline binary data (data URLs, base64 fields and bytes)
+    replaced by their description. Containers are only copied when something
+    was replaced, so the caller's request is never modified."""
+    if isinstance(value, str):
+        if len(value) >= MIN_BASE64_LENGTH and is_data_url(value):
+            return describe_data_url(value)
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return describe_bytes(value)
+    if depth >= MAX_DEPTH:
+        return value
+
+    if isinstance(value, dict):
+        stripped = None
+        for key, item in value.items():
+            if (
+                key in BASE64_KEYS
+                and isinstance(item, str)
+                and len(item) >= MIN_BASE64_LENGTH
+                and is_base64(item)
+            ):
+                new_item = describe_base64(
+                    item, value.get("mime_type") or value.get("media_type")
+                )
+            else:
+                new_item = strip_binary_payloads(item, depth + 1)
+            if new_item is not item:
+                if stripped is None:
+                    stripped = dict(value)
+                stripped[key] = new_item
+        return value if stripped is None else stripped
+
+    if isinstance(value, (list, tuple)):
+        stripped = None
+        for index, item in enumerate(value):
+            new_item = strip_binary_payloads(item, depth + 1)
+            if new_item is not item:
+                if stripped is None:
+                    stripped = list(value)
+                stripped[index] = new_item
+        return value if stripped is None else stripped
+
+    return value
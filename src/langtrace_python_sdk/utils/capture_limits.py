@@ -0,0 +1,147 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import os
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+DEFAULT_MAX_ATTRIBUTE_BYTES = 64 * 1024
+DEFAULT_MAX_SPAN_BYTES = 256 * 1024
+
+# Shorter values are not charged to the span budget, which keeps the common
+# small attributes free of any locking
+MIN_BUDGETED_BYTES = 1024
+
+TRUNCATION_MARKER = "\n... [{} bytes truncated] ...\n"
+
+
+def _read_limit(name, default):
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class CaptureLimits:
+    """
+    Byte limits for the string values captured on spans. A limit of 0 disables
+    it. Values over a limit keep their head and tail, and the original length
+    and a hash of the full value are recorded next to them.
+    """
+
+    def __init__(
+        self,
+        max_attribute_bytes: Optional[int] = None,
+        max_span_bytes: Optional[int] = None,
+    ):
+        self.max_attribute_bytes = (
+            _read_limit("LANGTRACE_MAX_ATTRIBUTE_BYTES", DEFAULT_MAX_ATTRIBUTE_BYTES)
+            if max_attribute_bytes is None
+            else max_attribute_bytes
+        )
+        self.max_span_bytes = (
+            _read_limit("LANGTRACE_MAX_SPAN_BYTES", DEFAULT_MAX_SPAN_BYTES)
+            if max_span_bytes is None
+            else max_span_bytes
+        )
+        self._lock = threading.Lock()
+        self._span_bytes = weakref.WeakKeyDictionary()
+
+    def update(
+        self,
+        max_attribute_bytes: Optional[int] = None,
+        max_span_bytes: Optional[int] = None,
+    ):
+        if max_attribute_bytes is not None:
+            self.max_attribute_bytes = max(0, int(max_attribute_bytes))
+        if max_span_bytes is not None:
+            self.max_span_bytes = max(0, int(max_span_bytes))
+
+    def _reserve(self, span, size) -> int:
+        """
+        Take up to `size` bytes from the remaining budget of `span` and return
+        how many were granted."""
+        with self._lock:
+            try:
+                used = self._span_bytes.get(span, 0)
+            except TypeError:
+                # Spans that can't be weakly referenced are not budgeted
+                return size
+            granted = max(0, min(size, self.max_span_bytes - used))
+            self._span_bytes[span] = used + granted
+            return granted
+
+    def cap(self, span, name, value) -> Tuple[object, Optional[Dict[str, object]]]:
+        """
+        Return `value` cut down to the attribute and span limits, along with
+        the attributes describing the cut, or None when it was kept whole."""
+        if not isinstance(value, str):
+            return value, None
+        max_attribute_bytes = self.max_attribute_bytes
+        max_span_bytes = self.max_span_bytes
+        if not max_attribute_bytes and not max_span_bytes:
+            return value, None
+
+        # ASCII strings have as many bytes as characters. Other characters
+        # take at most 4 bytes, so short values skip the encoding
+        limit = min(
+            max_attribute_bytes or max_span_bytes, max_span_bytes or max_attribute_bytes
+        )
+        encoded = None
+        size = len(value)
+        if not value.isascii() and (
+            size * 4 > limit or (max_span_bytes and size * 4 >= MIN_BUDGETED_BYTES)
+        ):
+            encoded = value.encode("utf-8", "surrogatepass")
+            size = len(encoded)
+
+        allowed = min(size, max_attribute_bytes) if max_attribute_bytes else size
+        if max_span_bytes and size >= MIN_BUDGETED_BYTES:
+            allowed = self._reserve(span, allowed)
+        if allowed >= size:
+            return value, None
+
+        if encoded is None:
+            encoded = value.encode("utf-8", "surrogatepass")
+            size = len(encoded)
+        return truncate(encoded, allowed), {
+            f"{name}.original_length": size,
+            f"{name}.hash": hashlib.blake2b(encoded, digest_size=16).hexdigest(),
+        }
+
+
+def truncate(encoded: bytes, limit: int) -> str:
+    """
+    Keep the head and tail of `encoded` within `limit` bytes, joined by a marker
+    giving the number of bytes dropped. Limits too small for the marker keep
+    only the head."""
+    marker_size = len(TRUNCATION_MARKER.format(len(encoded)))
+    if limit < marker_size:
+        return encoded[: max(limit, 0)].decode("utf-8", "ignore")
+    keep = limit - marker_size
+    head = keep - keep // 2
+    tail = keep // 2
+    marker = TRUNCATION_MARKER.format(len(encoded) - keep)
+    return (
+        encoded[:head].decode("utf-8", "ignore")
+        + marker
+        + encoded[len(encoded) - tail :].decode("utf-8", "ignore")
+    )
+
+
+capture_limits = CaptureLimits()
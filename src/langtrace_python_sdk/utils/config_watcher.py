@@ -0,0 +1,60 @@
+import json
+import os
+import threading
+from typing import Callable, Optional
+
+from colorama import Fore
+
+
+class RuntimeConfigWatcher:
+    """
+    Polls a JSON file and hands its contents to `callback` whenever the file
+    changes. The watcher runs on a daemon thread so it never blocks shutdown.
+    """
+
+    _path: str
+    _interval: float
+    _callback: Callable[[dict], None]
+    _last_mtime: Optional[float]
+
+    def __init__(self, path: str, callback: Callable[[dict], None], interval=5.0):
+        self._path = path
+        self._interval = interval
+        self._callback = callback
+        self._last_mtime = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="langtrace-config-watcher", daemon=True
+        )
+
+    def start(self):
+        self.poll()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+
+    def poll(self):
+        try:
+            mtime = os.stat(self._path).st_mtime
+        except OSError:
+            return
+
+        if mtime == self._last_mtime:
+            return
+        self._last_mtime = mtime
+
+        try:
+            with open(self._path, encoding="utf-8") as config_file:
+                self._callback(json.load(config_file))
+        except Exception as err:
+            print(
+                Fore.RED
+                + f"Failed to apply Langtrace runtime config {self._path}: {err}"
+                + Fore.RESET
+            )
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self.poll()
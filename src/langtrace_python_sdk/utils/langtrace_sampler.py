@@ -4,24 +4,46 @@ from opentelemetry.sdk.trace.sampling import (
     Decision,
     SamplingResult,
 )
-from opentelemetry.trace import SpanKind, Link, TraceState, TraceFlags
+from opentelemetry.trace import SpanKind, Link, TraceState
 from opentelemetry.util.types import Attributes
 from opentelemetry.context import Context
 from opentelemetry import trace
 
+TRACE_ID_LIMIT = (1 << 64) - 1
+
 
 class LangtraceSampler(Sampler):
-    _disabled_methods_names: set
+    _disabled_methods_names: frozenset
+    _sampling_ratio: float
+    _bound: int
 
     def __init__(
         self,
         disabled_methods: dict,
+        sampling_ratio: float = 1.0,
     ):
-        self._disabled_methods_names = set()
-        if disabled_methods:
-            for _, methods in disabled_methods.items():
-                for method in methods:
-                    self._disabled_methods_names.add(method)
+        self.update(disabled_methods=disabled_methods, sampling_ratio=sampling_ratio)
+
+    def update(self, disabled_methods=None, sampling_ratio=None):
+        """
+        Replace the disabled methods and/or the root sampling ratio. Both are
+        swapped atomically so this is safe to call while spans are started.
+        """
+        if disabled_methods is not None or not hasattr(
+            self, "_disabled_methods_names"
+        ):
+            names = set()
+            if disabled_methods:
+                for _, methods in disabled_methods.items():
+                    for method in methods:
+                        names.add(method)
+            self._disabled_methods_names = frozenset(names)
+
+        if sampling_ratio is not None:
+            if not 0.0 <= sampling_ratio <= 1.0:
+                raise ValueError("sampling_ratio must be between 0.0 and 1.0")
+            self._sampling_ratio = sampling_ratio
+            self._bound = round(sampling_ratio * (TRACE_ID_LIMIT + 1))
 
     def should_sample(
         self,
@@ -34,22 +56,23 @@ class LangtraceSampler(Sampler):
         trace_state: Optional["TraceState"] = None,
     ) -> SamplingResult:
 
-        parent_span = trace.get_current_span(parent_context)
-        parent_span_context = parent_span.get_span_context()
-
-        if not self._disabled_methods_names:
-            return SamplingResult(decision=Decision.RECORD_AND_SAMPLE)
+        parent_span_context = trace.get_current_span(parent_context).get_span_context()
 
-        if parent_context:
-            if (
-                parent_span_context.span_id != 0
-                and parent_span_context.trace_flags != TraceFlags.SAMPLED
-            ):
-                return SamplingResult(decision=Decision.DROP)
+        # Children follow their parent, whether it was passed explicitly or is
+        # the current span, so a dropped root never leaves orphans behind
+        if parent_span_context.is_valid and not parent_span_context.trace_flags.sampled:
+            return SamplingResult(decision=Decision.DROP)
 
         if name in self._disabled_methods_names:
             return SamplingResult(decision=Decision.DROP)
 
+        # Only root spans roll the dice
+        if (
+            not parent_span_context.is_valid
+            and trace_id & TRACE_ID_LIMIT >= self._bound
+        ):
+            return SamplingResult(decision=Decision.DROP)
+
         return SamplingResult(decision=Decision.RECORD_AND_SAMPLE)
 
     def get_description(self):
@@ -14,24 +14,39 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import hashlib
+import inspect
 import json
-import os
-from typing import Any, Dict, Union
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from importlib_metadata import version as v
 from langtrace.trace_attributes import SpanAttributes
 from opentelemetry import baggage
 from opentelemetry.trace import Span
 from opentelemetry.trace.status import StatusCode
-from tiktoken import get_encoding, list_encoding_names
+from tiktoken import get_encoding
 
 from langtrace_python_sdk.constants import LANGTRACE_SDK_NAME
 from langtrace_python_sdk.constants.instrumentation.common import (
-    LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY, TIKTOKEN_MODEL_MAPPING)
+    LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY, STREAM_SPAN_ATTRIBUTES,
+    TIKTOKEN_MODEL_MAPPING, TIKTOKEN_MODEL_PREFIXES)
 from langtrace_python_sdk.constants.instrumentation.openai import \
     OPENAI_COST_TABLE
 from langtrace_python_sdk.types import NOT_GIVEN
-from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils import (add_content_event, handle_span_error,
+                                        set_span_attribute)
+from langtrace_python_sdk.utils.binary_payloads import strip_binary_payloads
+from langtrace_python_sdk.utils.prompt_templates import link_prompt_templates
+from langtrace_python_sdk.utils.provider_registry import provider_registry
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
+from langtrace_python_sdk.utils.stream_processors import (
+    ChunkProcessor, GenericChunkProcessor)
 
 
 def get_span_name(operation_name):
@@ -51,34 +66,203 @@ def estimate_tokens(prompt):
 
 
 def set_event_completion_chunk(span: Span, chunk):
-    enabled = os.environ.get("TRACE_PROMPT_COMPLETION_DATA", "true")
-    if enabled.lower() == "false":
+    if not get_runtime_config().trace_prompt_completion_data:
         return
-    span.add_event(
-        name=SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK,
-        attributes={
-            SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK: json.dumps(chunk),
-        },
+    add_content_event(
+        span,
+        SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK,
+        SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK,
+        json.dumps(chunk),
     )
 
 
+@lru_cache(maxsize=8)
+def parse_completion_chunk_events(value) -> tuple:
+    """
+    Parse a LANGTRACE_COMPLETION_CHUNK_EVENTS value: `off`, `all`, `final`,
+    `every:<n>` (one event per n chunks) or `window:<ms>` (one event per time
+    window). Unknown values disable chunk events."""
+    mode, _, argument = (value or "off").strip().lower().partition(":")
+    try:
+        if mode == "every" and int(argument) > 0:
+            return ("every", int(argument))
+        if mode == "window" and float(argument) > 0:
+            return ("window", int(float(argument) * 1e6))
+    except ValueError:
+        return ("off", None)
+    if mode in ("all", "final"):
+        return (mode, None)
+    return ("off", None)
+
+
+class ChunkEventAggregator:
+    """
+    Coalesces streamed completion chunks into `LLM_CONTENT_COMPLETION_CHUNK` span
+    events, so a long stream adds a handful of events instead of one per chunk.
+    """
+
+    __slots__ = ("span", "mode", "argument", "_pending", "_window_start")
+
+    def __init__(self, span: Span, mode, argument=None):
+        self.span = span
+        self.mode = mode
+        self.argument = argument
+        self._pending = []
+        self._window_start = None
+
+    @classmethod
+    def for_span(cls, span: Span) -> Optional["ChunkEventAggregator"]:
+        """
+        Return an aggregator for the configured mode, or None when chunk events are off."""
+        mode, argument = parse_completion_chunk_events(
+            get_runtime_config().completion_chunk_events
+        )
+        if span is None or mode == "off":
+            return None
+        return cls(span, mode, argument)
+
+    def add(self, chunk):
+        if self.mode == "all":
+            set_event_completion_chunk(self.span, chunk)
+            return
+        if self.mode == "window":
+            now = time.monotonic_ns()
+            if self._window_start is None:
+                self._window_start = now
+            elif now - self._window_start >= self.argument:
+                self.flush()
+                self._window_start = now
+        self._pending.append(chunk)
+        if self.mode == "every" and len(self._pending) >= self.argument:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            set_event_completion_chunk(self.span, "".join(self._pending))
+            self._pending = []
+
+
+@lru_cache(maxsize=None)
+def get_tiktoken_encoding(encoding_name):
+    """
+    Return the tiktoken encoder for `encoding_name`, loading it only once."""
+    return get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=256)
+def resolve_tiktoken_encoding(model) -> Optional[str]:
+    """
+    Resolve a model name (optionally prefixed with a provider, e.g. `openai/gpt-4o`)
+    to its tiktoken encoding name, or None if the model family is unknown."""
+    if not model or not isinstance(model, str):
+        return None
+    model = model.rsplit("/", 1)[-1].lower()
+    if model in TIKTOKEN_MODEL_MAPPING:
+        return TIKTOKEN_MODEL_MAPPING[model]
+    for prefix, encoding_name in TIKTOKEN_MODEL_PREFIXES:
+        if model.startswith(prefix):
+            return encoding_name
+    return None
+
+
 def estimate_tokens_using_tiktoken(prompt, model):
     """
     Estimate the number of tokens in a prompt using tiktoken."""
-    encoding = get_encoding(model)
-    tokens = encoding.encode(prompt)
+    encoding = get_tiktoken_encoding(model)
+    tokens = encoding.encode(prompt, disallowed_special=())
     return len(tokens)
 
 
+class TokenCounter:
+    """
+    Counts tokens for many texts at once. Uncached texts are tokenized with a
+    single tiktoken batch call and the counts are kept in a bounded LRU keyed by
+    (encoding, content digest), so a conversation prefix resent on every turn is
+    only tokenized once.
+    """
+
+    def __init__(self, maxsize=4096):
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, texts: List[str], model) -> List[int]:
+        encoding_name = resolve_tiktoken_encoding(model)
+        if encoding_name is None:
+            return [estimate_tokens(text) for text in texts]
+
+        keys = [(encoding_name, _content_digest(text)) for text in texts]
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing = []
+        with self._lock:
+            for index, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is None:
+                    missing.append(index)
+                else:
+                    self._cache.move_to_end(key)
+                    counts[index] = cached
+
+        if missing:
+            try:
+                encoding = get_tiktoken_encoding(encoding_name)
+                if len(missing) == 1:
+                    encoded = [encoding.encode_ordinary(texts[missing[0]])]
+                else:
+                    encoded = encoding.encode_ordinary_batch(
+                        [texts[index] for index in missing]
+                    )
+            except Exception:
+                # Fallback method, not cached so tiktoken is retried next time
+                for index in missing:
+                    counts[index] = estimate_tokens(texts[index])
+                return counts
+
+            with self._lock:
+                for index, tokens in zip(missing, encoded):
+                    counts[index] = len(tokens)
+                    self._cache[keys[index]] = len(tokens)
+                    self._cache.move_to_end(keys[index])
+                while len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+        return counts
+
+    def count_total(self, texts: List[str], model) -> int:
+        return sum(self.count(texts, model))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def _content_digest(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+token_counter = TokenCounter()
+
+
 def calculate_prompt_tokens(prompt_content, model):
     """
     Calculate the number of tokens in a prompt. If the model is supported by tiktoken, use it for the estimation.
     """
-    try:
-        tiktoken_model = TIKTOKEN_MODEL_MAPPING[model]
-        return estimate_tokens_using_tiktoken(prompt_content, tiktoken_model)
-    except Exception:
-        return estimate_tokens(prompt_content)  # Fallback method
+    if not prompt_content:
+        return 0
+    return token_counter.count([prompt_content], model)[0]
+
+
+def estimate_chat_prompt_tokens(messages, functions, model):
+    """
+    Estimate the prompt tokens of a chat request from its messages and function definitions.
+    """
+    texts = [json.dumps(str(message)) for message in messages or []]
+    if functions is not None and functions != NOT_GIVEN:
+        texts.extend(json.dumps(function) for function in functions)
+    if not texts:
+        return 0
+    return token_counter.count_total(texts, model)
 
 
 def calculate_price_from_usage(model, usage):
@@ -259,8 +443,9 @@ def get_llm_request_attributes(kwargs, prompts=None, model=None, operation_name=
         or kwargs.get("top_n", None)
     )
 
+    prompts, template_attributes = link_prompt_templates(prompts)
     try:
-        prompts = json.dumps(prompts) if prompts else None
+        prompts = json.dumps(strip_binary_payloads(prompts)) if prompts else None
     except Exception as e:
         if "is not JSON serializable" in str(e):
             # check model
@@ -306,6 +491,7 @@ def get_llm_request_attributes(kwargs, prompts=None, model=None, operation_name=
         SpanAttributes.LLM_REQUEST_LOGPROPS: kwargs.get("logprobs"),
         SpanAttributes.LLM_REQUEST_LOGITBIAS: kwargs.get("logit_bias"),
         SpanAttributes.LLM_REQUEST_TOP_LOGPROPS: kwargs.get("top_logprobs"),
+        **template_attributes,
     }
 
 
@@ -321,12 +507,7 @@ def get_llm_url(instance):
 
 
 def get_base_url(instance):
-    base_url = (
-        str(instance._client._base_url)
-        if hasattr(instance, "_client") and hasattr(instance._client, "_base_url")
-        else ""
-    )
-    return base_url
+    return provider_registry.lookup(instance)[0]
 
 
 def is_streaming(kwargs):
@@ -337,6 +518,15 @@ def is_streaming(kwargs):
     )
 
 
+def is_usage_requested(kwargs):
+    """
+    Whether a streaming request asked the provider to report usage on its final chunk."""
+    stream_options = kwargs.get("stream_options")
+    if not isinstance(stream_options, dict):
+        return False
+    return bool(stream_options.get("include_usage"))
+
+
 def set_usage_attributes(span, usage):
     if usage is None:
         return
@@ -381,15 +571,14 @@ def get_tool_calls(item):
 
 
 def set_event_completion(span: Span, result_content):
-    enabled = os.environ.get("TRACE_PROMPT_COMPLETION_DATA", "true")
-    if enabled.lower() == "false":
+    if not get_runtime_config().trace_prompt_completion_data:
         return
 
-    span.add_event(
-        name=SpanAttributes.LLM_CONTENT_COMPLETION,
-        attributes={
-            SpanAttributes.LLM_COMPLETIONS: json.dumps(result_content),
-        },
+    add_content_event(
+        span,
+        SpanAttributes.LLM_CONTENT_COMPLETION,
+        SpanAttributes.LLM_COMPLETIONS,
+        json.dumps(strip_binary_payloads(result_content)),
     )
 
 
@@ -406,35 +595,197 @@ def set_span_attributes(span: Span, attributes: Any) -> None:
         set_span_attribute(span, field, value)
 
 
+class CompletionAccumulator:
+    """
+    Collects streamed completion text in a list and counts its tokens chunk by
+    chunk, so the cost of a stream stays linear in its length. Usage reported by
+    the provider takes precedence over the counted tokens.
+    """
+
+    def __init__(self, count_tokens=True, span: Optional[Span] = None):
+        self.content = []
+        self.model = None
+        self.count_tokens = count_tokens
+        self.chunk_events = ChunkEventAggregator.for_span(span)
+        self.counted_tokens = 0
+        self.prompt_tokens = None
+        self.reported_completion_tokens = None
+        self._encoding = None
+
+    def set_model(self, model):
+        if self.model is None and model is not None:
+            self.model = model
+
+    def append(self, text, count_tokens=True):
+        if not text:
+            return
+        self.content.append(text)
+        if self.chunk_events is not None:
+            self.chunk_events.add(text)
+        if count_tokens and self.count_tokens:
+            self.counted_tokens += self._count(text)
+
+    def flush_chunk_events(self):
+        if self.chunk_events is not None:
+            self.chunk_events.flush()
+
+    def count(self, text):
+        """
+        Count generated tokens that are not part of the completion content."""
+        if text and self.count_tokens:
+            self.counted_tokens += self._count(text)
+
+    def set_usage(self, prompt_tokens=None, completion_tokens=None):
+        if prompt_tokens is not None:
+            self.prompt_tokens = prompt_tokens
+        if completion_tokens is not None:
+            self.reported_completion_tokens = completion_tokens
+
+    @property
+    def completion_tokens(self):
+        if self.reported_completion_tokens is not None:
+            return self.reported_completion_tokens
+        return self.counted_tokens
+
+    @property
+    def text(self):
+        return "".join(self.content)
+
+    def _count(self, text):
+        if not isinstance(text, str):
+            return 0
+        if self._encoding is None:
+            try:
+                self._encoding = get_tiktoken_encoding(
+                    resolve_tiktoken_encoding(self.model) or "cl100k_base"
+                )
+            except Exception:
+                self._encoding = False
+        if self._encoding is False:
+            return estimate_tokens(text)
+        return len(self._encoding.encode_ordinary(text))
+
+
+class ToolCallAssembler:
+    """
+    Rebuilds streamed tool calls keyed by their choice and index. Each call
+    keeps its id, name and a list of argument fragments that is only joined
+    once the stream has finished, so parallel tool calls, and the calls of
+    different choices when `n > 1`, never interleave.
+    """
+
+    __slots__ = ("_calls", "_last_key")
+
+    def __init__(self):
+        self._calls = {}
+        self._last_key = None
+
+    def __bool__(self):
+        return bool(self._calls)
+
+    def add(self, index=None, id=None, name=None, arguments=None, choice=0):
+        if index is None:
+            # Providers without indexes send the id on the first delta of a call
+            if id or self._last_key is None or self._last_key[0] != choice:
+                index = sum(1 for key in self._calls if key[0] == choice)
+            else:
+                index = self._last_key[1]
+        key = self._last_key = (choice, index)
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = [None, None, []]
+        if id:
+            call[0] = id
+        if name:
+            call[1] = name
+        if arguments:
+            call[2].append(arguments)
+
+    def add_delta(self, tool_call, choice=0):
+        """
+        Add an OpenAI style `ChoiceDeltaToolCall` of the choice at `choice`."""
+        function = tool_call.function
+        self.add(
+            getattr(tool_call, "index", None),
+            getattr(tool_call, "id", None),
+            getattr(function, "name", None),
+            getattr(function, "arguments", None),
+            choice,
+        )
+
+    def tool_calls(self):
+        return [
+            {
+                "id": call_id,
+                "type": "function",
+                "function": {"name": name, "arguments": "".join(arguments)},
+            }
+            for _, (call_id, name, arguments) in sorted(self._calls.items())
+        ]
+
+
 class StreamWrapper:
     span: Span
 
     def __init__(
-        self, stream, span, prompt_tokens=0, function_call=False, tool_calls=False
+        self,
+        stream,
+        span,
+        prompt_tokens=0,
+        function_call=False,
+        tool_calls=False,
+        prompt_tokens_estimator: Optional[Callable[[], int]] = None,
+        usage_requested=False,
+        chunk_processor: Optional[ChunkProcessor] = None,
     ):
         self.stream = stream
         self.span = span
         self.prompt_tokens = prompt_tokens
+        # Only invoked at stream end when the provider did not report usage,
+        # so tokenizing the prompt never delays the first chunk
+        self.prompt_tokens_estimator = prompt_tokens_estimator
         self.function_call = function_call
         self.tool_calls = tool_calls
-        self.result_content = []
+        self.chunk_processor = chunk_processor or GenericChunkProcessor()
         self.completion_tokens = 0
+        # Completion tokens are counted as chunks arrive unless the provider was
+        # asked to report usage, so finishing a stream never tokenizes the
+        # whole completion
+        self.usage_requested = usage_requested
+        self.accumulator = CompletionAccumulator(
+            count_tokens=not usage_requested, span=span
+        )
+        self.tool_call_assembler = ToolCallAssembler()
         self._span_started = False
         self._response_model = None
+        self.stream_timer = StreamTimer(span)
         self.setup()
+        # Ends the span if the wrapper is garbage collected before the stream is
+        # exhausted or closed, without keeping the wrapper itself alive
+        self._finalizer = weakref.finalize(self, end_abandoned_stream_span, span)
 
     def setup(self):
         if not self._span_started:
             self._span_started = True
 
-    def cleanup(self):
+    def cleanup(self, abandoned=False):
+        if not self._span_started:
+            return
+        if self.prompt_tokens == 0 and self.prompt_tokens_estimator is not None:
+            try:
+                self.prompt_tokens = self.prompt_tokens_estimator()
+            except Exception:
+                pass
+            self.prompt_tokens_estimator = None
+        completion = self.accumulator.text
         if self.completion_tokens == 0:
-            response_model = "cl100k_base"
-            if self._response_model in list_encoding_names():
-                response_model = self._response_model
-            self.completion_tokens = estimate_tokens_using_tiktoken(
-                "".join(self.result_content), response_model
-            )
+            if self.usage_requested:
+                # Usage was requested but never arrived, e.g. the stream was cut short
+                self.completion_tokens = calculate_prompt_tokens(
+                    completion, self._response_model or "gpt-4"
+                )
+            else:
+                self.completion_tokens = self.accumulator.counted_tokens
         if self._span_started:
             set_span_attribute(
                 self.span,
@@ -456,32 +807,71 @@ class StreamWrapper:
                 SpanAttributes.LLM_USAGE_TOTAL_TOKENS,
                 self.prompt_tokens + self.completion_tokens,
             )
-            set_event_completion(
-                self.span,
-                [
-                    {
-                        "role": "assistant",
-                        "content": "".join(self.result_content),
-                    }
-                ],
-            )
-            self.span.set_status(StatusCode.OK)
+            self.accumulator.flush_chunk_events()
+            message = {"role": "assistant", "content": completion}
+            if self.tool_call_assembler:
+                # Same shape as non-streaming responses, tool calls replace the
+                # content unless the model also produced text
+                tool_calls = self.tool_call_assembler.tool_calls()
+                if completion:
+                    message["tool_calls"] = tool_calls
+                else:
+                    message["content"] = tool_calls
+            set_event_completion(self.span, [message])
+            self.stream_timer.finish(self.span, self.completion_tokens)
+            if abandoned:
+                set_span_attribute(
+                    self.span, STREAM_SPAN_ATTRIBUTES["STATUS"], "abandoned"
+                )
+            else:
+                self.span.set_status(StatusCode.OK)
             self.span.end()
             self._span_started = False
+            self._finalizer.detach()
+
+    def fail(self, error):
+        if not self._span_started:
+            return
+        self._span_started = False
+        self._finalizer.detach()
+        self.span.record_exception(error)
+        handle_span_error(self.span, error)
+
+    def close(self):
+        """
+        Close the underlying stream, the span ends as abandoned unless it was exhausted."""
+        try:
+            close = getattr(self.stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self.cleanup(abandoned=True)
+
+    async def aclose(self):
+        try:
+            close = getattr(self.stream, "aclose", None) or getattr(
+                self.stream, "close", None
+            )
+            if close is not None:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+        finally:
+            self.cleanup(abandoned=True)
 
     def __enter__(self):
         self.setup()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.cleanup()
+        self.close()
 
     async def __aenter__(self):
         self.setup()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.cleanup()
+        await self.aclose()
 
     def __iter__(self):
         return self
@@ -489,11 +879,15 @@ class StreamWrapper:
     def __next__(self):
         try:
             chunk = next(self.stream)
+            self.stream_timer.record_chunk()
             self.process_chunk(chunk)
             return chunk
         except StopIteration:
             self.cleanup()
             raise
+        except Exception as err:
+            self.fail(err)
+            raise
 
     def __aiter__(self):
         return self
@@ -501,152 +895,41 @@ class StreamWrapper:
     async def __anext__(self):
         try:
             chunk = await self.stream.__anext__()
+            self.stream_timer.record_chunk()
             self.process_chunk(chunk)
             return chunk
         except StopAsyncIteration:
             self.cleanup()
             raise StopAsyncIteration
+        except Exception as err:
+            self.fail(err)
+            raise
 
-    def set_response_model(self, chunk):
-        if self._response_model:
-            return
+    @property
+    def result_content(self):
+        return self.accumulator.content
 
-        # OpenAI response model is set on all chunks
-        if hasattr(chunk, "model") and chunk.model is not None:
-            self._response_model = chunk.model
-
-        # Anthropic response model is set on the first chunk message
-        if hasattr(chunk, "message") and chunk.message is not None:
-            if hasattr(chunk.message, "model") and chunk.message.model is not None:
-                self._response_model = chunk.message.model
-
-    def build_streaming_response(self, chunk):
-        content = []
-        # OpenAI
-        if hasattr(chunk, "choices") and chunk.choices is not None:
-            if not self.function_call and not self.tool_calls:
-                for choice in chunk.choices:
-                    if choice.delta and choice.delta.content is not None:
-                        content = [choice.delta.content]
-            elif self.function_call:
-                for choice in chunk.choices:
-                    if (
-                        choice.delta
-                        and choice.delta.function_call is not None
-                        and choice.delta.function_call.arguments is not None
-                    ):
-                        content = [choice.delta.function_call.arguments]
-            elif self.tool_calls:
-                for choice in chunk.choices:
-                    if choice.delta and choice.delta.tool_calls is not None:
-                        toolcalls = choice.delta.tool_calls
-                        content = []
-                        for tool_call in toolcalls:
-                            if (
-                                tool_call
-                                and tool_call.function is not None
-                                and tool_call.function.arguments is not None
-                            ):
-                                content.append(tool_call.function.arguments)
-
-        # VertexAI
-        if hasattr(chunk, "text") and chunk.text is not None:
-            content = [chunk.text]
-
-        # CohereV2
-        if (
-            hasattr(chunk, "delta")
-            and chunk.delta is not None
-            and hasattr(chunk.delta, "message")
-            and chunk.delta.message is not None
-            and hasattr(chunk.delta.message, "content")
-            and chunk.delta.message.content is not None
-            and hasattr(chunk.delta.message.content, "text")
-            and chunk.delta.message.content.text is not None
-        ):
-            content = [chunk.delta.message.content.text]
-        # google-cloud-aiplatform
-        if hasattr(chunk, "candidates") and chunk.candidates is not None:
-            for candidate in chunk.candidates:
-                if hasattr(candidate, "content") and candidate.content is not None:
-                    for part in candidate.content.parts:
-                        if hasattr(part, "text") and part.text is not None:
-                            content.append(part.text)
-        # Anthropic
-        if (
-            hasattr(chunk, "delta")
-            and chunk.delta is not None
-            and not hasattr(chunk.delta, "message")
-        ):
-            content = [chunk.delta.text] if hasattr(chunk.delta, "text") else []
-        # OpenAI Responses API
-        if hasattr(chunk, "type") and chunk.type == "response.completed":
-            content = [chunk.response.output_text]
-
-        if isinstance(chunk, dict):
-            if "message" in chunk:
-                if "content" in chunk["message"]:
-                    content = [chunk["message"]["content"]]
-        if content:
-            self.result_content.append(content[0])
-
-    def set_usage_attributes(self, chunk):
-        # Responses API OpenAI
-        if hasattr(chunk, "type") and chunk.type == "response.completed":
-            usage = chunk.response.usage
-            self.completion_tokens = usage.output_tokens
-            self.prompt_tokens = usage.input_tokens
-        # Anthropic & OpenAI
-        if hasattr(chunk, "type") and chunk.type == "message_start":
-            if hasattr(chunk.message, "usage") and chunk.message.usage is not None:
-                self.prompt_tokens = chunk.message.usage.input_tokens
-
-        # CohereV2
-        if hasattr(chunk, "type") and chunk.type == "message-end":
-            if (
-                hasattr(chunk, "delta")
-                and chunk.delta is not None
-                and hasattr(chunk.delta, "usage")
-                and chunk.delta.usage is not None
-                and hasattr(chunk.delta.usage, "billed_units")
-                and chunk.delta.usage.billed_units is not None
-            ):
-                usage = chunk.delta.usage.billed_units
-                self.completion_tokens = int(usage.output_tokens)
-                self.prompt_tokens = int(usage.input_tokens)
+    def set_response_model(self, model):
+        if not self._response_model and model is not None:
+            self._response_model = model
+            self.accumulator.set_model(model)
 
-        if hasattr(chunk, "usage") and chunk.usage is not None:
-            if hasattr(chunk.usage, "output_tokens"):
-                self.completion_tokens = chunk.usage.output_tokens
+    def append_completion(self, content, count_tokens=True):
+        self.accumulator.append(content, count_tokens)
 
-            if hasattr(chunk.usage, "prompt_tokens"):
-                self.prompt_tokens = chunk.usage.prompt_tokens
+    def add_tool_call(self, index=None, id=None, name=None, arguments=None):
+        self.tool_call_assembler.add(index, id, name, arguments)
+        self.accumulator.count(arguments)
 
-            if hasattr(chunk.usage, "completion_tokens"):
-                self.completion_tokens = chunk.usage.completion_tokens
+    def add_tool_call_delta(self, tool_call, choice=0):
+        self.tool_call_assembler.add_delta(tool_call, choice)
+        self.accumulator.count(getattr(tool_call.function, "arguments", None))
 
-        # VertexAI
-        if hasattr(chunk, "usage_metadata") and chunk.usage_metadata is not None:
-            self.completion_tokens = chunk.usage_metadata.candidates_token_count
-            self.prompt_tokens = chunk.usage_metadata.prompt_token_count
+    def process_chunk(self, chunk):
+        self.chunk_processor.process_chunk(self, chunk)
 
-        # Ollama
-        if isinstance(chunk, dict):
-            if "prompt_eval_count" in chunk:
-                self.prompt_tokens = chunk["prompt_eval_count"]
-            if "eval_count" in chunk:
-                self.completion_tokens = chunk["eval_count"]
 
-    def process_chunk(self, chunk):
-        # Mistral nests the chunk data under a `data` attribute
-        if (
-            hasattr(chunk, "data")
-            and chunk.data is not None
-            and hasattr(chunk.data, "choices")
-            and chunk.data.choices is not None
-        ):
-            chunk = chunk.data
-
-        self.set_response_model(chunk=chunk)
-        self.build_streaming_response(chunk=chunk)
-        self.set_usage_attributes(chunk=chunk)
+def end_abandoned_stream_span(span):
+    if span.is_recording():
+        span.set_attribute(STREAM_SPAN_ATTRIBUTES["STATUS"], "abandoned")
+        span.end()
@@ -1,6 +1,8 @@
 from datetime import datetime
 import json
 
+from langtrace_python_sdk.utils.serialize import to_json
+
 
 def extract_input_params(args, kwargs):
     extracted_params = {}
@@ -31,35 +33,12 @@ def to_iso_format(value):
 
 
 def serialize_kwargs(**kwargs):
-    # Function to check if a value is serializable
-    def is_serializable(value):
-        try:
-            json.dumps(value)
-            return True
-        except (TypeError, ValueError):
-            return False
-
-    # Filter out non-serializable items
-    serializable_kwargs = {k: v for k, v in kwargs.items() if is_serializable(v)}
-
-    # Convert to string representation
-    return json.dumps(serializable_kwargs)
+    # Values that are not plain JSON types are left out
+    return to_json(kwargs, expand_objects=False)
 
 
 def serialize_args(*args):
-    # Function to check if a value is serializable
-    def is_serializable(value):
-        try:
-            json.dumps(value)
-            return True
-        except (TypeError, ValueError):
-            return False
-
-    # Filter out non-serializable items
-    serializable_args = [arg for arg in args if is_serializable(arg)]
-
-    # Convert to string representation
-    return json.dumps(serializable_args)
+    return to_json(list(args), expand_objects=False)
 
 
 class datetime_encoder(json.JSONEncoder):
@@ -3,6 +3,8 @@ import requests
 from urllib.parse import urlencode
 from typing import Optional, TypedDict, Dict, List
 
+from langtrace_python_sdk.utils.prompt_templates import prompt_template_index
+
 
 class LangtracePrompt(TypedDict):
     id: str
@@ -65,6 +67,10 @@ def get_prompt_from_registry(
 
         # Extract the prompt data from the response
         prompt_data = response.json()["prompts"][0]
+        # Lets LLM spans sending this prompt link back to the template
+        prompt_template_index.remember(
+            prompt_data, prompt_registry_id, (options or {}).get("variables")
+        )
         return prompt_data
 
     except requests.RequestException as err:
@@ -0,0 +1,107 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from langtrace_python_sdk.constants.exporter.langtrace_exporter import (
+    LANGTRACE_PROMPT_TEMPLATE_REF_PREFIX,
+)
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+
+MAX_TEMPLATES = 256
+
+
+class PromptTemplateIndex:
+    """
+    The most recently fetched registry prompts, keyed by their rendered value,
+    so that LLM requests sending one of them can be linked to its template."""
+
+    def __init__(self, max_entries: int = MAX_TEMPLATES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def remember(self, prompt, template_id, variables=None):
+        value = prompt.get("value")
+        if not isinstance(value, str) or not value:
+            return
+        template = {
+            "id": template_id,
+            "version": prompt.get("version"),
+            "variables": dict(variables or {}),
+        }
+        with self._lock:
+            self._entries[value] = template
+            self._entries.move_to_end(value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, value) -> Optional[Dict[str, Any]]:
+        return self._entries.get(value)
+
+
+prompt_template_index = PromptTemplateIndex()
+
+
+def template_reference(template) -> str:
+    prefix = LANGTRACE_PROMPT_TEMPLATE_REF_PREFIX
+    return f"{prefix}{template['id']}@{template['version']}"
+
+
+def link_prompt_templates(prompts) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Find the messages of a request that were rendered from registry prompts.
+    Returns the prompts to record, where each such message is replaced by a
+    template reference in the `template` capture mode, and the span attributes
+    describing the templates and their variables. The variables are user data
+    and are left out when prompt and completion capture is disabled."""
+    if not prompt_template_index or not isinstance(prompts, list):
+        return prompts, {}
+
+    runtime_config = get_runtime_config()
+    replace = runtime_config.prompt_capture == "template"
+    keep_variables = runtime_config.trace_prompt_completion_data
+    templates = []
+    linked = None
+    for index, message in enumerate(prompts):
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, str):
+            continue
+        template = prompt_template_index.get(content)
+        if template is None:
+            continue
+        linked_template = {"message_index": index, **template}
+        if not keep_variables:
+            del linked_template["variables"]
+        templates.append(linked_template)
+        if replace:
+            if linked is None:
+                linked = list(prompts)
+            linked[index] = {**message, "content": template_reference(template)}
+
+    if not templates:
+        return prompts, {}
+    return linked or prompts, {
+        "langtrace.prompt.template.id": templates[0]["id"],
+        "langtrace.prompt.template.version": templates[0]["version"],
+        "langtrace.prompt.templates": json.dumps(templates),
+    }
@@ -0,0 +1,103 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import threading
+from typing import List, Optional, Pattern, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from langtrace_python_sdk.constants.instrumentation.common import SERVICE_PROVIDERS
+
+# OpenAI compatible providers, told apart by the base URL of the client
+DEFAULT_PROVIDER_PATTERNS = [
+    ("perplexity", SERVICE_PROVIDERS["PPLX"]),
+    ("azure", SERVICE_PROVIDERS["AZURE"]),
+    ("groq", SERVICE_PROVIDERS["GROQ"]),
+    ("x.ai", SERVICE_PROVIDERS["XAI"]),
+    ("deepseek", SERVICE_PROVIDERS["DEEPSEEK"]),
+    (":12000", SERVICE_PROVIDERS["ARCH"]),
+    (":10000", SERVICE_PROVIDERS["ARCH"]),
+]
+
+
+class ProviderRegistry:
+    """
+    Maps the base URL of an OpenAI compatible client to its service provider.
+    Patterns are substrings of the URL or compiled regular expressions, and are
+    tried in order with the most recently registered first. The result is
+    cached per client, so a request costs a single lookup as long as the
+    client keeps its base URL."""
+
+    def __init__(self, patterns=DEFAULT_PROVIDER_PATTERNS):
+        self._patterns: List[Tuple[Union[str, Pattern], str]] = list(patterns)
+        self._cache = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def register(self, pattern: Union[str, Pattern], provider: str):
+        with self._lock:
+            self._patterns.insert(0, (pattern, provider))
+            self._cache = WeakKeyDictionary()
+
+    def match(self, base_url: str) -> Optional[str]:
+        for pattern, provider in self._patterns:
+            if isinstance(pattern, str):
+                if pattern in base_url:
+                    return provider
+            elif pattern.search(base_url):
+                return provider
+        return None
+
+    def lookup(self, instance) -> Tuple[str, Optional[str]]:
+        """
+        The base URL of the client behind `instance` and its provider, if any
+        pattern matches."""
+        client = getattr(instance, "_client", None)
+        url = getattr(client, "_base_url", None)
+        if url is None:
+            return "", None
+
+        cache = self._cache
+        try:
+            entry = cache.get(client)
+        except TypeError:
+            # Clients that can't be weakly referenced are resolved every time
+            base_url = str(url)
+            return base_url, self.match(base_url)
+        if entry is not None and entry[0] is url:
+            return entry[1], entry[2]
+
+        base_url = str(url)
+        entry = (url, base_url, self.match(base_url))
+        cache[client] = entry
+        return entry[1], entry[2]
+
+    def resolve(self, instance, default: str) -> str:
+        return self.lookup(instance)[1] or default
+
+
+provider_registry = ProviderRegistry()
+
+
+def register_provider(pattern: Union[str, Pattern], provider: str):
+    """
+    Report the calls made through clients whose base URL contains `pattern`
+    (or matches it, for a compiled regular expression) as `provider`, e.g. a
+    vLLM server, LM Studio or an internal gateway.
+
+    Example:
+        register_provider("llm-gateway.internal", "Internal Gateway")
+        register_provider(re.compile(r":8000/v1$"), "vLLM")
+    """
+    provider_registry.register(pattern, provider)
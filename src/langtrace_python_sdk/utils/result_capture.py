@@ -0,0 +1,141 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional
+
+from langtrace_python_sdk.utils.capture_limits import truncate
+
+DEFAULT_MAX_MATCHES = 10
+DEFAULT_MAX_EVENT_BYTES = 4096
+RESULT_CAPTURE_MODES = ("full", "scores")
+
+
+def _read_int(name, default):
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def _read_fields(value):
+    fields = frozenset(field.strip() for field in (value or "").split(","))
+    return (fields - {""}) or None
+
+
+class ResultCapturePolicy:
+    """
+    Decides how much of a vector search response is recorded on the span: the
+    top `max_matches` matches, only the `fields` of their metadata (all when
+    None), at most `max_event_bytes` per match, and nothing but ids and scores
+    in the `scores` mode.
+    """
+
+    def __init__(
+        self,
+        max_matches: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+        max_event_bytes: Optional[int] = None,
+        mode: Optional[str] = None,
+    ):
+        self.max_matches = (
+            _read_int("LANGTRACE_VECTOR_RESULT_MAX_MATCHES", DEFAULT_MAX_MATCHES)
+            if max_matches is None
+            else max_matches
+        )
+        self.fields = (
+            _read_fields(os.environ.get("LANGTRACE_VECTOR_RESULT_FIELDS"))
+            if fields is None
+            else frozenset(fields)
+        )
+        self.max_event_bytes = (
+            _read_int("LANGTRACE_VECTOR_RESULT_MAX_EVENT_BYTES", DEFAULT_MAX_EVENT_BYTES)
+            if max_event_bytes is None
+            else max_event_bytes
+        )
+        mode = mode or os.environ.get("LANGTRACE_VECTOR_RESULT_MODE", "full")
+        self.mode = mode if mode in RESULT_CAPTURE_MODES else "full"
+
+    @property
+    def scores_only(self) -> bool:
+        return self.mode == "scores"
+
+    def top(self, matches) -> Iterable:
+        """
+        The matches to record, without reading past the last of them."""
+        if matches is None:
+            return ()
+        return islice(matches, self.max_matches)
+
+    def select_fields(self, values: Dict[str, Any], keep=()) -> Dict[str, Any]:
+        """
+        Keep the configured fields of a metadata or entity dict, plus `keep`."""
+        if self.fields is None or not isinstance(values, dict):
+            return values
+        return {
+            key: value
+            for key, value in values.items()
+            if key in self.fields or key in keep
+        }
+
+    def match_attributes(
+        self,
+        key_attributes: Dict[str, Any],
+        payload: Optional[Dict[str, Any]] = None,
+        encode_values: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Event attributes of a single match. `key_attributes` (ids, scores) are
+        always kept. `payload` values (metadata, documents, entities) are
+        dropped in the scores mode, dicts among them are reduced to the
+        selected fields, and all of them share the per-event byte cap. Lists
+        and dicts are JSON encoded, as event attributes require, unless
+        `encode_values` is false; then only those over the cap are cut as
+        JSON text."""
+        attributes = {
+            key: value for key, value in key_attributes.items() if value is not None
+        }
+        if self.scores_only or not payload:
+            return attributes
+
+        remaining = self.max_event_bytes
+        for name, value in payload.items():
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                value = self.select_fields(value)
+            if isinstance(value, str):
+                text = value
+            elif isinstance(value, (bool, int, float)):
+                text = None
+            else:
+                text = json.dumps(value, default=str)
+                if encode_values:
+                    value = text
+            if text is not None and self.max_event_bytes:
+                if remaining <= 0:
+                    break
+                encoded = text.encode("utf-8", "surrogatepass")
+                if len(encoded) > remaining:
+                    value = truncate(encoded, remaining)
+                remaining -= len(encoded)
+            attributes[name] = value
+        return attributes
+
+
+result_capture_policy = ResultCapturePolicy()
@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import threading
+from typing import NamedTuple, Optional
+
+
+class RuntimeConfig(NamedTuple):
+    """
+    Settings consulted on every traced call. The environment is read once, when
+    the SDK is imported and again by `langtrace.init`; later changes go through
+    `update_runtime_config` (or `langtrace.reconfigure`), which swaps in a new
+    instance."""
+
+    trace_prompt_completion_data: bool = True
+    session_id: Optional[str] = None
+    completion_chunk_events: str = "off"
+    keep_image_thumbnails: bool = False
+    vector_norm_stats: bool = False
+    vector_score_stats: bool = False
+    prompt_capture: str = "full"
+
+
+def _read_flag(name, default):
+    return os.environ.get(name, default).lower() == "true"
+
+
+def runtime_config_from_env() -> RuntimeConfig:
+    return RuntimeConfig(
+        trace_prompt_completion_data=(
+            os.environ.get("TRACE_PROMPT_COMPLETION_DATA", "true").lower() != "false"
+        ),
+        session_id=os.environ.get("LANGTRACE_SESSION_ID") or None,
+        completion_chunk_events=os.environ.get(
+            "LANGTRACE_COMPLETION_CHUNK_EVENTS", "off"
+        ),
+        keep_image_thumbnails=_read_flag("LANGTRACE_KEEP_IMAGE_THUMBNAILS", "false"),
+        vector_norm_stats=_read_flag("LANGTRACE_VECTOR_NORM_STATS", "false"),
+        vector_score_stats=_read_flag("LANGTRACE_VECTOR_SCORE_STATS", "false"),
+        prompt_capture=os.environ.get("LANGTRACE_PROMPT_CAPTURE", "full").lower(),
+    )
+
+
+_runtime_config = runtime_config_from_env()
+_lock = threading.Lock()
+
+
+def get_runtime_config() -> RuntimeConfig:
+    return _runtime_config
+
+
+def update_runtime_config(**changes) -> RuntimeConfig:
+    """
+    Replace the runtime config with a copy carrying `changes`. Arguments
+    left as None are unchanged."""
+    global _runtime_config
+    with _lock:
+        _runtime_config = _runtime_config._replace(
+            **{name: value for name, value in changes.items() if value is not None}
+        )
+        return _runtime_config
+
+
+def load_runtime_config(**overrides) -> RuntimeConfig:
+    """
+    Read the runtime config from the environment again, then apply
+    `overrides` as `update_runtime_config` does."""
+    global _runtime_config
+    with _lock:
+        _runtime_config = runtime_config_from_env()
+    return update_runtime_config(**overrides)
@@ -0,0 +1,111 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+
+from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+from langtrace_python_sdk.utils.silently_fail import silently_fail
+
+# NumPy only pays off once the per-call conversion cost is amortized
+NUMPY_MIN_SIZE = 64
+
+# NumPy is imported on the first call with NUMPY_MIN_SIZE scores, not with the
+# SDK; False once the import has failed
+_numpy = None
+
+
+def _load_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def compute_score_stats(scores: Iterable) -> Optional[Dict[str, float]]:
+    """
+    Distribution of the scores (or distances) of ranked matches: count, min,
+    max, mean, p50, p90, the gap between the first two matches and the largest
+    gap between consecutive matches. Missing scores are skipped; returns None
+    when no score is left."""
+    values = [float(score) for score in scores if score is not None]
+    values = [value for value in values if not math.isnan(value)]
+    if not values:
+        return None
+    if len(values) >= NUMPY_MIN_SIZE:
+        np = _load_numpy()
+        if np is not None:
+            return _numpy_stats(np, values)
+    return _python_stats(values)
+
+
+def _numpy_stats(np, values: List[float]) -> Dict[str, float]:
+    array = np.asarray(values, dtype=float)
+    p50, p90 = np.percentile(array, [50, 90])
+    gaps = np.abs(np.diff(array))
+    return {
+        "count": int(array.size),
+        "min": float(array.min()),
+        "max": float(array.max()),
+        "mean": float(array.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "top_gap": float(gaps[0]),
+        "max_gap": float(gaps.max()),
+    }
+
+
+def _python_stats(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    gaps = [abs(b - a) for a, b in zip(values, values[1:])] or [0.0]
+    return {
+        "count": len(values),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": math.fsum(values) / len(values),
+        "p50": _percentile(ordered, 0.5),
+        "p90": _percentile(ordered, 0.9),
+        "top_gap": gaps[0],
+        "max_gap": max(gaps),
+    }
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    # Linear interpolation, same as NumPy's default
+    position = (len(ordered) - 1) * quantile
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@silently_fail
+def set_score_stats_attributes(span, prefix, scores):
+    """
+    Record `<prefix>.<stat>` attributes for the scores of the matches, in the
+    order they were ranked, when LANGTRACE_VECTOR_SCORE_STATS is enabled."""
+    if not get_runtime_config().vector_score_stats:
+        return
+    stats = compute_score_stats(scores)
+    if stats is None:
+        return
+    for name, value in stats.items():
+        set_span_attribute(span, f"{prefix}.{name}", value)
@@ -0,0 +1,217 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import math
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from enum import Enum
+
+DEFAULT_MAX_DEPTH = 10
+DEFAULT_MAX_ITEMS = 100
+DEFAULT_MAX_BYTES = 65536
+
+_SCALARS = (bool, int, type(None))
+_EMPTY = (None, "", [], {})
+# Returned for values that are left out of their container
+_OMIT = object()
+
+
+class _Walker:
+    """
+    Turns an arbitrary value into plain JSON types in one pass, enforcing the
+    depth, item and (approximate, counted in characters) byte limits and
+    replacing reference cycles with a marker."""
+
+    __slots__ = (
+        "drop_empty",
+        "expand_objects",
+        "expand_nested_objects",
+        "max_depth",
+        "max_items",
+        "budget",
+    )
+
+    def __init__(
+        self,
+        drop_empty,
+        expand_objects,
+        expand_nested_objects,
+        max_depth,
+        max_items,
+        max_bytes,
+    ):
+        self.drop_empty = drop_empty
+        self.expand_objects = expand_objects
+        self.expand_nested_objects = expand_nested_objects
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.budget = max_bytes
+
+    def walk(self, value, depth, active, in_mapping=False):
+        kind = type(value)
+        if kind is str:
+            return self._string(value)
+        if kind in _SCALARS:
+            self.budget -= 6
+            return value
+        if kind is float:
+            self.budget -= 12
+            return value if math.isfinite(value) else str(value)
+        if kind is dict:
+            return self._mapping(value, depth, active)
+        if kind is list or kind is tuple:
+            return self._sequence(value, depth, active)
+        return self._other(value, depth, active, in_mapping)
+
+    def _string(self, value):
+        if self.drop_empty:
+            value = value.strip()
+        if len(value) > self.budget:
+            value = value[: max(self.budget, 0)] + "..."
+        self.budget -= len(value) + 2
+        return value
+
+    def _enter(self, value, depth, active):
+        if id(value) in active:
+            return "<cycle>"
+        if depth >= self.max_depth:
+            return f"<{type(value).__name__}>"
+        return None
+
+    def _keep(self, item):
+        if item is _OMIT:
+            return False
+        return not (self.drop_empty and item in _EMPTY)
+
+    def _mapping(self, value, depth, active):
+        marker = self._enter(value, depth, active)
+        if marker is not None:
+            return marker
+        active.add(id(value))
+        result = {}
+        count = 0
+        for key, item in value.items():
+            if count >= self.max_items or self.budget <= 0:
+                result["..."] = f"{len(value) - count} more items"
+                break
+            count += 1
+            item = self.walk(item, depth + 1, active, in_mapping=True)
+            if self._keep(item):
+                key = key if type(key) is str else str(key)
+                self.budget -= len(key) + 4
+                result[key] = item
+        active.discard(id(value))
+        return result
+
+    def _sequence(self, value, depth, active):
+        marker = self._enter(value, depth, active)
+        if marker is not None:
+            return marker
+        active.add(id(value))
+        result = []
+        count = 0
+        for item in value:
+            if count >= self.max_items or self.budget <= 0:
+                result.append(f"... {len(value) - count} more items")
+                break
+            count += 1
+            item = self.walk(item, depth + 1, active)
+            if self._keep(item):
+                result.append(item)
+        active.discard(id(value))
+        return result
+
+    def _other(self, value, depth, active, in_mapping):
+        # Subclasses of the builtin types: str enums, named tuples, ...
+        if isinstance(value, Enum):
+            return self.walk(value.value, depth, active, in_mapping)
+        if isinstance(value, str):
+            return self._string(str(value))
+        if isinstance(value, int):
+            return self.walk(int(value), depth, active)
+        if isinstance(value, float):
+            return self.walk(float(value), depth, active)
+        if isinstance(value, Mapping):
+            return self._mapping(value, depth, active)
+        if isinstance(value, (list, tuple)):
+            return self._sequence(value, depth, active)
+        if not self.expand_objects:
+            return _OMIT
+        if isinstance(value, (set, frozenset)):
+            return self._sequence(list(value), depth, active)
+        if isinstance(value, (datetime, date, time)):
+            return self._string(value.isoformat())
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self._string(f"<{len(value)} bytes>")
+        try:
+            if in_mapping and not self.expand_nested_objects:
+                # Nested objects are reduced to their text, as langchain
+                # documents and messages, or left out
+                text = getattr(value, "text", None)
+                return self._string(text) if isinstance(text, str) else _OMIT
+            attributes = getattr(value, "__dict__", None)
+            if attributes is not None:
+                marker = self._enter(value, depth, active)
+                if marker is not None:
+                    return marker
+                active.add(id(value))
+                try:
+                    return self._mapping(attributes, depth + 1, active)
+                finally:
+                    active.discard(id(value))
+            return self._string(str(value))
+        except Exception:
+            return f"<{type(value).__name__}>"
+
+
+def to_json(
+    value,
+    drop_empty=False,
+    expand_objects=True,
+    expand_nested_objects=False,
+    max_depth=DEFAULT_MAX_DEPTH,
+    max_items=DEFAULT_MAX_ITEMS,
+    max_bytes=DEFAULT_MAX_BYTES,
+) -> str:
+    """
+    Serialize framework inputs and outputs to compact JSON.
+
+    Containers deeper than `max_depth` and items past `max_items` per container
+    are replaced by markers, strings are cut once `max_bytes` is spent, and
+    reference cycles never recurse. With `drop_empty`, strings are stripped and
+    None, empty strings and empty containers are left out. Other objects are
+    expanded through their attributes when `expand_objects` is set, and left
+    out otherwise. Objects that are values of a mapping are reduced to their
+    `text` attribute, unless `expand_nested_objects` is set too."""
+    walker = _Walker(
+        drop_empty,
+        expand_objects,
+        expand_nested_objects,
+        max_depth,
+        max_items,
+        max_bytes,
+    )
+    result = walker.walk(value, 0, set())
+    return json.dumps(None if result is _OMIT else result, separators=(",", ":"))
+
+
+def to_json_string(any_object, expand_nested_objects=False):
+    """
+    JSON of framework inputs and outputs, omitting empty or None values."""
+    return to_json(
+        any_object, drop_empty=True, expand_nested_objects=expand_nested_objects
+    )
@@ -0,0 +1,183 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+import time
+from typing import List, Optional
+
+from langtrace.trace_attributes import SpanAttributes
+from opentelemetry import metrics
+from opentelemetry.trace import Span
+
+from langtrace_python_sdk.constants import LANGTRACE_SDK_NAME
+from langtrace_python_sdk.constants.instrumentation.common import (
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.utils import set_span_attribute
+
+# Inter-chunk gaps are bucketed geometrically from 0.1ms up to ~3 minutes, so
+# percentiles are estimated within ~10% using a fixed amount of memory
+_BUCKET_BASE_MS = 0.1
+_BUCKET_GROWTH = 1.2
+_BUCKET_COUNT = 80
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+
+_meter = metrics.get_meter(LANGTRACE_SDK_NAME)
+_time_to_first_token = _meter.create_histogram(
+    "llm.stream.time_to_first_token",
+    unit="ms",
+    description="Time from the request until the first streamed chunk",
+)
+_stream_duration = _meter.create_histogram(
+    "llm.stream.duration",
+    unit="ms",
+    description="Time from the request until the stream was exhausted",
+)
+_inter_chunk_latency = _meter.create_histogram(
+    "llm.stream.inter_chunk_latency",
+    unit="ms",
+    description="Mean time between consecutive streamed chunks",
+)
+_tokens_per_second = _meter.create_histogram(
+    "llm.stream.tokens_per_second",
+    unit="{token}/s",
+    description="Completion tokens generated per second after the first chunk",
+)
+
+
+class StreamTimer:
+    """
+    Tracks time to first token, duration and chunk cadence of a single stream.
+    Memory stays constant whatever the length of the stream.
+    """
+
+    __slots__ = (
+        "_start_ns",
+        "_first_ns",
+        "_last_ns",
+        "_chunks",
+        "_gap_sum_ms",
+        "_gap_max_ms",
+        "_buckets",
+        "_finished",
+    )
+
+    def __init__(self, span: Optional[Span] = None):
+        # Measure from the span start so TTFT includes the request round trip
+        start_ns = getattr(span, "start_time", None)
+        self._start_ns = start_ns if isinstance(start_ns, int) else time.time_ns()
+        self._first_ns = None
+        self._last_ns = None
+        self._chunks = 0
+        self._gap_sum_ms = 0.0
+        self._gap_max_ms = 0.0
+        self._buckets: Optional[List[int]] = None
+        self._finished = False
+
+    def record_chunk(self):
+        now = time.time_ns()
+        self._chunks += 1
+        if self._first_ns is None:
+            self._first_ns = now
+        else:
+            gap_ms = (now - self._last_ns) / 1e6
+            self._gap_sum_ms += gap_ms
+            if gap_ms > self._gap_max_ms:
+                self._gap_max_ms = gap_ms
+            if self._buckets is None:
+                self._buckets = [0] * _BUCKET_COUNT
+            self._buckets[_bucket_index(gap_ms)] += 1
+        self._last_ns = now
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """
+        Estimate an inter-chunk latency percentile in milliseconds."""
+        if self._buckets is None:
+            return None
+        rank = max(1, math.ceil(quantile * (self._chunks - 1)))
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if seen >= rank:
+                upper = _BUCKET_BASE_MS * _BUCKET_GROWTH**index
+                estimate = upper / math.sqrt(_BUCKET_GROWTH) if index else upper
+                return min(estimate, self._gap_max_ms)
+        return self._gap_max_ms
+
+    def finish(self, span: Span, completion_tokens=None):
+        """
+        Set the latency attributes on `span` and record the stream metrics. Call
+        this before the span ends, only the first call has an effect."""
+        if self._finished:
+            return
+        self._finished = True
+        duration_ms = (time.time_ns() - self._start_ns) / 1e6
+        attributes = getattr(span, "attributes", None) or {}
+        metric_attributes = {
+            key: attributes[key]
+            for key in (
+                SpanAttributes.LANGTRACE_SERVICE_NAME,
+                SpanAttributes.LLM_REQUEST_MODEL,
+            )
+            if key in attributes
+        }
+
+        set_span_attribute(span, STREAM_SPAN_ATTRIBUTES["DURATION"], duration_ms)
+        set_span_attribute(span, STREAM_SPAN_ATTRIBUTES["CHUNKS"], self._chunks)
+        _stream_duration.record(duration_ms, metric_attributes)
+        if self._first_ns is None:
+            return
+
+        ttft_ms = (self._first_ns - self._start_ns) / 1e6
+        set_span_attribute(span, STREAM_SPAN_ATTRIBUTES["TIME_TO_FIRST_TOKEN"], ttft_ms)
+        _time_to_first_token.record(ttft_ms, metric_attributes)
+
+        if completion_tokens is None:
+            completion_tokens = attributes.get(
+                SpanAttributes.LLM_USAGE_COMPLETION_TOKENS
+            )
+        generation_s = (self._last_ns - self._first_ns) / 1e9
+        if completion_tokens and generation_s > 0:
+            tokens_per_second = completion_tokens / generation_s
+            set_span_attribute(
+                span, STREAM_SPAN_ATTRIBUTES["TOKENS_PER_SECOND"], tokens_per_second
+            )
+            _tokens_per_second.record(tokens_per_second, metric_attributes)
+
+        if self._chunks > 1:
+            mean_ms = self._gap_sum_ms / (self._chunks - 1)
+            set_span_attribute(
+                span, STREAM_SPAN_ATTRIBUTES["INTER_CHUNK_LATENCY_MEAN"], mean_ms
+            )
+            set_span_attribute(
+                span,
+                STREAM_SPAN_ATTRIBUTES["INTER_CHUNK_LATENCY_MAX"],
+                self._gap_max_ms,
+            )
+            for name, quantile in (("P50", 0.5), ("P90", 0.9), ("P99", 0.99)):
+                set_span_attribute(
+                    span,
+                    STREAM_SPAN_ATTRIBUTES[f"INTER_CHUNK_LATENCY_{name}"],
+                    self.percentile(quantile),
+                )
+            _inter_chunk_latency.record(mean_ms, metric_attributes)
+
+
+def _bucket_index(value_ms: float) -> int:
+    if value_ms <= _BUCKET_BASE_MS:
+        return 0
+    index = math.ceil(math.log(value_ms / _BUCKET_BASE_MS) / _LOG_GROWTH)
+    return min(index, _BUCKET_COUNT - 1)
@@ -0,0 +1,356 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ChunkProcessor(ABC):
+    """
+    Extracts the response model, completion content and usage from the chunks of
+    a single provider's stream. The instrumentation picks the processor when it
+    wraps the stream, so each chunk only pays for the attribute reads of its own
+    provider.
+    """
+
+    @abstractmethod
+    def process_chunk(self, stream, chunk):
+        pass
+
+
+class OpenAIChunkProcessor(ChunkProcessor):
+    """
+    Chat completion chunks of OpenAI and OpenAI compatible clients (LiteLLM, Cerebras)."""
+
+    def process_chunk(self, stream, chunk):
+        if stream._response_model is None:
+            stream.set_response_model(getattr(chunk, "model", None))
+
+        choices = getattr(chunk, "choices", None)
+        if choices:
+            content = None
+            for choice in choices:
+                delta = choice.delta
+                if delta is None:
+                    continue
+                if stream.function_call:
+                    function_call = getattr(delta, "function_call", None)
+                    if function_call is not None and function_call.arguments is not None:
+                        content = function_call.arguments
+                        continue
+                tool_calls = getattr(delta, "tool_calls", None)
+                if tool_calls:
+                    for tool_call in tool_calls:
+                        if tool_call and tool_call.function is not None:
+                            stream.add_tool_call_delta(
+                                tool_call, getattr(choice, "index", 0)
+                            )
+                elif delta.content is not None:
+                    content = delta.content
+            if content:
+                stream.append_completion(content)
+
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            prompt_tokens = getattr(usage, "prompt_tokens", None)
+            if prompt_tokens is not None:
+                stream.prompt_tokens = prompt_tokens
+            completion_tokens = getattr(usage, "completion_tokens", None)
+            if completion_tokens is not None:
+                stream.completion_tokens = completion_tokens
+
+
+class MistralChunkProcessor(OpenAIChunkProcessor):
+    """
+    Mistral nests the OpenAI shaped chunk data under a `data` attribute."""
+
+    def process_chunk(self, stream, chunk):
+        data = getattr(chunk, "data", None)
+        if data is not None:
+            chunk = data
+        super().process_chunk(stream, chunk)
+
+
+class OpenAIResponsesChunkProcessor(ChunkProcessor):
+    """
+    OpenAI Responses API events, only the final `response.completed` event is used."""
+
+    def process_chunk(self, stream, chunk):
+        if getattr(chunk, "type", None) != "response.completed":
+            return
+        response = chunk.response
+        stream.set_response_model(getattr(response, "model", None))
+        # The completed event always carries usage, no need to count it
+        stream.append_completion(response.output_text, count_tokens=False)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            stream.prompt_tokens = usage.input_tokens
+            stream.completion_tokens = usage.output_tokens
+
+
+class AnthropicChunkProcessor(ChunkProcessor):
+    """
+    Anthropic message stream events."""
+
+    def process_chunk(self, stream, chunk):
+        chunk_type = getattr(chunk, "type", None)
+        if chunk_type == "content_block_delta":
+            delta = chunk.delta
+            text = getattr(delta, "text", None)
+            if text:
+                stream.append_completion(text)
+            elif getattr(delta, "type", None) == "input_json_delta":
+                stream.add_tool_call(
+                    getattr(chunk, "index", None), arguments=delta.partial_json
+                )
+        elif chunk_type == "content_block_start":
+            block = chunk.content_block
+            if getattr(block, "type", None) == "tool_use":
+                stream.add_tool_call(getattr(chunk, "index", None), block.id, block.name)
+        elif chunk_type == "message_start":
+            message = chunk.message
+            stream.set_response_model(getattr(message, "model", None))
+            usage = getattr(message, "usage", None)
+            if usage is not None:
+                stream.prompt_tokens = usage.input_tokens
+        elif chunk_type == "message_delta":
+            usage = getattr(chunk, "usage", None)
+            if usage is not None and usage.output_tokens is not None:
+                stream.completion_tokens = usage.output_tokens
+
+
+class CohereV2ChunkProcessor(ChunkProcessor):
+    """
+    Cohere v2 chat stream events."""
+
+    def process_chunk(self, stream, chunk):
+        chunk_type = getattr(chunk, "type", None)
+        if chunk_type == "content-delta":
+            try:
+                text = chunk.delta.message.content.text
+            except AttributeError:
+                return
+            if text:
+                stream.append_completion(text)
+        elif chunk_type == "message-end":
+            try:
+                usage = chunk.delta.usage.billed_units
+            except AttributeError:
+                return
+            if usage is not None:
+                stream.completion_tokens = int(usage.output_tokens)
+                stream.prompt_tokens = int(usage.input_tokens)
+
+
+class VertexAIChunkProcessor(ChunkProcessor):
+    """
+    Generation responses of vertexai and google-cloud-aiplatform."""
+
+    def process_chunk(self, stream, chunk):
+        candidates = getattr(chunk, "candidates", None)
+        if candidates:
+            content = candidates[0].content
+            if content is not None:
+                text = "".join(
+                    part.text for part in content.parts if getattr(part, "text", None)
+                )
+                if text:
+                    stream.append_completion(text)
+        else:
+            # Language model responses only expose the generated text
+            text = getattr(chunk, "text", None)
+            if text:
+                stream.append_completion(text)
+
+        usage = getattr(chunk, "usage_metadata", None)
+        if usage is not None:
+            stream.completion_tokens = usage.candidates_token_count
+            stream.prompt_tokens = usage.prompt_token_count
+
+
+class OllamaChunkProcessor(ChunkProcessor):
+    """
+    Ollama chat and generate chunks, either plain dicts or subscriptable response models."""
+
+    def process_chunk(self, stream, chunk):
+        if not isinstance(chunk, dict):
+            chunk = getattr(chunk, "__dict__", None) or {}
+
+        if stream._response_model is None:
+            stream.set_response_model(chunk.get("model"))
+
+        message = chunk.get("message")
+        if message is not None:
+            content = (
+                message.get("content")
+                if isinstance(message, dict)
+                else getattr(message, "content", None)
+            )
+        else:
+            content = chunk.get("response")
+        if content:
+            stream.append_completion(content)
+
+        if chunk.get("prompt_eval_count") is not None:
+            stream.prompt_tokens = chunk["prompt_eval_count"]
+        if chunk.get("eval_count") is not None:
+            stream.completion_tokens = chunk["eval_count"]
+
+
+class GenericChunkProcessor(ChunkProcessor):
+    """
+    Probes every known chunk shape, used when the provider of a stream is unknown."""
+
+    def process_chunk(self, stream, chunk):
+        # Mistral nests the chunk data under a `data` attribute
+        if (
+            hasattr(chunk, "data")
+            and chunk.data is not None
+            and hasattr(chunk.data, "choices")
+            and chunk.data.choices is not None
+        ):
+            chunk = chunk.data
+
+        self.set_response_model(stream, chunk)
+        self.build_streaming_response(stream, chunk)
+        self.set_usage_attributes(stream, chunk)
+
+    def set_response_model(self, stream, chunk):
+        if stream._response_model:
+            return
+
+        # OpenAI response model is set on all chunks
+        if hasattr(chunk, "model") and chunk.model is not None:
+            stream.set_response_model(chunk.model)
+
+        # Anthropic response model is set on the first chunk message
+        if hasattr(chunk, "message") and chunk.message is not None:
+            if hasattr(chunk.message, "model") and chunk.message.model is not None:
+                stream.set_response_model(chunk.message.model)
+
+    def build_streaming_response(self, stream, chunk):
+        content = []
+        # OpenAI
+        if hasattr(chunk, "choices") and chunk.choices is not None:
+            if not stream.function_call and not stream.tool_calls:
+                for choice in chunk.choices:
+                    if choice.delta and choice.delta.content is not None:
+                        content = [choice.delta.content]
+            elif stream.function_call:
+                for choice in chunk.choices:
+                    if (
+                        choice.delta
+                        and choice.delta.function_call is not None
+                        and choice.delta.function_call.arguments is not None
+                    ):
+                        content = [choice.delta.function_call.arguments]
+            elif stream.tool_calls:
+                for choice in chunk.choices:
+                    if choice.delta and choice.delta.tool_calls is not None:
+                        for tool_call in choice.delta.tool_calls:
+                            if tool_call and tool_call.function is not None:
+                                stream.add_tool_call_delta(
+                                    tool_call, getattr(choice, "index", 0)
+                                )
+
+        # VertexAI
+        if hasattr(chunk, "text") and chunk.text is not None:
+            content = [chunk.text]
+
+        # CohereV2
+        if (
+            hasattr(chunk, "delta")
+            and chunk.delta is not None
+            and hasattr(chunk.delta, "message")
+            and chunk.delta.message is not None
+            and hasattr(chunk.delta.message, "content")
+            and chunk.delta.message.content is not None
+            and hasattr(chunk.delta.message.content, "text")
+            and chunk.delta.message.content.text is not None
+        ):
+            content = [chunk.delta.message.content.text]
+        # google-cloud-aiplatform
+        if hasattr(chunk, "candidates") and chunk.candidates is not None:
+            for candidate in chunk.candidates:
+                if hasattr(candidate, "content") and candidate.content is not None:
+                    for part in candidate.content.parts:
+                        if hasattr(part, "text") and part.text is not None:
+                            content.append(part.text)
+        # Anthropic
+        if (
+            hasattr(chunk, "delta")
+            and chunk.delta is not None
+            and not hasattr(chunk.delta, "message")
+        ):
+            content = [chunk.delta.text] if hasattr(chunk.delta, "text") else []
+        # OpenAI Responses API
+        if hasattr(chunk, "type") and chunk.type == "response.completed":
+            # The completed event always carries usage, no need to count it
+            stream.append_completion(chunk.response.output_text, count_tokens=False)
+            return
+
+        if isinstance(chunk, dict):
+            if "message" in chunk:
+                if "content" in chunk["message"]:
+                    content = [chunk["message"]["content"]]
+        if content:
+            stream.append_completion(content[0])
+
+    def set_usage_attributes(self, stream, chunk):
+        # Responses API OpenAI
+        if hasattr(chunk, "type") and chunk.type == "response.completed":
+            usage = chunk.response.usage
+            stream.completion_tokens = usage.output_tokens
+            stream.prompt_tokens = usage.input_tokens
+        # Anthropic & OpenAI
+        if hasattr(chunk, "type") and chunk.type == "message_start":
+            if hasattr(chunk.message, "usage") and chunk.message.usage is not None:
+                stream.prompt_tokens = chunk.message.usage.input_tokens
+
+        # CohereV2
+        if hasattr(chunk, "type") and chunk.type == "message-end":
+            if (
+                hasattr(chunk, "delta")
+                and chunk.delta is not None
+                and hasattr(chunk.delta, "usage")
+                and chunk.delta.usage is not None
+                and hasattr(chunk.delta.usage, "billed_units")
+                and chunk.delta.usage.billed_units is not None
+            ):
+                usage = chunk.delta.usage.billed_units
+                stream.completion_tokens = int(usage.output_tokens)
+                stream.prompt_tokens = int(usage.input_tokens)
+
+        if hasattr(chunk, "usage") and chunk.usage is not None:
+            if hasattr(chunk.usage, "output_tokens"):
+                stream.completion_tokens = chunk.usage.output_tokens
+
+            if hasattr(chunk.usage, "prompt_tokens"):
+                stream.prompt_tokens = chunk.usage.prompt_tokens
+
+            if hasattr(chunk.usage, "completion_tokens"):
+                stream.completion_tokens = chunk.usage.completion_tokens
+
+        # VertexAI
+        if hasattr(chunk, "usage_metadata") and chunk.usage_metadata is not None:
+            stream.completion_tokens = chunk.usage_metadata.candidates_token_count
+            stream.prompt_tokens = chunk.usage_metadata.prompt_token_count
+
+        # Ollama
+        if isinstance(chunk, dict):
+            if "prompt_eval_count" in chunk:
+                stream.prompt_tokens = chunk["prompt_eval_count"]
+            if "eval_count" in chunk:
+                stream.completion_tokens = chunk["eval_count"]
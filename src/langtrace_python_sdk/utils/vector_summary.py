@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2024 Scale3 Labs
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import math
+from numbers import Real
+from typing import Any, Dict, Optional
+
+from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+
+MAX_DEPTH = 8
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _is_array(value) -> bool:
+    # NumPy (and compatible) arrays, without importing NumPy
+    return hasattr(value, "shape") and hasattr(value, "dtype")
+
+
+def is_vector(value) -> bool:
+    """
+    A non-empty flat sequence of numbers. Only the first and last items are
+    checked, so the cost doesn't grow with the dimensions."""
+    if _is_array(value):
+        return len(value.shape) == 1 and value.shape[0] > 0
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and _is_number(value[0])
+        and _is_number(value[-1])
+    )
+
+
+def is_vector_batch(value) -> bool:
+    if _is_array(value):
+        return len(value.shape) == 2 and value.shape[0] > 0
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and is_vector(value[0])
+        and is_vector(value[-1])
+    )
+
+
+def summarize_vectors(value) -> Optional[Dict[str, Any]]:
+    """
+    Describe a vector or a batch of vectors by their count and dimensions, plus
+    norm statistics when LANGTRACE_VECTOR_NORM_STATS is enabled. Returns None
+    for any other value."""
+    if is_vector(value):
+        vectors = [value]
+    elif is_vector_batch(value):
+        vectors = value
+    else:
+        return None
+
+    summary = {"count": len(vectors), "dimensions": len(vectors[0])}
+    if get_runtime_config().vector_norm_stats:
+        norms = [_norm(vector) for vector in vectors]
+        summary["norm_min"] = min(norms)
+        summary["norm_max"] = max(norms)
+        summary["norm_mean"] = sum(norms) / len(norms)
+    return summary
+
+
+def _norm(vector) -> float:
+    if _is_array(vector):
+        return float((vector * vector).sum()) ** 0.5
+    return math.sqrt(math.fsum(x * x for x in vector))
+
+
+def summarize_request(value, depth=0):
+    """
+    Return a JSON serializable copy of a vector database request where every
+    vector or batch of vectors is replaced by its summary."""
+    summary = summarize_vectors(value)
+    if summary is not None:
+        return summary
+    if depth >= MAX_DEPTH:
+        return str(value)
+    if isinstance(value, dict):
+        return {
+            str(key): summarize_request(item, depth + 1) for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [summarize_request(item, depth + 1) for item in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if hasattr(value, "model_dump"):
+        return summarize_request(value.model_dump(), depth + 1)
+    if _is_array(value):
+        return {"shape": list(value.shape)}
+    return str(value)
+
+
+def serialize_request(value) -> str:
+    """
+    JSON of a vector database request without the raw embedding values."""
+    return json.dumps(summarize_request(value))
+
+
+def get_vector_attributes(prefix, value) -> Dict[str, Any]:
+    """
+    `<prefix>.count`, `<prefix>.dimensions` and the optional norm statistics
+    of a vector or batch of vectors."""
+    summary = summarize_vectors(value)
+    if summary is None:
+        return {}
+    return {f"{prefix}.{key}": item for key, item in summary.items()}
+
+
+def set_vector_attributes(span, prefix, value):
+    for name, item in get_vector_attributes(prefix, value).items():
+        set_span_attribute(span, name, item)
@@ -32,6 +32,7 @@ from langtrace_python_sdk.constants.exporter.langtrace_exporter import (
 from langtrace_python_sdk.constants.instrumentation.common import (
     LANGTRACE_ADDITIONAL_SPAN_ATTRIBUTES_KEY,
 )
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
 from langtrace_python_sdk.utils.types import (
     EvaluationAPIData,
     LangTraceApiError,
@@ -62,7 +63,7 @@ def with_langtrace_root_span(
                 trace_id = str(span.get_span_context().trace_id)
 
                 # Attach session ID if available
-                session_id = os.environ.get("LANGTRACE_SESSION_ID")
+                session_id = get_runtime_config().session_id
                 if session_id:
                     span.set_attribute("session.id", session_id)
 
@@ -89,7 +90,7 @@ def with_langtrace_root_span(
                 trace_id = span.get_span_context().trace_id
 
                 # Attach session ID if available
-                session_id = os.environ.get("LANGTRACE_SESSION_ID")
+                session_id = get_runtime_config().session_id
                 if session_id:
                     span.set_attribute("session.id", session_id)
 
@@ -4,6 +4,8 @@ from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanE
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry import trace
 
+from langtrace_python_sdk.utils import runtime_config
+
 
 @pytest.fixture(scope="session")
 def exporter():
@@ -20,3 +22,18 @@ def exporter():
 @pytest.fixture(autouse=True)
 def clear_exporter(exporter):
     exporter.clear()
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """
+    Change the runtime config for the duration of a test."""
+
+    def apply(**changes):
+        monkeypatch.setattr(
+            runtime_config,
+            "_runtime_config",
+            runtime_config.get_runtime_config()._replace(**changes),
+        )
+
+    return apply
@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace_python_sdk.instrumentation.groq.patch import (
+    accumulate_chunk,
+    finish_streaming_span,
+)
+from langtrace_python_sdk.utils.llm import CompletionAccumulator
+
+
+def _chunk(content, x_groq=None):
+    delta = SimpleNamespace(content=content, function_call=None, tool_calls=None)
+    return SimpleNamespace(
+        model="llama3-8b-8192",
+        choices=[SimpleNamespace(delta=delta)],
+        x_groq=x_groq,
+        usage=None,
+    )
+
+
+def test_groq_stream_uses_reported_usage():
+    span = MagicMock()
+    accumulator = CompletionAccumulator()
+    usage = SimpleNamespace(prompt_tokens=12, completion_tokens=4)
+    for chunk in (_chunk("Fast"), _chunk(" tokens", SimpleNamespace(usage=usage))):
+        accumulate_chunk(accumulator, span, chunk)
+
+    estimator = MagicMock(return_value=99)
+    finish_streaming_span(span, accumulator, estimator, MagicMock())
+
+    estimator.assert_not_called()
+    assert accumulator.text == "Fast tokens"
+    assert accumulator.completion_tokens == 4
+    span.end.assert_called_once()
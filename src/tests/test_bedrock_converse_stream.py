@@ -0,0 +1,111 @@
+import gc
+from unittest.mock import MagicMock
+
+import pytest
+from langtrace.trace_attributes import SpanAttributes
+from opentelemetry import trace
+from opentelemetry.trace import StatusCode
+
+from langtrace_python_sdk.constants.instrumentation.common import (
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.instrumentation.aws_bedrock.patch import (
+    patch_converse_stream,
+)
+
+
+def _events():
+    yield {"messageStart": {"role": "assistant"}}
+    yield {"contentBlockDelta": {"delta": {"text": "Hello"}}}
+    yield {"contentBlockDelta": {"delta": {"text": " there"}}}
+    yield {"messageStop": {"stopReason": "end_turn"}}
+    yield {"metadata": {"usage": {"inputTokens": 3, "outputTokens": 2}}}
+
+
+def test_converse_stream_is_not_drained_before_return():
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_span.return_value = span
+    events = _events()
+    converse_stream = patch_converse_stream(
+        lambda **kwargs: {"stream": events}, tracer, "1.0"
+    )
+
+    response = converse_stream(
+        modelId="anthropic.claude-3-haiku",
+        messages=[{"role": "user", "content": [{"text": "hi"}]}],
+    )
+    span.end.assert_not_called()
+
+    stream = iter(response["stream"])
+    assert next(stream) == {"messageStart": {"role": "assistant"}}
+    span.end.assert_not_called()
+
+    assert len(list(stream)) == 4
+    span.end.assert_called_once()
+    completion_event = [
+        call for call in span.add_event.call_args_list if "content" in str(call)
+    ]
+    assert "Hello there" in str(completion_event[-1])
+
+
+def _converse_stream(events):
+    converse_stream = patch_converse_stream(
+        lambda **kwargs: {"stream": events},
+        trace.get_tracer(__name__),
+        "1.0",
+    )
+    return converse_stream(
+        modelId="anthropic.claude-3-haiku",
+        messages=[{"role": "user", "content": [{"text": "hi"}]}],
+    )
+
+
+def test_breaking_out_of_a_converse_stream_ends_the_span(exporter):
+    response = _converse_stream(_events())
+    for _ in response["stream"]:
+        break
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes[STREAM_SPAN_ATTRIBUTES["STATUS"]] == "abandoned"
+    assert span.status.status_code == StatusCode.UNSET
+
+
+def test_dropped_converse_stream_ends_the_span(exporter):
+    response = _converse_stream(_events())
+    del response
+    gc.collect()
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes[STREAM_SPAN_ATTRIBUTES["STATUS"]] == "abandoned"
+
+
+def test_failing_converse_stream_ends_the_span_with_an_error(exporter):
+    def events():
+        yield {"messageStart": {"role": "assistant"}}
+        raise RuntimeError("throttled")
+
+    response = _converse_stream(events())
+    with pytest.raises(RuntimeError):
+        list(response["stream"])
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+
+
+def test_converse_stream_emits_configured_chunk_events(configure):
+    configure(completion_chunk_events="final")
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_span.return_value = span
+    converse_stream = patch_converse_stream(
+        lambda **kwargs: {"stream": _events()}, tracer, "1.0"
+    )
+
+    list(converse_stream(modelId="anthropic.claude-3-haiku", messages=[])["stream"])
+    chunk_events = [
+        call.kwargs["attributes"][SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK]
+        for call in span.add_event.call_args_list
+        if call.kwargs.get("name") == SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK
+    ]
+    assert chunk_events == ['"Hello there"']
@@ -0,0 +1,79 @@
+import io
+import json
+from unittest.mock import MagicMock
+
+from botocore.response import StreamingBody
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.instrumentation.aws_bedrock.patch import handle_call
+from langtrace_python_sdk.instrumentation.aws_bedrock.stream_body_wrapper import (
+    BufferedStreamBody,
+)
+
+
+def _body(payload):
+    data = json.dumps(payload).encode()
+    return StreamingBody(io.BytesIO(data), len(data))
+
+
+def _recorded_attributes(span):
+    return {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+
+
+def test_buffered_stream_body_serves_reads_from_one_buffer():
+    data = b'{"completion": "hello"}'
+    body = BufferedStreamBody(io.BytesIO(data), len(data))
+
+    assert body.json() == {"completion": "hello"}
+    assert body.json() is body.json()
+    assert bytes(body.getbuffer()) == data
+    assert body.read(4) + body.read(4) == data[:8]
+    target = bytearray(5)
+    assert body.readinto(target) == 5 and bytes(target) == data[8:13]
+    assert body.read() == data[13:]
+    assert body.read(4) == b""
+
+
+def test_invoke_model_parses_response_once_and_keeps_it_readable():
+    payload = {"completion": "Hi there", "stop_reason": "stop_sequence"}
+    response = {"body": _body(payload)}
+    span = MagicMock()
+
+    handle_call(
+        span,
+        {
+            "modelId": "anthropic.claude-v2",
+            "body": json.dumps({"prompt": "Hello", "max_tokens_to_sample": 10}),
+        },
+        response,
+    )
+
+    assert json.loads(response["body"].read()) == payload
+    assert "Hi there" in str(span.add_event.call_args_list)
+
+
+def test_invoke_model_does_not_buffer_embedding_responses():
+    body = _body({"embedding": [0.1] * 1024, "inputTextTokenCount": 7})
+    response = {
+        "body": body,
+        "ResponseMetadata": {
+            "HTTPHeaders": {"x-amzn-bedrock-input-token-count": "7"}
+        },
+    }
+    span = MagicMock()
+
+    handle_call(
+        span,
+        {
+            "modelId": "amazon.titan-embed-text-v2:0",
+            "body": json.dumps({"inputText": "hello"}),
+        },
+        response,
+    )
+
+    assert response["body"] is body
+    attributes = _recorded_attributes(span)
+    assert attributes[SpanAttributes.LLM_USAGE_PROMPT_TOKENS] == 7
+    assert json.loads(attributes[SpanAttributes.LLM_REQUEST_EMBEDDING_INPUTS]) == [
+        "hello"
+    ]
@@ -0,0 +1,77 @@
+import base64
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.instrumentation.gemini.patch import serialize_prompts
+from langtrace_python_sdk.instrumentation.openai.patch import images_edit
+from langtrace_python_sdk.utils.binary_payloads import strip_binary_payloads
+from langtrace_python_sdk.utils.llm import get_llm_request_attributes
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 8
+PNG_BASE64 = base64.b64encode(PNG).decode()
+
+
+def test_strip_binary_payloads_replaces_data_urls_without_copying_text():
+    text_message = {"role": "system", "content": "Be brief"}
+    messages = [
+        text_message,
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What is this?"},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/png;base64,{PNG_BASE64}"},
+                },
+                {"type": "input_audio", "input_audio": {"data": PNG_BASE64}},
+            ],
+        },
+    ]
+
+    stripped = strip_binary_payloads(messages)
+    assert stripped[0] is text_message
+    image = stripped[1]["content"][1]["image_url"]["url"]
+    assert image["mime_type"] == "image/png"
+    assert image["size"] == len(PNG)
+    assert stripped[1]["content"][2]["input_audio"]["data"]["size"] == len(PNG)
+    # The request itself is left untouched
+    assert messages[1]["content"][1]["image_url"]["url"].startswith("data:")
+
+
+def test_prompts_attribute_does_not_carry_base64():
+    messages = [{"role": "user", "content": f"data:image/png;base64,{PNG_BASE64}"}]
+
+    prompts = get_llm_request_attributes({}, prompts=messages)[
+        SpanAttributes.LLM_PROMPTS
+    ]
+    assert PNG_BASE64 not in prompts
+    assert json.loads(prompts)[0]["content"]["size"] == len(PNG)
+
+
+def test_images_edit_records_image_description():
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_as_current_span.return_value.__enter__.return_value = span
+    result = SimpleNamespace(
+        data=[SimpleNamespace(url=None, revised_prompt=None, b64_json=PNG_BASE64)]
+    )
+
+    images_edit("1.0", tracer)(lambda **kwargs: result, MagicMock(), [], {})
+    completion = span.add_event.call_args.kwargs["attributes"][
+        SpanAttributes.LLM_COMPLETIONS
+    ]
+    assert PNG_BASE64 not in completion
+    assert json.loads(completion)[0]["content"]["base64"]["mime_type"] == "image/png"
+
+
+def test_gemini_inline_data_is_described():
+    inline_data = SimpleNamespace(data=PNG, mime_type="image/png")
+    part = SimpleNamespace(inline_data=inline_data)
+
+    prompts = serialize_prompts((["Describe", part],), {}, SimpleNamespace())
+    content = prompts[0]["content"]
+    assert "image/png" in content and str(len(PNG)) in content
+    assert "\\x89PNG" not in content
@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.utils import set_span_attribute
+from langtrace_python_sdk.utils.capture_limits import CaptureLimits, capture_limits
+from langtrace_python_sdk.utils.llm import set_event_completion
+
+
+def test_cap_keeps_head_and_tail_within_the_attribute_limit():
+    limits = CaptureLimits(max_attribute_bytes=200, max_span_bytes=0)
+    value = "HEAD" + "x" * 1000 + "TAIL"
+
+    capped, truncation = limits.cap(MagicMock(), "attr", value)
+    assert len(capped.encode()) <= 200
+    assert capped.startswith("HEAD") and capped.endswith("TAIL")
+    assert "bytes truncated" in capped
+    assert truncation["attr.original_length"] == 1008
+    assert len(truncation["attr.hash"]) == 32
+
+    assert limits.cap(MagicMock(), "attr", "short") == ("short", None)
+
+
+def test_cap_never_splits_multibyte_characters():
+    limits = CaptureLimits(max_attribute_bytes=100, max_span_bytes=0)
+
+    capped, _ = limits.cap(MagicMock(), "attr", "é" * 500)
+    assert len(capped.encode()) <= 100
+    assert set(capped.split("\n")[0]) == {"é"}
+
+
+def test_cap_charges_large_values_to_the_span_budget():
+    limits = CaptureLimits(max_attribute_bytes=0, max_span_bytes=3000)
+    span = MagicMock()
+
+    assert limits.cap(span, "a", "a" * 2000)[1] is None
+    capped, truncation = limits.cap(span, "b", "b" * 2000)
+    assert len(capped.encode()) <= 1000
+    assert truncation["b.original_length"] == 2000
+    # Other spans have their own budget
+    assert limits.cap(MagicMock(), "b", "b" * 2000)[1] is None
+
+
+def test_cap_charges_encoded_bytes_of_non_ascii_values():
+    limits = CaptureLimits(max_attribute_bytes=0, max_span_bytes=3000)
+    span = MagicMock()
+
+    # 1000 characters, 2000 bytes
+    assert limits.cap(span, "a", "é" * 1000)[1] is None
+    capped, truncation = limits.cap(span, "b", "é" * 1000)
+    assert len(capped.encode()) <= 1000
+    assert truncation["b.original_length"] == 2000
+
+
+def test_cap_stays_within_limits_smaller_than_the_marker():
+    limits = CaptureLimits(max_attribute_bytes=10, max_span_bytes=0)
+
+    capped, truncation = limits.cap(MagicMock(), "attr", "x" * 100)
+    assert capped == "x" * 10
+    assert truncation["attr.original_length"] == 100
+
+
+def test_set_span_attribute_and_events_are_capped():
+    span = MagicMock()
+    previous = capture_limits.max_attribute_bytes
+    capture_limits.update(max_attribute_bytes=512)
+    try:
+        set_span_attribute(span, SpanAttributes.LLM_REQUEST_MODEL, "m" * 1000)
+        set_event_completion(span, [{"role": "assistant", "content": "c" * 1000}])
+    finally:
+        capture_limits.update(max_attribute_bytes=previous)
+
+    attributes = span.set_attribute.call_args.args
+    assert len(attributes[1]) <= 512
+    span.set_attributes.assert_called_once()
+    event = span.add_event.call_args.kwargs["attributes"]
+    assert len(event[SpanAttributes.LLM_COMPLETIONS]) <= 512
+    assert f"{SpanAttributes.LLM_COMPLETIONS}.original_length" in event
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.utils import llm
+from langtrace_python_sdk.utils.llm import (
+    ChunkEventAggregator,
+    CompletionAccumulator,
+    parse_completion_chunk_events,
+)
+
+
+def _chunk_events(span):
+    return [
+        call.kwargs["attributes"][SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK]
+        for call in span.add_event.call_args_list
+    ]
+
+
+def _stream(configure, mode, pieces):
+    configure(completion_chunk_events=mode)
+    span = MagicMock()
+    accumulator = CompletionAccumulator(count_tokens=False, span=span)
+    for piece in pieces:
+        accumulator.append(piece)
+    accumulator.flush_chunk_events()
+    return _chunk_events(span)
+
+
+def test_parse_completion_chunk_events():
+    assert parse_completion_chunk_events(None) == ("off", None)
+    assert parse_completion_chunk_events("every:4") == ("every", 4)
+    assert parse_completion_chunk_events("window:250") == ("window", 250_000_000)
+    assert parse_completion_chunk_events("FINAL") == ("final", None)
+    assert parse_completion_chunk_events("every:zero") == ("off", None)
+
+
+def test_chunk_events_are_off_by_default():
+    assert ChunkEventAggregator.for_span(MagicMock()) is None
+
+
+def test_chunk_event_modes(configure):
+    pieces = ["a", "b", "c", "d", "e"]
+    assert _stream(configure, "all", pieces) == ['"a"', '"b"', '"c"', '"d"', '"e"']
+    assert _stream(configure, "every:2", pieces) == ['"ab"', '"cd"', '"e"']
+    assert _stream(configure, "final", pieces) == ['"abcde"']
+    assert _stream(configure, "off", pieces) == []
+
+
+def test_window_mode_coalesces_by_time(monkeypatch, configure):
+    clock = iter([0, 1_000_000, 60_000_000, 61_000_000])
+    monkeypatch.setattr(llm.time, "monotonic_ns", lambda: next(clock))
+
+    assert _stream(configure, "window:50", ["a", "b", "c", "d"]) == ['"ab"', '"cd"']
@@ -0,0 +1,93 @@
+import json
+
+from langtrace.trace_attributes import SpanAttributes
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from langtrace_python_sdk.constants.exporter.langtrace_exporter import (
+    LANGTRACE_CONTENT_DICTIONARY_EVENT,
+    LANGTRACE_CONTENT_REF_PREFIX,
+)
+from langtrace_python_sdk.extensions.deduplicating_exporter import (
+    DeduplicatingSpanExporter,
+)
+from langtrace_python_sdk.langtrace import LangtraceConfig, get_exporter
+
+SYSTEM_PROMPT = "You are a careful assistant. " * 200
+TOOLS = json.dumps([{"name": "search", "description": "d" * 3000}])
+
+
+class _CollectingExporter(SpanExporter):
+    def __init__(self):
+        self.batches = []
+
+    def export(self, spans):
+        self.batches.append(list(spans))
+        return SpanExportResult.SUCCESS
+
+
+def _agent_turn(tracer, question):
+    span = tracer.start_span("openai.chat.completions.create")
+    span.set_attribute(SpanAttributes.LLM_TOOLS, TOOLS)
+    prompts = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": question},
+    ]
+    span.add_event(
+        SpanAttributes.LLM_CONTENT_PROMPT,
+        {SpanAttributes.LLM_PROMPTS: json.dumps(prompts)},
+    )
+    span.end()
+    return span
+
+
+def _dictionary(span):
+    return next(
+        dict(event.attributes)
+        for event in span.events
+        if event.name == LANGTRACE_CONTENT_DICTIONARY_EVENT
+    )
+
+
+def test_repeated_segments_are_exported_once_per_batch():
+    tracer = TracerProvider().get_tracer(__name__)
+    spans = [_agent_turn(tracer, f"question {i}") for i in range(3)]
+    collector = _CollectingExporter()
+
+    DeduplicatingSpanExporter(collector).export(spans)
+    exported = collector.batches[0]
+    dictionary = _dictionary(exported[0])
+    assert sorted(dictionary.values()) == sorted([SYSTEM_PROMPT, TOOLS])
+
+    for index, span in enumerate(exported):
+        assert span.attributes[SpanAttributes.LLM_TOOLS].startswith(
+            LANGTRACE_CONTENT_REF_PREFIX
+        )
+        prompts = json.loads(span.events[0].attributes[SpanAttributes.LLM_PROMPTS])
+        assert prompts[0]["content"].startswith(LANGTRACE_CONTENT_REF_PREFIX)
+        assert prompts[1]["content"] == f"question {index}"
+
+
+def test_process_scope_skips_contents_already_exported():
+    tracer = TracerProvider().get_tracer(__name__)
+    collector = _CollectingExporter()
+    exporter = DeduplicatingSpanExporter(collector, scope="process")
+
+    exporter.export([_agent_turn(tracer, "first")])
+    exporter.export([_agent_turn(tracer, "second")])
+    assert len(_dictionary(collector.batches[0][0])) == 2
+    assert not any(
+        event.name == LANGTRACE_CONTENT_DICTIONARY_EVENT
+        for event in collector.batches[1][0].events
+    )
+
+
+def test_unknown_deduplication_scope_turns_deduplication_off(monkeypatch):
+    monkeypatch.setenv("LANGTRACE_DEDUPLICATE_CONTENT", "true")
+    config = LangtraceConfig(custom_remote_exporter=_CollectingExporter())
+
+    assert config.deduplicate_content is None
+    assert get_exporter(config, "http://collector") is config.custom_remote_exporter
+    assert LangtraceConfig(deduplicate_content="Process").deduplicate_content == (
+        "process"
+    )
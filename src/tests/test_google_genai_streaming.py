@@ -0,0 +1,98 @@
+import asyncio
+import gc
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.constants.instrumentation.common import (
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.instrumentation.google_genai.patch import (
+    abuild_streaming_response,
+    build_streaming_response,
+)
+
+
+def _chunk(text, finish_reason=None, usage=None):
+    part = SimpleNamespace(text=text)
+    candidate = SimpleNamespace(
+        finish_reason=finish_reason, content=SimpleNamespace(parts=[part])
+    )
+    return SimpleNamespace(
+        model_version="gemini-2.0-flash", candidates=[candidate], usage_metadata=usage
+    )
+
+
+def _chunks():
+    yield _chunk("Hello")
+    yield _chunk(
+        " world",
+        finish_reason="STOP",
+        usage=SimpleNamespace(prompt_token_count=4, candidates_token_count=2),
+    )
+
+
+def test_streaming_response_yields_before_consuming_the_stream():
+    span = MagicMock()
+    source = _chunks()
+    stream = build_streaming_response(span, source)
+
+    first = next(stream)
+    assert first.candidates[0].content.parts[0].text == "Hello"
+    span.end.assert_not_called()
+
+    assert len(list(stream)) == 1
+    span.end.assert_called_once()
+    assert "Hello world" in str(span.add_event.call_args_list)
+
+
+def test_streaming_response_ends_span_when_closed_early():
+    span = MagicMock()
+    stream = build_streaming_response(span, _chunks())
+
+    next(stream)
+    stream.close()
+    span.end.assert_called_once()
+
+
+def test_streaming_response_ends_span_when_never_iterated():
+    span = MagicMock()
+    stream = build_streaming_response(span, _chunks())
+    async_stream = abuild_streaming_response(span, _chunks())
+
+    del stream, async_stream
+    gc.collect()
+    assert span.end.call_count == 2
+    span.set_attribute.assert_called_with(STREAM_SPAN_ATTRIBUTES["STATUS"], "abandoned")
+
+
+def test_async_streaming_response_is_lazy():
+    async def source():
+        for chunk in _chunks():
+            yield chunk
+
+    async def consume():
+        span = MagicMock()
+        stream = abuild_streaming_response(span, source())
+        await stream.__anext__()
+        span.end.assert_not_called()
+        rest = [chunk async for chunk in stream]
+        return span, rest
+
+    span, rest = asyncio.run(consume())
+    assert len(rest) == 1
+    span.end.assert_called_once()
+
+
+def test_streaming_response_emits_configured_chunk_events(configure):
+    configure(completion_chunk_events="all")
+    span = MagicMock()
+    list(build_streaming_response(span, _chunks()))
+
+    chunk_events = [
+        call.kwargs["attributes"][SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK]
+        for call in span.add_event.call_args_list
+        if call.kwargs.get("name") == SpanAttributes.LLM_CONTENT_COMPLETION_CHUNK
+    ]
+    assert chunk_events == ['"Hello"', '" world"']
@@ -0,0 +1,97 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langtrace.trace_attributes import SpanAttributes
+
+from langtrace_python_sdk.utils import prompt_registry, prompt_templates
+from langtrace_python_sdk.utils.llm import get_llm_request_attributes
+from langtrace_python_sdk.utils.prompt_registry import get_prompt_from_registry
+from langtrace_python_sdk.utils.prompt_templates import PromptTemplateIndex
+
+RENDERED = "You are a support agent for Acme. Answer in French."
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = PromptTemplateIndex()
+    monkeypatch.setattr(prompt_templates, "prompt_template_index", index)
+    monkeypatch.setattr(prompt_registry, "prompt_template_index", index)
+    return index
+
+
+def _fetch(monkeypatch):
+    monkeypatch.setenv("LANGTRACE_API_KEY", "key")
+    monkeypatch.setenv("LANGTRACE_API_HOST", "http://registry")
+    response = MagicMock()
+    response.json.return_value = {
+        "prompts": [{"id": "p1", "value": RENDERED, "version": 3}]
+    }
+    with patch("requests.get", return_value=response):
+        return get_prompt_from_registry(
+            "set-1",
+            options={"variables": {"company": "Acme", "language": "French"}},
+        )
+
+
+def _request(prompt):
+    return get_llm_request_attributes(
+        {"model": "gpt-4o"},
+        prompts=[
+            {"role": "system", "content": prompt["value"]},
+            {"role": "user", "content": "Hi"},
+        ],
+    )
+
+
+def test_registry_prompts_are_linked_to_llm_requests(monkeypatch, index):
+    attributes = _request(_fetch(monkeypatch))
+
+    assert attributes["langtrace.prompt.template.id"] == "set-1"
+    assert attributes["langtrace.prompt.template.version"] == 3
+    assert json.loads(attributes["langtrace.prompt.templates"]) == [
+        {
+            "message_index": 0,
+            "id": "set-1",
+            "version": 3,
+            "variables": {"company": "Acme", "language": "French"},
+        }
+    ]
+    assert RENDERED in attributes[SpanAttributes.LLM_PROMPTS]
+
+
+def test_template_mode_records_a_reference(monkeypatch, index, configure):
+    configure(prompt_capture="template")
+    prompt = _fetch(monkeypatch)
+    attributes = _request(prompt)
+
+    prompts = json.loads(attributes[SpanAttributes.LLM_PROMPTS])
+    assert prompts[0] == {"role": "system", "content": "langtrace.template:set-1@3"}
+    assert prompts[1] == {"role": "user", "content": "Hi"}
+    assert prompt["value"] == RENDERED
+
+
+def test_variables_are_left_out_without_prompt_capture(monkeypatch, index, configure):
+    configure(trace_prompt_completion_data=False)
+    attributes = _request(_fetch(monkeypatch))
+
+    assert json.loads(attributes["langtrace.prompt.templates"]) == [
+        {"message_index": 0, "id": "set-1", "version": 3}
+    ]
+
+
+def test_unrelated_prompts_are_untouched(index):
+    attributes = get_llm_request_attributes(
+        {"model": "gpt-4o"}, prompts=[{"role": "user", "content": "Hi"}]
+    )
+    assert "langtrace.prompt.templates" not in attributes
+
+
+def test_index_is_bounded():
+    index = PromptTemplateIndex(max_entries=2)
+    for i in range(3):
+        index.remember({"value": f"prompt {i}", "version": 1}, f"set-{i}")
+
+    assert len(index) == 2
+    assert index.get("prompt 0") is None
+    assert index.get("prompt 2")["id"] == "set-2"
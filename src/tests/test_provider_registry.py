@@ -0,0 +1,55 @@
+import re
+from types import SimpleNamespace
+
+from langtrace_python_sdk.utils.llm import get_base_url
+from langtrace_python_sdk.utils.provider_registry import ProviderRegistry
+
+
+class Client:
+    def __init__(self, base_url):
+        self._base_url = base_url
+
+
+def make_instance(base_url):
+    return SimpleNamespace(_client=Client(base_url))
+
+
+def test_builtin_providers():
+    registry = ProviderRegistry()
+    assert registry.resolve(make_instance("https://api.groq.com/openai/v1"), "OpenAI") == "Groq"
+    assert registry.resolve(make_instance("http://localhost:12000/v1"), "OpenAI") == "Arch"
+    assert registry.resolve(make_instance("https://api.openai.com/v1"), "OpenAI") == "OpenAI"
+    assert registry.resolve(SimpleNamespace(), "OpenAI") == "OpenAI"
+
+
+def test_registered_gateways_take_precedence():
+    registry = ProviderRegistry()
+    registry.register(re.compile(r":8000/v1$"), "vLLM")
+    registry.register("azure-proxy.internal", "Internal Gateway")
+
+    assert registry.resolve(make_instance("http://gpu-box:8000/v1"), "OpenAI") == "vLLM"
+    assert (
+        registry.resolve(make_instance("https://azure-proxy.internal/v1"), "OpenAI")
+        == "Internal Gateway"
+    )
+
+
+def test_provider_is_cached_per_client_until_the_url_changes():
+    registry = ProviderRegistry()
+    instance = make_instance("https://api.deepseek.com")
+    calls = []
+    match = registry.match
+    registry.match = lambda url: calls.append(url) or match(url)
+
+    assert registry.resolve(instance, "OpenAI") == "DeepSeek"
+    assert registry.resolve(instance, "OpenAI") == "DeepSeek"
+    assert len(calls) == 1
+
+    instance._client._base_url = "https://api.perplexity.ai"
+    assert registry.lookup(instance) == ("https://api.perplexity.ai", "Perplexity")
+    assert len(calls) == 2
+
+
+def test_get_base_url():
+    assert get_base_url(make_instance("https://api.x.ai/v1")) == "https://api.x.ai/v1"
+    assert get_base_url(object()) == ""
@@ -0,0 +1,95 @@
+import gc
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry.trace import StatusCode
+
+from langtrace_python_sdk.instrumentation.pymongo.patch import generic_patch
+from langtrace_python_sdk.utils.result_capture import result_capture_policy
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+        self.alive = True
+        self.closed = False
+
+    def next(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            self.alive = False
+            raise
+
+    def try_next(self):
+        raise RuntimeError("cursor killed")
+
+    def close(self):
+        self.closed = True
+
+
+def _aggregate(docs):
+    collection = MagicMock()
+    collection.database.__dict__ = {}
+
+    def aggregate(pipeline):
+        return _Cursor(docs)
+
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_as_current_span.return_value.__enter__.return_value = span
+    pipeline = [{"$vectorSearch": {"index": "idx", "path": "embedding", "limit": 5}}]
+    cursor = generic_patch("aggregate", "4.0", tracer)(
+        aggregate, collection, (), {"pipeline": pipeline}
+    )
+    return cursor, span
+
+
+def test_aggregate_cursor_is_returned_unconsumed():
+    docs = [{"_id": i, "title": f"doc {i}", "embedding": [0.1] * 8} for i in range(3)]
+    cursor, span = _aggregate(docs)
+    span.add_event.assert_not_called()
+
+    assert next(cursor)["title"] == "doc 0"
+    assert span.add_event.call_count == 1
+    assert span.add_event.call_args.kwargs["attributes"] == {"_id": 0, "title": "doc 0"}
+
+    assert len(list(cursor)) == 2
+    span.end.assert_called_once()
+
+
+def test_aggregate_cursor_bounds_recorded_matches():
+    max_matches = result_capture_policy.max_matches
+    docs = [{"_id": i} for i in range(max_matches * 3)]
+    cursor, span = _aggregate(docs)
+
+    assert len(list(cursor)) == len(docs)
+    assert span.add_event.call_count == max_matches
+
+
+def test_aggregate_cursor_close_ends_span():
+    cursor, span = _aggregate([{"_id": 1}, {"_id": 2}])
+
+    next(cursor)
+    cursor.close()
+    assert cursor.__wrapped__.closed
+    span.end.assert_called_once()
+
+
+def test_failing_try_next_ends_span_with_error():
+    cursor, span = _aggregate([{"_id": 1}])
+
+    with pytest.raises(RuntimeError):
+        cursor.try_next()
+    assert span.set_status.call_args.args[0].status_code == StatusCode.ERROR
+    span.end.assert_called_once()
+
+
+def test_abandoned_cursor_ends_span():
+    cursor, span = _aggregate([{"_id": 1}, {"_id": 2}])
+    next(cursor)
+
+    del cursor
+    gc.collect()
+    span.set_attribute.assert_any_call("db.query.cursor.status", "abandoned")
+    span.end.assert_called_once()
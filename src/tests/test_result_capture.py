@@ -0,0 +1,90 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace_python_sdk.instrumentation.milvus.patch import (
+    set_query_response_attributes,
+    set_search_response_attributes,
+)
+from langtrace_python_sdk.instrumentation.weaviate.patch import aggregate_responses
+from langtrace_python_sdk.utils.result_capture import (
+    ResultCapturePolicy,
+    result_capture_policy,
+)
+
+
+def test_match_attributes_select_fields_and_cap_bytes():
+    policy = ResultCapturePolicy(
+        max_matches=5, fields=["title"], max_event_bytes=100, mode="full"
+    )
+
+    attributes = policy.match_attributes(
+        {"id": "a", "score": 0.9},
+        {
+            "metadata": {"title": "Doc", "body": "x" * 1000},
+            "document": "y" * 1000,
+        },
+    )
+    assert attributes["id"] == "a" and attributes["score"] == 0.9
+    assert attributes["metadata"] == '{"title": "Doc"}'
+    assert len(attributes["document"].encode()) <= 100
+    assert list(policy.top(iter(range(100)))) == [0, 1, 2, 3, 4]
+
+
+def test_scores_mode_keeps_only_ids_and_scores():
+    policy = ResultCapturePolicy(mode="scores")
+
+    assert policy.match_attributes(
+        {"id": "a", "score": 0.9}, {"metadata": {"title": "Doc"}}
+    ) == {"id": "a", "score": 0.9}
+
+
+def test_milvus_search_records_top_matches(monkeypatch):
+    monkeypatch.setattr(result_capture_policy, "max_matches", 3)
+    span = MagicMock()
+    result = [
+        [
+            {"id": i, "distance": 1 - i / 100, "entity": {"text": f"doc {i}"}}
+            for i in range(50)
+        ]
+    ]
+
+    set_search_response_attributes(span, result)
+    assert span.add_event.call_count == 3
+    assert span.add_event.call_args.kwargs["attributes"] == {
+        "id": 2,
+        "distance": "0.98",
+        "entity": '{"text": "doc 2"}',
+    }
+
+
+def test_milvus_query_keeps_primary_keys_in_scores_mode(monkeypatch):
+    monkeypatch.setattr(result_capture_policy, "mode", "scores")
+    span = MagicMock()
+    result = [{"id": 7, "text": "doc 7"}, {"pk": "b", "text": "doc b"}]
+
+    set_query_response_attributes(span, result)
+    assert [call.kwargs["attributes"] for call in span.add_event.call_args_list] == [
+        {"id": 7},
+        {"pk": "b"},
+    ]
+
+
+def test_weaviate_response_keeps_list_and_dict_properties():
+    match = SimpleNamespace(
+        uuid="u1",
+        properties={"tags": ["a", "b"], "author": {"name": "Ann"}, "title": "Doc"},
+        collection="Articles",
+        references=None,
+    )
+
+    response = json.loads(aggregate_responses(SimpleNamespace(objects=[match])))
+    assert response == [
+        {
+            "uuid": "u1",
+            "tags": ["a", "b"],
+            "author": {"name": "Ann"},
+            "title": "Doc",
+            "collection": "Articles",
+        }
+    ]
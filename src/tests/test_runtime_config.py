@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+from langtrace_python_sdk.utils import runtime_config, set_event_prompt
+from langtrace_python_sdk.utils.runtime_config import (
+    get_runtime_config,
+    load_runtime_config,
+    update_runtime_config,
+)
+
+
+def test_environment_is_read_once(monkeypatch):
+    monkeypatch.setattr(runtime_config, "_runtime_config", get_runtime_config())
+    monkeypatch.setenv("TRACE_PROMPT_COMPLETION_DATA", "False")
+    monkeypatch.setenv("LANGTRACE_SESSION_ID", "env-session")
+    assert get_runtime_config().trace_prompt_completion_data is True
+
+    config = load_runtime_config(session_id="init-session")
+    assert config.trace_prompt_completion_data is False
+    assert config.session_id == "init-session"
+    assert get_runtime_config() is config
+
+
+def test_updates_replace_the_config(monkeypatch):
+    monkeypatch.setattr(runtime_config, "_runtime_config", get_runtime_config())
+    previous = get_runtime_config()
+
+    config = update_runtime_config(vector_score_stats=True, session_id=None)
+    assert config.vector_score_stats is True
+    assert config.session_id == previous.session_id
+    assert previous.vector_score_stats is False
+
+
+def test_prompt_events_follow_the_config(configure):
+    span = MagicMock()
+    configure(trace_prompt_completion_data=False)
+    set_event_prompt(span, "hello")
+    span.add_event.assert_not_called()
+
+    configure(trace_prompt_completion_data=True)
+    set_event_prompt(span, "hello")
+    span.add_event.assert_called_once()
@@ -0,0 +1,130 @@
+import sys
+import types
+
+from opentelemetry import trace
+from wrapt import FunctionWrapper, wrap_function_wrapper
+
+from langtrace_python_sdk.instrumentation.openai.patch import chat_completions_create
+from langtrace_python_sdk.langtrace import reconfigure, watch_runtime_config
+from langtrace_python_sdk.utils import unwrap_method, unwrap_module_classes
+from langtrace_python_sdk.utils.langtrace_sampler import LangtraceSampler
+from langtrace_python_sdk.utils.runtime_config import get_runtime_config
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import Decision
+
+
+def _fake_module(name):
+    module = types.ModuleType(name)
+
+    class Completions:
+        def create(self):
+            return "original"
+
+    Completions.__module__ = name
+    module.Completions = Completions
+    sys.modules[name] = module
+    return module
+
+
+def test_unwrap_method_restores_original():
+    module = _fake_module("fake_vendor_sdk")
+    original = vars(module.Completions)["create"]
+    tracer = trace.get_tracer(__name__)
+
+    wrap_function_wrapper(
+        "fake_vendor_sdk", "Completions.create", chat_completions_create("1", tracer)
+    )
+    assert isinstance(vars(module.Completions)["create"], FunctionWrapper)
+
+    unwrap_method("fake_vendor_sdk", "Completions.create")
+    assert vars(module.Completions)["create"] is original
+
+
+def test_unwrap_module_classes_ignores_foreign_wrappers():
+    module = _fake_module("fake_vendor_sdk_classes")
+    tracer = trace.get_tracer(__name__)
+
+    wrap_function_wrapper(
+        "fake_vendor_sdk_classes",
+        "Completions.create",
+        chat_completions_create("1", tracer),
+    )
+    unwrap_module_classes("fake_vendor_sdk_classes")
+    assert not isinstance(vars(module.Completions)["create"], FunctionWrapper)
+
+    wrap_function_wrapper(
+        "fake_vendor_sdk_classes",
+        "Completions.create",
+        lambda wrapped, instance, args, kwargs: wrapped(*args, **kwargs),
+    )
+    unwrap_module_classes("fake_vendor_sdk_classes")
+    assert isinstance(vars(module.Completions)["create"], FunctionWrapper)
+
+
+def test_sampler_update_ratio_and_disabled_methods():
+    sampler = LangtraceSampler(disabled_methods=None)
+    assert (
+        sampler.should_sample(None, 1, "openai.chat.completions.create").decision
+        == Decision.RECORD_AND_SAMPLE
+    )
+
+    sampler.update(sampling_ratio=0.0)
+    assert sampler.should_sample(None, 1, "any").decision == Decision.DROP
+
+    sampler.update(
+        disabled_methods={"openai": ["openai.chat.completions.create"]},
+        sampling_ratio=1.0,
+    )
+    assert (
+        sampler.should_sample(None, 1, "openai.chat.completions.create").decision
+        == Decision.DROP
+    )
+    assert sampler.should_sample(None, 1, "any").decision == Decision.RECORD_AND_SAMPLE
+
+
+def test_reconfigure_content_capture(configure):
+    # Restores the runtime config after the test
+    configure()
+    reconfigure(trace_prompt_completion_data=False)
+    assert get_runtime_config().trace_prompt_completion_data is False
+    reconfigure(trace_prompt_completion_data=True)
+    assert get_runtime_config().trace_prompt_completion_data is True
+
+
+def test_sampler_drops_children_of_unsampled_roots():
+    provider = TracerProvider(sampler=LangtraceSampler(None, sampling_ratio=0.0))
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer(__name__)
+
+    with tracer.start_as_current_span("root") as root:
+        with tracer.start_as_current_span("child") as child:
+            assert not child.is_recording()
+    assert not root.is_recording()
+    assert exporter.get_finished_spans() == ()
+
+    provider.sampler.update(sampling_ratio=1.0)
+    with tracer.start_as_current_span("root"):
+        with tracer.start_as_current_span("child"):
+            pass
+    assert [span.name for span in exporter.get_finished_spans()] == ["child", "root"]
+
+
+def test_watch_runtime_config_replaces_the_previous_watcher(configure, tmp_path):
+    configure()
+    path = tmp_path / "runtime.json"
+    path.write_text('{"trace_prompt_completion_data": false}')
+
+    first = watch_runtime_config(str(path), interval=60)
+    second = watch_runtime_config(str(path), interval=60)
+    try:
+        assert first._stop_event.is_set()
+        assert not second._stop_event.is_set()
+        assert get_runtime_config().trace_prompt_completion_data is False
+    finally:
+        watch_runtime_config("")
+    assert second._stop_event.is_set()
@@ -0,0 +1,78 @@
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from langtrace_python_sdk.instrumentation.milvus.patch import (
+    set_search_response_attributes,
+)
+from langtrace_python_sdk.utils import score_stats
+from langtrace_python_sdk.utils.score_stats import (
+    compute_score_stats,
+    set_score_stats_attributes,
+)
+
+
+def test_compute_score_stats_in_ranked_order():
+    stats = compute_score_stats([0.9, 0.5, None, 0.4, 0.1])
+
+    assert stats["count"] == 4
+    assert stats["min"] == 0.1
+    assert stats["max"] == 0.9
+    assert stats["mean"] == pytest.approx(0.475)
+    assert stats["p50"] == pytest.approx(0.45)
+    assert stats["p90"] == pytest.approx(0.78)
+    assert stats["top_gap"] == pytest.approx(0.4)
+    assert stats["max_gap"] == pytest.approx(0.4)
+    assert compute_score_stats([None]) is None
+
+
+def test_numpy_and_python_stats_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    scores = sorted((random.random() for _ in range(200)), reverse=True)
+
+    with_numpy = compute_score_stats(scores)
+    monkeypatch.setattr(score_stats, "_load_numpy", lambda: None)
+    without_numpy = compute_score_stats(scores)
+
+    assert with_numpy.keys() == without_numpy.keys()
+    for name, value in with_numpy.items():
+        assert value == pytest.approx(without_numpy[name])
+
+
+def test_numpy_is_not_loaded_for_few_scores(monkeypatch):
+    load_numpy = MagicMock()
+    monkeypatch.setattr(score_stats, "_load_numpy", load_numpy)
+
+    compute_score_stats([0.9, 0.5, 0.4])
+    load_numpy.assert_not_called()
+
+
+def test_score_stats_are_opt_in(configure):
+    span = MagicMock()
+    set_score_stats_attributes(span, "db.query.scores", [0.9, 0.8])
+    span.set_attribute.assert_not_called()
+
+    configure(vector_score_stats=True)
+    set_score_stats_attributes(span, "db.query.scores", [0.9, 0.8])
+    attributes = {
+        call.args[0]: call.args[1] for call in span.set_attribute.call_args_list
+    }
+    assert attributes["db.query.scores.count"] == 2
+    assert attributes["db.query.scores.top_gap"] == pytest.approx(0.1)
+
+
+def test_milvus_search_records_first_query_distances(configure):
+    configure(vector_score_stats=True)
+    span = MagicMock()
+    result = [
+        [{"id": 1, "distance": 0.1}, {"id": 2, "distance": 0.3}],
+        [{"id": 3, "distance": 5.0}],
+    ]
+
+    set_search_response_attributes(span, result)
+    attributes = {
+        call.args[0]: call.args[1] for call in span.set_attribute.call_args_list
+    }
+    assert attributes["db.search.distances.count"] == 2
+    assert attributes["db.search.distances.max"] == 0.3
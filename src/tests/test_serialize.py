@@ -0,0 +1,71 @@
+import json
+from datetime import datetime
+
+from langtrace_python_sdk.utils.misc import serialize_args, serialize_kwargs
+from langtrace_python_sdk.utils.serialize import to_json, to_json_string
+
+
+class Message:
+    def __init__(self, content, text=None):
+        self.content = content
+        self.text = text
+        self.client = object()
+
+
+def test_to_json_string_drops_empty_values():
+    value = {"query": "  hello ", "empty": "", "none": None, "items": [], "k": 3}
+    assert json.loads(to_json_string(value)) == {"query": "hello", "k": 3}
+    assert "\n" not in to_json_string({"a": [1, 2]})
+
+
+def test_objects_expand_at_top_level_and_reduce_to_text_when_nested():
+    message = Message("hi", text="hi there")
+    assert json.loads(to_json_string(message)) == {
+        "content": "hi",
+        "text": "hi there",
+    }
+    assert json.loads(to_json_string({"message": message, "raw": Message("x")})) == {
+        "message": "hi there"
+    }
+
+
+def test_nested_objects_expand_when_requested():
+    value = {"message": Message("hi", text="hi there"), "raw": Message("x")}
+    result = json.loads(to_json_string(value, expand_nested_objects=True))
+
+    assert result["message"]["text"] == "hi there"
+    assert result["raw"]["content"] == "x"
+    assert "text" not in result["raw"]
+
+
+def test_cycles_do_not_recurse():
+    value = {"name": "loop"}
+    value["self"] = value
+    items = [1]
+    items.append(items)
+
+    assert json.loads(to_json(value)) == {"name": "loop", "self": "<cycle>"}
+    assert json.loads(to_json(items)) == [1, "<cycle>"]
+
+
+def test_depth_item_and_byte_limits():
+    nested = [[[["deep"]]]]
+    assert json.loads(to_json(nested, max_depth=2)) == [["<list>"]]
+
+    assert json.loads(to_json(list(range(5)), max_items=2)) == [
+        0,
+        1,
+        "... 3 more items",
+    ]
+
+    encoded = to_json(["x" * 1000, "y" * 1000], max_bytes=100)
+    assert len(encoded) < 200
+    assert json.loads(encoded)[0] == "x" * 100 + "..."
+
+
+def test_serialize_args_and_kwargs_leave_out_non_json_values():
+    assert json.loads(serialize_args("a", object(), {"b": datetime.now(), "c": 1})) == [
+        "a",
+        {"c": 1},
+    ]
+    assert json.loads(serialize_kwargs(query="q", client=object())) == {"query": "q"}
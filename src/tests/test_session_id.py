@@ -3,6 +3,7 @@ import pytest
 from opentelemetry.trace import SpanKind
 from langtrace_python_sdk.langtrace import LangtraceConfig
 from langtrace_python_sdk.extensions.langtrace_exporter import LangTraceExporter
+from langtrace_python_sdk.utils.runtime_config import load_runtime_config
 from langtrace_python_sdk.utils.with_root_span import with_langtrace_root_span
 from langtrace_python_sdk.constants.exporter.langtrace_exporter import LANGTRACE_SESSION_ID_HEADER
 
@@ -10,6 +11,8 @@ def test_session_id_from_env(exporter):
     # Test session ID from environment variable
     test_session_id = "test-session-123"
     os.environ["LANGTRACE_SESSION_ID"] = test_session_id
+    # The environment is read once, by init
+    load_runtime_config()
 
     @with_langtrace_root_span()
     def test_function():
@@ -24,6 +27,7 @@ def test_session_id_from_env(exporter):
 
     # Cleanup
     del os.environ["LANGTRACE_SESSION_ID"]
+    load_runtime_config()
 
 def test_session_id_in_config():
     # Test session ID through LangtraceConfig
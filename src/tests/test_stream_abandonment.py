@@ -0,0 +1,83 @@
+import asyncio
+import gc
+import weakref
+from types import SimpleNamespace
+
+from opentelemetry import trace
+from opentelemetry.trace import StatusCode
+
+from langtrace_python_sdk.constants.instrumentation.common import (
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.utils.llm import StreamWrapper
+
+
+def _chunk(content):
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(
+        model="gpt-4", choices=[SimpleNamespace(delta=delta)], usage=None
+    )
+
+
+def _source(closed):
+    try:
+        for content in ("one", " two", " three"):
+            yield _chunk(content)
+    finally:
+        closed.append(True)
+
+
+def _start_span():
+    return trace.get_tracer(__name__).start_span("openai.chat.completions.create")
+
+
+def test_breaking_out_of_a_stream_ends_the_span_as_abandoned(exporter):
+    closed = []
+    with StreamWrapper(_source(closed), _start_span()) as stream:
+        for _ in stream:
+            break
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes[STREAM_SPAN_ATTRIBUTES["STATUS"]] == "abandoned"
+    assert span.status.status_code == StatusCode.UNSET
+    assert closed == [True]
+
+
+def test_dropped_stream_is_not_leaked(exporter):
+    stream = StreamWrapper(_source([]), _start_span())
+    next(stream)
+    stream_ref = weakref.ref(stream)
+
+    del stream
+    gc.collect()
+
+    assert stream_ref() is None
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes[STREAM_SPAN_ATTRIBUTES["STATUS"]] == "abandoned"
+
+
+def test_exhausted_stream_is_not_marked_abandoned(exporter):
+    stream = StreamWrapper(_source([]), _start_span())
+    list(stream)
+    stream.close()
+    del stream
+    gc.collect()
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.OK
+    assert STREAM_SPAN_ATTRIBUTES["STATUS"] not in span.attributes
+
+
+def test_async_stream_aclose_ends_the_span(exporter):
+    async def source():
+        for content in ("one", " two"):
+            yield _chunk(content)
+
+    async def consume():
+        stream = StreamWrapper(source(), _start_span())
+        await stream.__anext__()
+        await stream.aclose()
+
+    asyncio.run(consume())
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes[STREAM_SPAN_ATTRIBUTES["STATUS"]] == "abandoned"
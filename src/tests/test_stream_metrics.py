@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace_python_sdk.constants.instrumentation.common import (
+    STREAM_SPAN_ATTRIBUTES,
+)
+from langtrace_python_sdk.utils import stream_metrics
+from langtrace_python_sdk.utils.llm import StreamWrapper
+from langtrace_python_sdk.utils.stream_metrics import StreamTimer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0
+
+    def advance(self, ms):
+        self.now += int(ms * 1e6)
+
+    def __call__(self):
+        return self.now
+
+
+def _recorded_attributes(span):
+    return {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+
+
+def test_stream_timer_records_latency_attributes(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(stream_metrics.time, "time_ns", clock)
+    span = MagicMock(start_time=0, attributes={})
+    timer = StreamTimer(span)
+
+    clock.advance(250)
+    timer.record_chunk()
+    for _ in range(99):
+        clock.advance(20)
+        timer.record_chunk()
+    timer.finish(span, completion_tokens=100)
+
+    attributes = _recorded_attributes(span)
+    assert attributes[STREAM_SPAN_ATTRIBUTES["TIME_TO_FIRST_TOKEN"]] == 250
+    assert attributes[STREAM_SPAN_ATTRIBUTES["DURATION"]] == 250 + 99 * 20
+    assert attributes[STREAM_SPAN_ATTRIBUTES["CHUNKS"]] == 100
+    assert attributes[STREAM_SPAN_ATTRIBUTES["INTER_CHUNK_LATENCY_MAX"]] == 20
+    assert abs(attributes[STREAM_SPAN_ATTRIBUTES["TOKENS_PER_SECOND"]] - 50.5) < 0.1
+    assert abs(attributes[STREAM_SPAN_ATTRIBUTES["INTER_CHUNK_LATENCY_P50"]] - 20) <= 2
+
+
+def test_stream_timer_percentiles_use_constant_memory(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(stream_metrics.time, "time_ns", clock)
+    timer = StreamTimer()
+
+    timer.record_chunk()
+    for gap in [10] * 900 + [500] * 100:
+        clock.advance(gap)
+        timer.record_chunk()
+
+    assert len(timer._buckets) == stream_metrics._BUCKET_COUNT
+    assert abs(timer.percentile(0.5) - 10) <= 1
+    assert abs(timer.percentile(0.99) - 500) <= 50
+
+
+def test_stream_wrapper_sets_time_to_first_token():
+    span = MagicMock(start_time=None, attributes={})
+    chunks = [
+        SimpleNamespace(model="gpt-4", choices=[], usage=None, type=None, text=None)
+    ]
+
+    list(StreamWrapper(iter(chunks), span))
+    attributes = _recorded_attributes(span)
+    assert attributes[STREAM_SPAN_ATTRIBUTES["CHUNKS"]] == 1
+    assert attributes[STREAM_SPAN_ATTRIBUTES["TIME_TO_FIRST_TOKEN"]] >= 0
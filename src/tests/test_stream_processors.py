@@ -0,0 +1,187 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from langtrace_python_sdk.utils.llm import StreamWrapper
+from langtrace_python_sdk.utils.stream_processors import (
+    AnthropicChunkProcessor,
+    ChunkProcessor,
+    MistralChunkProcessor,
+    OllamaChunkProcessor,
+    OpenAIChunkProcessor,
+)
+
+
+def _openai_chunk(content=None, usage=None):
+    delta = SimpleNamespace(content=content, function_call=None, tool_calls=None)
+    return SimpleNamespace(
+        model="gpt-4", choices=[SimpleNamespace(delta=delta)], usage=usage
+    )
+
+
+def test_openai_processor_collects_content_and_usage():
+    chunks = [
+        _openai_chunk("Hello"),
+        _openai_chunk(" world"),
+        SimpleNamespace(
+            model="gpt-4",
+            choices=[],
+            usage=SimpleNamespace(prompt_tokens=4, completion_tokens=2),
+        ),
+    ]
+    stream = StreamWrapper(
+        iter(chunks), MagicMock(), chunk_processor=OpenAIChunkProcessor()
+    )
+
+    list(stream)
+    assert stream.result_content == ["Hello", " world"]
+    assert stream._response_model == "gpt-4"
+    assert (stream.prompt_tokens, stream.completion_tokens) == (4, 2)
+
+
+def test_mistral_processor_unwraps_data():
+    chunks = [SimpleNamespace(data=_openai_chunk("Bonjour"))]
+    stream = StreamWrapper(
+        iter(chunks), MagicMock(), chunk_processor=MistralChunkProcessor()
+    )
+
+    list(stream)
+    assert stream.result_content == ["Bonjour"]
+
+
+def test_anthropic_processor_reads_message_events():
+    chunks = [
+        SimpleNamespace(
+            type="message_start",
+            message=SimpleNamespace(
+                model="claude-3-haiku", usage=SimpleNamespace(input_tokens=11)
+            ),
+        ),
+        SimpleNamespace(
+            type="content_block_delta", index=0, delta=SimpleNamespace(text="Hi")
+        ),
+        SimpleNamespace(
+            type="content_block_start",
+            index=1,
+            content_block=SimpleNamespace(type="tool_use", id="toolu_1", name="add"),
+        ),
+        SimpleNamespace(
+            type="content_block_delta",
+            index=1,
+            delta=SimpleNamespace(type="input_json_delta", partial_json='{"a": 1}'),
+        ),
+        SimpleNamespace(
+            type="message_delta",
+            delta=SimpleNamespace(stop_reason="end_turn"),
+            usage=SimpleNamespace(output_tokens=3),
+        ),
+    ]
+    stream = StreamWrapper(
+        iter(chunks), MagicMock(), chunk_processor=AnthropicChunkProcessor()
+    )
+
+    list(stream)
+    assert stream.result_content == ["Hi"]
+    assert stream.tool_call_assembler.tool_calls() == [
+        {
+            "id": "toolu_1",
+            "type": "function",
+            "function": {"name": "add", "arguments": '{"a": 1}'},
+        }
+    ]
+    assert stream._response_model == "claude-3-haiku"
+    assert (stream.prompt_tokens, stream.completion_tokens) == (11, 3)
+
+
+def test_ollama_processor_reads_dict_chunks():
+    chunks = [
+        {"model": "llama3", "message": {"role": "assistant", "content": "Yo"}},
+        {"model": "llama3", "done": True, "prompt_eval_count": 6, "eval_count": 1},
+    ]
+    stream = StreamWrapper(
+        iter(chunks), MagicMock(), chunk_processor=OllamaChunkProcessor()
+    )
+
+    list(stream)
+    assert stream.result_content == ["Yo"]
+    assert (stream.prompt_tokens, stream.completion_tokens) == (6, 1)
+
+
+def _tool_call_delta(index, arguments, id=None, name=None):
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(index=index, id=id, function=function)
+
+
+def test_openai_processor_reassembles_parallel_tool_calls():
+    def chunk(*tool_calls):
+        delta = SimpleNamespace(
+            content=None, function_call=None, tool_calls=list(tool_calls)
+        )
+        return SimpleNamespace(
+            model="gpt-4", choices=[SimpleNamespace(delta=delta)], usage=None
+        )
+
+    chunks = [
+        chunk(
+            _tool_call_delta(0, "", id="call_a", name="weather"),
+            _tool_call_delta(1, "", id="call_b", name="time"),
+        ),
+        chunk(_tool_call_delta(0, '{"city": '), _tool_call_delta(1, '{"tz": ')),
+        chunk(_tool_call_delta(1, '"UTC"}'), _tool_call_delta(0, '"Paris"}')),
+    ]
+    span = MagicMock()
+    stream = StreamWrapper(
+        iter(chunks), span, tool_calls=True, chunk_processor=OpenAIChunkProcessor()
+    )
+
+    list(stream)
+    assert stream.tool_call_assembler.tool_calls() == [
+        {
+            "id": "call_a",
+            "type": "function",
+            "function": {"name": "weather", "arguments": '{"city": "Paris"}'},
+        },
+        {
+            "id": "call_b",
+            "type": "function",
+            "function": {"name": "time", "arguments": '{"tz": "UTC"}'},
+        },
+    ]
+    assert "call_b" in str(span.add_event.call_args_list)
+
+
+def test_processor_without_process_chunk_fails_at_construction():
+    class Incomplete(ChunkProcessor):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_openai_processor_keeps_tool_calls_of_each_choice_apart():
+    def chunk(choice_index, tool_call):
+        delta = SimpleNamespace(
+            content=None, function_call=None, tool_calls=[tool_call]
+        )
+        choice = SimpleNamespace(index=choice_index, delta=delta)
+        return SimpleNamespace(model="gpt-4", choices=[choice], usage=None)
+
+    chunks = [
+        chunk(0, _tool_call_delta(0, "", id="call_a", name="weather")),
+        chunk(1, _tool_call_delta(0, "", id="call_b", name="weather")),
+        chunk(0, _tool_call_delta(0, '{"city": "Paris"}')),
+        chunk(1, _tool_call_delta(0, '{"city": "Rome"}')),
+    ]
+    stream = StreamWrapper(
+        iter(chunks),
+        MagicMock(),
+        tool_calls=True,
+        chunk_processor=OpenAIChunkProcessor(),
+    )
+
+    list(stream)
+    assert [
+        (call["id"], call["function"]["arguments"])
+        for call in stream.tool_call_assembler.tool_calls()
+    ] == [("call_a", '{"city": "Paris"}'), ("call_b", '{"city": "Rome"}')]
@@ -0,0 +1,157 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from langtrace_python_sdk.utils.llm import (
+    CompletionAccumulator,
+    StreamWrapper,
+    TokenCounter,
+    _content_digest,
+    calculate_prompt_tokens,
+    estimate_chat_prompt_tokens,
+    estimate_tokens,
+    get_tiktoken_encoding,
+    resolve_tiktoken_encoding,
+)
+
+
+def test_resolve_tiktoken_encoding_by_model_family():
+    assert resolve_tiktoken_encoding("gpt-4o") == "o200k_base"
+    assert resolve_tiktoken_encoding("gpt-4o-mini-2024-07-18") == "o200k_base"
+    assert resolve_tiktoken_encoding("gpt-4.1-nano") == "o200k_base"
+    assert resolve_tiktoken_encoding("openai/o1-preview") == "o200k_base"
+    assert resolve_tiktoken_encoding("gpt-4-turbo") == "cl100k_base"
+    assert resolve_tiktoken_encoding("gpt-3.5-turbo-0125") == "cl100k_base"
+    assert resolve_tiktoken_encoding("claude-3-opus-20240229") is None
+    assert resolve_tiktoken_encoding(None) is None
+
+
+def test_tiktoken_encoders_are_cached():
+    assert get_tiktoken_encoding("cl100k_base") is get_tiktoken_encoding("cl100k_base")
+
+
+def test_calculate_prompt_tokens_uses_tiktoken_for_known_models():
+    prompt = "Tracing should never change the answer."
+    encoded = len(get_tiktoken_encoding("cl100k_base").encode(prompt))
+    assert calculate_prompt_tokens(prompt, "gpt-4-turbo") == encoded
+    assert calculate_prompt_tokens(prompt, "unknown-model") == estimate_tokens(prompt)
+
+
+def test_token_counter_batches_and_caches_by_content():
+    counter = TokenCounter(maxsize=2)
+    encoding = get_tiktoken_encoding("cl100k_base")
+    texts = ["You are a helpful assistant.", "What is tracing?"]
+    expected = [len(encoding.encode(text)) for text in texts]
+
+    assert counter.count(texts, "gpt-4") == expected
+    assert len(counter._cache) == 2
+
+    # a repeated prefix is served from the cache, the oldest entry is evicted
+    assert counter.count([texts[1], "And metrics?"], "gpt-4")[0] == expected[1]
+    assert len(counter._cache) == 2
+    assert ("cl100k_base", _content_digest(texts[0])) not in counter._cache
+
+
+def test_estimate_chat_prompt_tokens_counts_messages_and_functions():
+    messages = [{"role": "user", "content": "hello"}]
+    functions = [{"name": "lookup", "parameters": {}}]
+    texts = [json.dumps(str(messages[0])), json.dumps(functions[0])]
+    encoding = get_tiktoken_encoding("cl100k_base")
+
+    assert estimate_chat_prompt_tokens(messages, functions, "gpt-4") == sum(
+        len(encoding.encode(text)) for text in texts
+    )
+    assert estimate_chat_prompt_tokens([], None, "gpt-4") == 0
+
+
+def _chunks(*usages):
+    for usage in usages:
+        yield SimpleNamespace(
+            model="gpt-4", choices=[], usage=usage, type=None, text=None
+        )
+
+
+def test_stream_wrapper_estimates_prompt_tokens_lazily():
+    estimator = MagicMock(return_value=42)
+    stream = StreamWrapper(
+        _chunks(None), MagicMock(), prompt_tokens_estimator=estimator
+    )
+    estimator.assert_not_called()
+
+    list(stream)
+    estimator.assert_called_once()
+    assert stream.prompt_tokens == 42
+
+
+def test_stream_wrapper_prefers_reported_prompt_tokens():
+    estimator = MagicMock(return_value=42)
+    usage = SimpleNamespace(prompt_tokens=7, completion_tokens=3)
+    stream = StreamWrapper(
+        _chunks(usage), MagicMock(), prompt_tokens_estimator=estimator
+    )
+
+    list(stream)
+    estimator.assert_not_called()
+    assert stream.prompt_tokens == 7
+
+
+def _content_chunks(*pieces, usage=None):
+    for piece in pieces:
+        delta = SimpleNamespace(content=piece)
+        yield SimpleNamespace(
+            model="gpt-4",
+            choices=[SimpleNamespace(delta=delta)],
+            usage=None,
+            type=None,
+            text=None,
+        )
+    if usage is not None:
+        yield SimpleNamespace(
+            model="gpt-4", choices=[], usage=usage, type=None, text=None
+        )
+
+
+def test_stream_wrapper_counts_completion_tokens_incrementally():
+    encoding = get_tiktoken_encoding("cl100k_base")
+    pieces = ["Spans", " are", " cheap", "."]
+    stream = StreamWrapper(_content_chunks(*pieces), MagicMock(), prompt_tokens=1)
+
+    next(stream)
+    assert stream.accumulator.counted_tokens == len(encoding.encode(pieces[0]))
+
+    list(stream)
+    assert stream.completion_tokens == sum(
+        len(encoding.encode(piece)) for piece in pieces
+    )
+
+
+def test_stream_wrapper_skips_counting_when_usage_requested():
+    usage = SimpleNamespace(prompt_tokens=5, completion_tokens=9)
+    stream = StreamWrapper(
+        _content_chunks("a", "b", usage=usage),
+        MagicMock(),
+        usage_requested=True,
+    )
+
+    list(stream)
+    assert stream.accumulator.counted_tokens == 0
+    assert stream.completion_tokens == 9
+    assert stream.prompt_tokens == 5
+
+
+def test_completion_accumulator_prefers_reported_usage():
+    accumulator = CompletionAccumulator()
+    accumulator.set_model("gpt-4")
+    accumulator.append("Hello")
+    accumulator.append(" world")
+    accumulator.append("")
+
+    encoding = get_tiktoken_encoding("cl100k_base")
+    assert accumulator.content == ["Hello", " world"]
+    assert accumulator.text == "Hello world"
+    assert accumulator.completion_tokens == len(encoding.encode("Hello")) + len(
+        encoding.encode(" world")
+    )
+
+    accumulator.set_usage(prompt_tokens=3, completion_tokens=7)
+    assert (accumulator.prompt_tokens, accumulator.completion_tokens) == (3, 7)
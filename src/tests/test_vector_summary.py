@@ -0,0 +1,68 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from langtrace_python_sdk.instrumentation.chroma.patch import collection_patch
+from langtrace_python_sdk.utils.vector_summary import (
+    get_vector_attributes,
+    summarize_request,
+)
+
+
+def test_summarize_request_replaces_vectors_and_batches():
+    request = {
+        "ids": ["a", "b"],
+        "embeddings": [[0.1] * 1536, [0.2] * 1536],
+        "query": {"vector": [1.0] * 768, "top_k": 5},
+        "documents": ["first", "second"],
+    }
+
+    summary = summarize_request(request)
+    assert summary["ids"] == ["a", "b"]
+    assert summary["documents"] == ["first", "second"]
+    assert summary["embeddings"] == {"count": 2, "dimensions": 1536}
+    assert summary["query"] == {"vector": {"count": 1, "dimensions": 768}, "top_k": 5}
+    json.dumps(summary)
+
+
+def test_summarize_request_reads_numpy_arrays_by_shape():
+    np = pytest.importorskip("numpy")
+
+    summary = summarize_request({"query_embeddings": np.ones((3, 768))})
+    assert summary["query_embeddings"] == {"count": 3, "dimensions": 768}
+
+
+def test_norm_statistics_are_opt_in(configure):
+    vectors = [[3.0, 4.0], [6.0, 8.0]]
+    assert get_vector_attributes("db.query.vectors", vectors) == {
+        "db.query.vectors.count": 2,
+        "db.query.vectors.dimensions": 2,
+    }
+
+    configure(vector_norm_stats=True)
+    attributes = get_vector_attributes("db.query.vectors", vectors)
+    assert attributes["db.query.vectors.norm_min"] == 5.0
+    assert attributes["db.query.vectors.norm_max"] == 10.0
+    assert attributes["db.query.vectors.norm_mean"] == 7.5
+
+
+def test_chroma_query_attribute_has_no_raw_embeddings():
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_as_current_span.return_value.__enter__.return_value = span
+    embeddings = [[0.123456789] * 384 for _ in range(100)]
+
+    collection_patch("ADD", "1.0", tracer)(
+        lambda **kwargs: None,
+        SimpleNamespace(name="docs"),
+        [],
+        {"ids": [str(i) for i in range(100)], "embeddings": embeddings},
+    )
+    attributes = {
+        call.args[0]: call.args[1] for call in span.set_attribute.call_args_list
+    }
+    query = json.loads(attributes["db.query"])
+    assert query["embeddings"] == {"count": 100, "dimensions": 384}
+    assert "0.123456789" not in attributes["db.query"]